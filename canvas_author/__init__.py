@@ -6,71 +6,85 @@ Uses pandoc for markdown <-> HTML conversion and supports two-way sync with loca
 
 __version__ = "0.1.2"
 
-from canvas_common import get_canvas_client, CanvasClient
-from .pandoc import markdown_to_html, html_to_markdown
-from canvas_common import (
-    CanvasMCPError,
-    ConfigurationError,
-    AuthenticationError,
-    ResourceNotFoundError,
-    APIError,
-    RateLimitError,
-    ValidationError,
-    PandocError,
-    SyncError,
-    FileOperationError,
-)
-from .styling import (
-    inline_styles,
-    inline_styles_from_file,
-    add_callout_box,
-    add_styled_table,
-    get_preset_names,
-    get_preset_css,
-)
-from .quiz_format import (
-    parse_quiz_markdown,
-    generate_quiz_markdown,
-    Question,
-    Answer,
-)
-from .quiz_sync import (
-    pull_quizzes,
-    push_quizzes,
-    quiz_sync_status,
-)
-from .assignment_groups import (
-    list_assignment_groups,
-    get_assignment_group,
-)
-from .discussion_sync import (
-    pull_discussions,
-    push_discussions,
-)
-from .announcement_sync import (
-    pull_announcements,
-    push_announcements,
-)
-from .submission_sync import (
-    pull_submissions,
-    submission_status,
-    get_all_submissions_hierarchical,
-)
-from .workflow import (
-    WorkflowManager,
-    WorktreeReviewSession,
-    ItemReview,
-    ReviewPass,
-    create_agent_worktree,
-)
-from .tool_access import (
-    get_agent_context,
-    get_allowed_tools,
-    require_agent_role,
-    require_scope,
-    check_tool_access,
-    ToolAccessError,
-)
+import importlib
+
+# Public names and the module each is imported from. Submodules are imported
+# on first attribute access (PEP 562), so importing the package, or one of
+# its submodules, does not pull in the whole MCP surface.
+_LAZY_IMPORTS = {
+    # Client
+    "get_canvas_client": "canvas_common",
+    "CanvasClient": "canvas_common",
+    # Pandoc
+    "markdown_to_html": ".pandoc",
+    "html_to_markdown": ".pandoc",
+    # Exceptions
+    "CanvasMCPError": "canvas_common",
+    "ConfigurationError": "canvas_common",
+    "AuthenticationError": "canvas_common",
+    "ResourceNotFoundError": "canvas_common",
+    "APIError": "canvas_common",
+    "RateLimitError": "canvas_common",
+    "ValidationError": "canvas_common",
+    "PandocError": "canvas_common",
+    "SyncError": "canvas_common",
+    "FileOperationError": "canvas_common",
+    # Styling
+    "inline_styles": ".styling",
+    "inline_styles_from_file": ".styling",
+    "add_callout_box": ".styling",
+    "add_styled_table": ".styling",
+    "get_preset_names": ".styling",
+    "get_preset_css": ".styling",
+    # Quiz
+    "parse_quiz_markdown": ".quiz_format",
+    "generate_quiz_markdown": ".quiz_format",
+    "Question": ".quiz_format",
+    "Answer": ".quiz_format",
+    "pull_quizzes": ".quiz_sync",
+    "push_quizzes": ".quiz_sync",
+    "quiz_sync_status": ".quiz_sync",
+    # Assignment Groups
+    "list_assignment_groups": ".assignment_groups",
+    "get_assignment_group": ".assignment_groups",
+    # Discussion Sync
+    "pull_discussions": ".discussion_sync",
+    "push_discussions": ".discussion_sync",
+    # Announcement Sync
+    "pull_announcements": ".announcement_sync",
+    "push_announcements": ".announcement_sync",
+    # Submission Sync
+    "pull_submissions": ".submission_sync",
+    "submission_status": ".submission_sync",
+    "get_all_submissions_hierarchical": ".submission_sync",
+    # Workflow
+    "WorkflowManager": ".workflow",
+    "WorktreeReviewSession": ".workflow",
+    "ItemReview": ".workflow",
+    "ReviewPass": ".workflow",
+    "create_agent_worktree": ".workflow",
+    # Tool Access Control
+    "get_agent_context": ".tool_access",
+    "get_allowed_tools": ".tool_access",
+    "require_agent_role": ".tool_access",
+    "require_scope": ".tool_access",
+    "check_tool_access": ".tool_access",
+    "ToolAccessError": ".tool_access",
+}
+
+
+def __getattr__(name):
+    module_name = _LAZY_IMPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    globals()[name] = value  # Cache so later lookups skip __getattr__
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
+
 
 __all__ = [
     # Client
@@ -5,22 +5,74 @@ Two-way sync between Canvas announcements and local markdown files.
 Announcements are discussion topics with is_announcement=true.
 """
 
+import os
 import re
+import json
+import hashlib
 import logging
+from concurrent.futures import Future, ThreadPoolExecutor, as_completed
+from functools import lru_cache
 from pathlib import Path
 from typing import Dict, Any, List, Optional
-from datetime import datetime
 
 from canvas_common import get_canvas_client, CanvasClient, sanitize_filename as sanitize_filename_common
 from .discussions import create_discussion, update_discussion
-from .pandoc import html_to_markdown, markdown_to_html, is_pandoc_available
+from .pandoc import html_to_markdown, markdown_to_html, is_pandoc_available, trivial_html_to_markdown
 from .datetime_utils import convert_to_iso8601, convert_from_iso8601
+from .yaml_utils import load_frontmatter_yaml
+from .cache_utils import load_json_cache, save_json_cache
+from .file_utils import write_bytes_atomic
 
 logger = logging.getLogger("canvas_author.announcement_sync")
 
+# Pandoc runs as a subprocess, so threads are enough to overlap conversions
+PANDOC_WORKERS = min(32, (os.cpu_count() or 1) * 4)
 
-# Use canvas_common.sanitize_filename instead of local implementation
-sanitize_filename = sanitize_filename_common
+# Concurrent file writes during pull
+WRITE_WORKERS = 8
+
+# Concurrent Canvas requests during push; kept low to stay under the rate limit
+CANVAS_WORKERS = 8
+
+# Canvas caps per_page at 100
+ANNOUNCEMENTS_PER_PAGE = 100
+
+# Sidecar file (inside the announcements folder) recording what was last pulled
+PULL_CACHE_FILE = ".announcement_cache.json"
+
+
+# Use canvas_common.sanitize_filename instead of local implementation. It runs
+# two regex passes per call, so cache results for titles seen on earlier pulls.
+sanitize_filename = lru_cache(maxsize=1024)(sanitize_filename_common)
+
+
+# Opening --- up to the first line starting with ---
+_FRONTMATTER_RE = re.compile(r"---(.*?)\n---", re.DOTALL)
+
+# {name} placeholders in announcement templates
+_TEMPLATE_VAR_RE = re.compile(r"\{([^{}\n]+)\}")
+
+# Local "YYYY-MM-DD HH:MM:SS" form used in frontmatter (see convert_from_iso8601)
+_LOCAL_DATETIME_RE = re.compile(r"\d{4}-\d{2}-\d{2} \d{2}:\d{2}:\d{2}")
+
+_FRONTMATTER_TEMPLATE = (
+    "---\n"
+    "{id_line}"
+    "title: {title}\n"
+    "{posted_at_line}"
+    "delayed_post_at: {delayed_post_at}\n"
+    "published: {published}\n"
+    "---\n"
+)
+
+
+def _to_local_datetime(value: Optional[str]) -> Optional[str]:
+    """Convert a Canvas timestamp to the local frontmatter format, skipping values already in it."""
+    if not value:
+        return None
+    if _LOCAL_DATETIME_RE.fullmatch(value):
+        return value
+    return convert_from_iso8601(value)
 
 
 def create_announcement_frontmatter(announcement: Dict[str, Any]) -> str:
@@ -32,32 +84,17 @@ def create_announcement_frontmatter(announcement: Dict[str, Any]) -> str:
     Returns:
         YAML frontmatter string
     """
-    lines = ["---"]
-
-    if announcement.get('id'):
-        lines.append(f"announcement_id: {announcement['id']}")
-
-    lines.append(f"title: {announcement.get('title', 'Untitled')}")
-
-    if announcement.get('posted_at'):
-        posted_at = convert_from_iso8601(announcement['posted_at'])
-        if posted_at:
-            lines.append(f"posted_at: \"{posted_at}\"")
-
-    if announcement.get('delayed_post_at'):
-        delayed_post_at = convert_from_iso8601(announcement['delayed_post_at'])
-        if delayed_post_at:
-            lines.append(f"delayed_post_at: \"{delayed_post_at}\"")
-        else:
-            lines.append("delayed_post_at: null")
-    else:
-        lines.append("delayed_post_at: null")
-
-    lines.append(f"published: {str(announcement.get('published', True)).lower()}")
-
-    lines.append("---")
-    lines.append("")
-    return "\n".join(lines)
+    announcement_id = announcement.get('id')
+    posted_at = _to_local_datetime(announcement.get('posted_at'))
+    delayed_post_at = _to_local_datetime(announcement.get('delayed_post_at'))
+
+    return _FRONTMATTER_TEMPLATE.format(
+        id_line=f"announcement_id: {announcement_id}\n" if announcement_id else "",
+        title=announcement.get('title', 'Untitled'),
+        posted_at_line=f"posted_at: \"{posted_at}\"\n" if posted_at else "",
+        delayed_post_at=f"\"{delayed_post_at}\"" if delayed_post_at else "null",
+        published="true" if announcement.get('published', True) else "false",
+    )
 
 
 def parse_announcement_frontmatter(content: str) -> tuple[Dict[str, Any], str]:
@@ -66,17 +103,23 @@ def parse_announcement_frontmatter(content: str) -> tuple[Dict[str, Any], str]:
     Returns:
         Tuple of (metadata dict, body content)
     """
-    if not content.startswith("---"):
+    # One match finds both delimiters
+    match = _FRONTMATTER_RE.match(content)
+    if not match:
         return {}, content
 
-    # Find the closing ---
-    end_idx = content.find("\n---", 3)
-    if end_idx == -1:
-        return {}, content
+    frontmatter = match.group(1)[1:]  # Skip newline after opening ---
+    body = content[match.end():].lstrip("\n")  # Skip closing ---\n
+
+    metadata = load_frontmatter_yaml(frontmatter, _parse_scalar)
+    if metadata is None:
+        metadata = _parse_frontmatter_lines(frontmatter)
+
+    return metadata, body
 
-    frontmatter = content[4:end_idx]  # Skip initial ---\n
-    body = content[end_idx + 4:].lstrip("\n")  # Skip closing ---\n
 
+def _parse_frontmatter_lines(frontmatter: str) -> Dict[str, Any]:
+    """Parse frontmatter line by line, for blocks that are not valid YAML."""
     metadata = {}
 
     for line in frontmatter.split("\n"):
@@ -94,19 +137,46 @@ def parse_announcement_frontmatter(content: str) -> tuple[Dict[str, Any], str]:
         elif value.startswith("'") and value.endswith("'"):
             value = value[1:-1]
 
-        # Handle special values
-        if value.lower() == "true":
-            value = True
-        elif value.lower() == "false":
-            value = False
-        elif value.lower() == "null" or value == "":
-            value = None
-        elif value.isdigit():
-            value = int(value)
+        metadata[key] = _parse_scalar(value)
 
-        metadata[key] = value
+    return metadata
+
+
+def _parse_scalar(value: str) -> Any:
+    """Convert a frontmatter value to a bool, None, int or str."""
+    lowered = value.lower()
+    if lowered == "true":
+        return True
+    if lowered == "false":
+        return False
+    if lowered == "null" or value == "":
+        return None
+    if value.isdigit():
+        return int(value)
+    return value
+
+
+@lru_cache(maxsize=1024)
+def _parse_announcement_file_cached(path: str, mtime_ns: int, size: int) -> tuple[Dict[str, Any], str]:
+    """Parse an announcement file; cached on (path, mtime, size) so unchanged files are parsed once."""
+    content = Path(path).read_text(encoding="utf-8")
+    return parse_announcement_frontmatter(content)
+
+
+def _parse_announcement_file(file_path: Path) -> tuple[Dict[str, Any], str]:
+    """Read and parse an announcement file, reusing the cached result when unchanged."""
+    stat = file_path.stat()
+    metadata, body = _parse_announcement_file_cached(str(file_path), stat.st_mtime_ns, stat.st_size)
+    return dict(metadata), body
 
-    return metadata, body
+
+def _date_prefix(timestamp: Any) -> str:
+    """Return the YYYY-MM-DD prefix of an ISO 8601 timestamp, or 'undated'."""
+    value = str(timestamp) if timestamp else ""
+    prefix = value[:10]
+    if len(prefix) == 10 and prefix[4] == "-" and prefix[7] == "-" and prefix.replace("-", "").isdigit():
+        return prefix
+    return "undated"
 
 
 def pull_announcements(
@@ -136,14 +206,23 @@ def pull_announcements(
     canvas = client or get_canvas_client()
     course = canvas.get_course(course_id)
 
-    # Get announcements (these are discussion topics with is_announcement=true)
-    announcements = course.get_discussion_topics(only_announcements=True)
+    # Get announcements (these are discussion topics with is_announcement=true).
+    # The list is paginated lazily; sizing pages to the limit means the loop
+    # below usually stops within the first page instead of fetching many small ones.
+    announcements = course.get_discussion_topics(
+        only_announcements=True,
+        per_page=max(1, min(limit, ANNOUNCEMENTS_PER_PAGE)),
+    )
 
     results = {"pulled": [], "skipped": [], "errors": []}
-    count = 0
+    pending = []
+    claimed = set()
+    duplicates = set()
+    unchanged = 0
+    cache = load_json_cache(output_path / PULL_CACHE_FILE)
 
     for announcement in announcements:
-        if count >= limit:
+        if len(pending) + unchanged >= limit:
             break
 
         try:
@@ -151,21 +230,17 @@ def pull_announcements(
             title = announcement.title
             posted_at = getattr(announcement, 'posted_at', None)
 
-            # Create filename with date prefix for sorting
-            if posted_at:
-                try:
-                    date_obj = datetime.fromisoformat(str(posted_at).replace('Z', '+00:00'))
-                    date_prefix = date_obj.strftime("%Y-%m-%d")
-                except:
-                    date_prefix = "undated"
-            else:
-                date_prefix = "undated"
+            # Create filename with date prefix for sorting. Canvas timestamps
+            # are ISO 8601, so the date is the first ten characters.
+            date_prefix = _date_prefix(posted_at)
 
             filename = f"{date_prefix}-{sanitize_filename(title)}.announcement.md"
             file_path = output_path / filename
 
-            # Skip if exists and not overwriting
-            if file_path.exists() and not overwrite:
+            # Skip if exists and not overwriting; a file claimed earlier in
+            # this pull counts as existing, just as it would once written
+            file_exists = file_path.exists()
+            if not overwrite and (file_path in claimed or file_exists):
                 results["skipped"].append({
                     "id": announcement_id,
                     "title": title,
@@ -182,27 +257,30 @@ def pull_announcements(
                 'published': getattr(announcement, 'published', True),
             }
 
-            # Convert message to markdown
             message = getattr(announcement, 'message', '') or ''
-            if message and is_pandoc_available():
-                message_md = html_to_markdown(message)
-            else:
-                message_md = message
-
-            # Build file content
-            content = create_announcement_frontmatter(announcement_data)
-            content += message_md
 
-            # Write file
-            file_path.write_text(content, encoding="utf-8")
-            results["pulled"].append({
-                "id": announcement_id,
-                "title": title,
-                "file": str(file_path)
-            })
-            logger.info(f"Pulled announcement '{title}' to {file_path}")
+            # Skip conversion and write if nothing changed on Canvas or locally
+            # since the last pull
+            fingerprint = {
+                "file": filename,
+                "updated_at": str(getattr(announcement, 'updated_at', '') or ''),
+                "hash": hashlib.sha256(json.dumps([announcement_data, message]).encode("utf-8")).hexdigest(),
+            }
+            cached = cache.get(announcement_id)
+            if (file_exists and file_path not in claimed and cached
+                    and cached == dict(fingerprint, mtime_ns=file_path.stat().st_mtime_ns)):
+                results["skipped"].append({
+                    "id": announcement_id,
+                    "title": title,
+                    "reason": "unchanged"
+                })
+                unchanged += 1
+                continue
 
-            count += 1
+            if file_path in claimed:
+                duplicates.add(file_path)
+            claimed.add(file_path)
+            pending.append((announcement_data, file_path, message, fingerprint))
 
         except Exception as e:
             results["errors"].append({
@@ -212,10 +290,175 @@ def pull_announcements(
             })
             logger.error(f"Error pulling announcement: {e}")
 
+    # Convert messages to markdown. Plain-paragraph messages are converted
+    # directly; the rest run through pandoc concurrently (one process each).
+    converted = []
+    if pending:
+        pandoc_ok = is_pandoc_available()
+        with ThreadPoolExecutor(max_workers=min(PANDOC_WORKERS, len(pending))) as executor:
+            for _, _, message, _ in pending:
+                message_md = trivial_html_to_markdown(message) if message else message
+                if message_md is None:
+                    message_md = executor.submit(html_to_markdown, message) if pandoc_ok else message
+                converted.append(message_md)
+
+    writes = []
+    for i, (announcement_data, file_path, message, fingerprint) in enumerate(pending):
+        try:
+            message_md = converted[i]
+            if isinstance(message_md, Future):
+                message_md = message_md.result()
+
+            # Build file content
+            content = create_announcement_frontmatter(announcement_data)
+            content += message_md
+            writes.append((announcement_data, file_path, fingerprint, content))
+
+        except Exception as e:
+            results["errors"].append({
+                "id": announcement_data['id'],
+                "title": announcement_data['title'],
+                "error": str(e)
+            })
+            logger.error(f"Error pulling announcement: {e}")
+
+    # Write files concurrently so writes to slow filesystems (network mounts,
+    # WSL) don't queue up behind each other. Announcements sharing a file
+    # (same date and title) are written afterwards in order, so the last wins
+    if writes:
+        with ThreadPoolExecutor(max_workers=min(WRITE_WORKERS, len(writes))) as executor:
+            futures = [
+                None if file_path in duplicates
+                else executor.submit(write_bytes_atomic, file_path, content.encode("utf-8"))
+                for _, file_path, _, content in writes
+            ]
+
+        for (announcement_data, file_path, fingerprint, content), future in zip(writes, futures):
+            try:
+                if future is None:
+                    write_bytes_atomic(file_path, content.encode("utf-8"))
+                else:
+                    future.result()
+                cache[announcement_data['id']] = dict(fingerprint, mtime_ns=file_path.stat().st_mtime_ns)
+                results["pulled"].append({
+                    "id": announcement_data['id'],
+                    "title": announcement_data['title'],
+                    "file": str(file_path)
+                })
+                logger.info(f"Pulled announcement '{announcement_data['title']}' to {file_path}")
+
+            except Exception as e:
+                results["errors"].append({
+                    "id": announcement_data['id'],
+                    "title": announcement_data['title'],
+                    "error": str(e)
+                })
+                logger.error(f"Error pulling announcement: {e}")
+
+    if results["pulled"]:
+        try:
+            save_json_cache(output_path / PULL_CACHE_FILE, cache)
+        except OSError as e:
+            logger.warning(f"Could not save announcement pull cache: {e}")
+
     logger.info(f"Pull complete: {len(results['pulled'])} pulled, {len(results['skipped'])} skipped, {len(results['errors'])} errors")
     return results
 
 
+def _prepare_announcement(
+    file_path: Path,
+    create_missing: bool,
+    update_existing: bool,
+    pandoc_ok: bool
+) -> tuple[Optional[str], Dict[str, Any], str, str]:
+    """Read an announcement file and convert its body to HTML for pushing.
+
+    Returns:
+        Tuple of (skip reason or None, metadata, title, message HTML)
+    """
+    metadata, body = _parse_announcement_file(file_path)
+
+    title = metadata.get("title", file_path.stem)
+    announcement_id = metadata.get("announcement_id")
+
+    if announcement_id and not update_existing:
+        return "update_existing is false", metadata, title, ""
+
+    if not announcement_id and not create_missing:
+        return "no announcement_id and create_missing is false", metadata, title, ""
+
+    # Convert markdown body to HTML
+    if body and pandoc_ok:
+        message_html = markdown_to_html(body)
+    else:
+        message_html = body
+
+    return None, metadata, title, message_html
+
+
+def _send_announcement(
+    course_id: str,
+    file_path: Path,
+    metadata: Dict[str, Any],
+    title: str,
+    message_html: str,
+    canvas: CanvasClient
+) -> tuple[str, Dict[str, Any]]:
+    """Create or update a single announcement on Canvas.
+
+    Returns:
+        Tuple of (result key, result entry)
+    """
+    announcement_id = metadata.get("announcement_id")
+
+    if announcement_id:
+        update_params = {
+            'title': title if 'title' in metadata else None,
+            'message': message_html,
+            'published': metadata.get('published'),
+        }
+
+        # Remove None values
+        update_params = {k: v for k, v in update_params.items() if v is not None}
+
+        update_discussion(
+            course_id,
+            announcement_id,
+            client=canvas,
+            **update_params
+        )
+
+        logger.info(f"Updated announcement '{title}' from {file_path.name}")
+        return "updated", {
+            "id": announcement_id,
+            "title": title,
+            "file": str(file_path)
+        }
+
+    # Get scheduled post time if provided
+    delayed_post_at = None
+    if metadata.get('delayed_post_at'):
+        delayed_post_at = convert_to_iso8601(metadata['delayed_post_at'], use_utc=True)
+
+    new_announcement = create_discussion(
+        course_id,
+        title=title,
+        message=message_html,
+        published=metadata.get('published', False),
+        is_announcement=True,
+        delayed_post_at=delayed_post_at,
+        client=canvas
+    )
+
+    logger.info(f"Created announcement '{title}' from {file_path.name}")
+    return "created", {
+        "id": new_announcement['id'],
+        "title": title,
+        "file": str(file_path),
+        "html_url": new_announcement.get('html_url', '')
+    }
+
+
 def push_announcements(
     course_id: str,
     input_dir: str,
@@ -251,98 +494,71 @@ def push_announcements(
 
     canvas = client or get_canvas_client()
 
-    # Find all .announcement.md files
-    md_files = list(input_path.glob("*.announcement.md"))
-    if not md_files:
-        # Also check for regular .md files
-        md_files = list(input_path.glob("*.md"))
-
-    for file_path in md_files:
-        try:
-            content = file_path.read_text(encoding="utf-8")
-            metadata, body = parse_announcement_frontmatter(content)
+    # Find all .announcement.md files in one directory pass, keeping regular
+    # .md files as a fallback for folders without any
+    announcement_files = []
+    other_md_files = []
+    with os.scandir(input_path) as entries:
+        for entry in entries:
+            if not entry.name.endswith(".md") or not entry.is_file():
+                continue
+            if entry.name.endswith(".announcement.md"):
+                announcement_files.append(Path(entry.path))
+            else:
+                other_md_files.append(Path(entry.path))
+    md_files = announcement_files or other_md_files
 
-            title = metadata.get("title", file_path.stem)
-            announcement_id = metadata.get("announcement_id")
+    if not md_files:
+        return results
 
-            # Convert markdown body to HTML
-            if body and is_pandoc_available():
-                message_html = markdown_to_html(body)
-            else:
-                message_html = body
-
-            if announcement_id:
-                # Announcement exists - update if allowed
-                if not update_existing:
-                    results["skipped"].append({
-                        "file": str(file_path),
-                        "reason": "update_existing is false"
-                    })
-                    continue
-
-                # Update announcement
-                update_params = {
-                    'title': title if 'title' in metadata else None,
-                    'message': message_html,
-                    'published': metadata.get('published'),
-                }
-
-                # Remove None values
-                update_params = {k: v for k, v in update_params.items() if v is not None}
-
-                update_discussion(
-                    course_id,
-                    announcement_id,
-                    client=canvas,
-                    **update_params
-                )
-
-                results["updated"].append({
-                    "id": announcement_id,
-                    "title": title,
-                    "file": str(file_path)
+    pandoc_ok = is_pandoc_available()
+
+    # Two-stage pipeline: files are read, parsed and converted in one pool, and
+    # each is handed to the Canvas pool as soon as it is ready, so pandoc work
+    # overlaps with Canvas round-trips
+    sends = []
+    with ThreadPoolExecutor(max_workers=min(PANDOC_WORKERS, len(md_files))) as prepare_pool, \
+            ThreadPoolExecutor(max_workers=min(CANVAS_WORKERS, len(md_files))) as canvas_pool:
+        prepared = {
+            prepare_pool.submit(
+                _prepare_announcement, file_path, create_missing, update_existing, pandoc_ok
+            ): file_path
+            for file_path in md_files
+        }
+
+        for future in as_completed(prepared):
+            file_path = prepared[future]
+            try:
+                skip_reason, metadata, title, message_html = future.result()
+            except Exception as e:
+                results["errors"].append({
+                    "file": str(file_path),
+                    "error": str(e)
                 })
-                logger.info(f"Updated announcement '{title}' from {file_path.name}")
+                logger.error(f"Error processing {file_path}: {e}")
+                continue
 
-            else:
-                # Announcement doesn't exist - create if allowed
-                if not create_missing:
-                    results["skipped"].append({
-                        "file": str(file_path),
-                        "reason": "no announcement_id and create_missing is false"
-                    })
-                    continue
-
-                # Get scheduled post time if provided
-                delayed_post_at = None
-                if metadata.get('delayed_post_at'):
-                    delayed_post_at = convert_to_iso8601(metadata['delayed_post_at'], use_utc=True)
-
-                # Create announcement
-                new_announcement = create_discussion(
-                    course_id,
-                    title=title,
-                    message=message_html,
-                    published=metadata.get('published', False),
-                    is_announcement=True,
-                    delayed_post_at=delayed_post_at,
-                    client=canvas
-                )
-
-                results["created"].append({
-                    "id": new_announcement['id'],
-                    "title": title,
+            if skip_reason:
+                results["skipped"].append({
                     "file": str(file_path),
-                    "html_url": new_announcement.get('html_url', '')
+                    "reason": skip_reason
                 })
-                logger.info(f"Created announcement '{title}' from {file_path.name}")
+                continue
 
-        except Exception as e:
-            results["errors"].append({
-                "file": str(file_path),
-                "error": str(e)
-            })
-            logger.error(f"Error processing {file_path}: {e}")
+            sends.append((file_path, canvas_pool.submit(
+                _send_announcement, course_id, file_path, metadata, title, message_html, canvas
+            )))
+
+        for file_path, future in sends:
+            try:
+                action, entry = future.result()
+                results[action].append(entry)
+            except Exception as e:
+                results["errors"].append({
+                    "file": str(file_path),
+                    "error": str(e)
+                })
+                logger.error(f"Error processing {file_path}: {e}")
 
     logger.info(f"Push complete: {len(results['created'])} created, {len(results['updated'])} updated, {len(results['skipped'])} skipped, {len(results['errors'])} errors")
     return results
@@ -388,11 +604,12 @@ def create_announcement_from_template(
     # Read template
     template_content = template_path.read_text(encoding="utf-8")
 
-    # Substitute variables
+    # Substitute variables in a single pass; unknown placeholders are left as-is
     if variables:
-        for key, value in variables.items():
-            placeholder = f"{{{key}}}"
-            template_content = template_content.replace(placeholder, value)
+        template_content = _TEMPLATE_VAR_RE.sub(
+            lambda m: str(variables.get(m.group(1), m.group(0))),
+            template_content
+        )
 
     # Parse frontmatter if present
     metadata, body = parse_announcement_frontmatter(template_content)
@@ -19,9 +19,19 @@ ASSIGNMENT_GROUP_FIELDS = [
 ]
 
 
+def _group_to_dict(group: Any, include: Optional[List[str]] = None) -> Dict[str, Any]:
+    """Project a canvasapi AssignmentGroup onto ASSIGNMENT_GROUP_FIELDS plus any included data."""
+    attrs = vars(group)
+    fields = ASSIGNMENT_GROUP_FIELDS + list(include) if include else ASSIGNMENT_GROUP_FIELDS
+    result = {"id": str(group.id)}
+    result.update({field: attrs[field] for field in fields if field in attrs})
+    return result
+
+
 def list_assignment_groups(
     course_id: str,
-    client: Optional[CanvasClient] = None
+    client: Optional[CanvasClient] = None,
+    include: Optional[List[str]] = None
 ) -> List[Dict[str, Any]]:
     """
     List all assignment groups in a course.
@@ -29,22 +39,16 @@ def list_assignment_groups(
     Args:
         course_id: Canvas course ID
         client: Optional CanvasClient instance
+        include: Extra data Canvas should embed in the listing, e.g. ['assignments'].
+            Fetched in the same paginated request instead of one request per group.
 
     Returns:
         List of assignment group dicts
     """
     canvas = client or get_canvas_client()
     course = canvas.get_course(course_id)
-    assignment_groups = list(course.get_assignment_groups())
-
-    result = []
-    for group in assignment_groups:
-        group_data = {"id": str(group.id)}
-        for field in ASSIGNMENT_GROUP_FIELDS:
-            if hasattr(group, field):
-                value = getattr(group, field)
-                group_data[field] = value
-        result.append(group_data)
+    groups = course.get_assignment_groups(include=include) if include else course.get_assignment_groups()
+    result = [_group_to_dict(group, include) for group in groups]
 
     logger.info(f"Listed {len(result)} assignment groups for course {course_id}")
     return result
@@ -53,7 +57,8 @@ def list_assignment_groups(
 def get_assignment_group(
     course_id: str,
     group_id: str,
-    client: Optional[CanvasClient] = None
+    client: Optional[CanvasClient] = None,
+    include: Optional[List[str]] = None
 ) -> Dict[str, Any]:
     """
     Get details for a specific assignment group.
@@ -62,6 +67,7 @@ def get_assignment_group(
         course_id: Canvas course ID
         group_id: Canvas assignment group ID
         client: Optional CanvasClient instance
+        include: Extra data Canvas should embed in the response, e.g. ['assignments']
 
     Returns:
         Assignment group data dict
@@ -70,15 +76,14 @@ def get_assignment_group(
     course = canvas.get_course(course_id)
 
     try:
-        group = course.get_assignment_group(group_id)
+        if include:
+            group = course.get_assignment_group(group_id, include=include)
+        else:
+            group = course.get_assignment_group(group_id)
     except ResourceDoesNotExist:
         raise ResourceNotFoundError("assignment_group", group_id)
 
-    result = {"id": str(group.id)}
-    for field in ASSIGNMENT_GROUP_FIELDS:
-        if hasattr(group, field):
-            value = getattr(group, field)
-            result[field] = value
+    result = _group_to_dict(group, include)
 
     logger.info(f"Retrieved assignment group {group_id} from course {course_id}")
     return result
@@ -4,21 +4,126 @@ Assignment Sync Module
 Two-way sync between Canvas assignments and local markdown files.
 """
 
+import os
 import re
+import time
+import hashlib
+import io
 import logging
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from pathlib import Path
 from typing import Dict, Any, List, Optional
 
+from canvasapi.exceptions import RateLimitExceeded
+
 from canvas_common import get_canvas_client, CanvasClient, sanitize_filename as sanitize_filename_common
-from .assignments import list_assignments, get_assignment
-from .pandoc import html_to_markdown, markdown_to_html, is_pandoc_available
+from .assignments import list_assignments, get_assignment, invalidate_assignment_cache
+from .pandoc import (
+    html_to_markdown,
+    markdown_to_html,
+    is_pandoc_available,
+    trivial_html_to_markdown,
+    trivial_markdown_to_html,
+)
 from .datetime_utils import convert_to_iso8601, convert_from_iso8601, convert_to_datetime
+from .yaml_utils import load_frontmatter_yaml
+from .cache_utils import load_json_cache, save_json_cache
+from .file_utils import write_bytes_atomic, write_chunks_atomic
 
 logger = logging.getLogger("canvas_author.assignment_sync")
 
+# Pandoc runs as a subprocess, so threads are enough to overlap conversions
+PANDOC_WORKERS = min(32, (os.cpu_count() or 1) * 4)
+
+# Concurrent Canvas requests during push; kept low to stay under the rate limit
+CANVAS_WORKERS = 8
+
+# Retries for a Canvas call rejected by the rate limit; the wait starts at
+# RATE_LIMIT_BACKOFF seconds and doubles each time
+RATE_LIMIT_RETRIES = 3
+RATE_LIMIT_BACKOFF = 1.0
+
+# Bytes read when only the frontmatter is needed; longer blocks read the rest
+FRONTMATTER_READ_SIZE = 8192
+
+# Sidecar file (inside the assignments folder) recording each file's
+# assignment_id and title, so status checks skip unchanged files across runs
+STATUS_CACHE_FILE = ".assignment_cache.json"
+
+# Sidecar file recording the course pushed to and a hash of each file as
+# last pushed, so pushes to the same course skip files that have not changed since
+PUSH_CACHE_FILE = ".assignment_push_cache.json"
+
+
+# Use canvas_common.sanitize_filename instead of local implementation. It runs
+# two regex passes per call, so cache results for names seen on earlier pulls.
+sanitize_filename = lru_cache(maxsize=1024)(sanitize_filename_common)
+
+# Fallback frontmatter parser: one line is an optional "  - " list marker or
+# four-space override indent, then "key: value" or a bare list item
+_FRONTMATTER_LINE_RE = re.compile(r'(  - |    )?([^:]*)(?::(.*))?', re.DOTALL)
+_NUMBER_RE = re.compile(r'-?\d+(?:\.\d+)?')
+_INT_RE = re.compile(r'-?\d+')
+_SCALAR_KEYWORDS = {"true": True, "false": False, "null": None}
+
+# Lines in a frontmatter block that hold an assignment_id or title
+_ASSIGNMENT_ID_LINE_RE = re.compile(r'^assignment_id:.*$', re.MULTILINE)
+_TITLE_LINE_RE = re.compile(r'^title:.*\n', re.MULTILINE)
+
+# assignment_id and title lines whose values any parser reads the same way:
+# a plain integer, and text starting with a letter without YAML syntax
+_PLAIN_ID_RE = re.compile(r'^assignment_id: *([1-9]\d*) *$', re.MULTILINE)
+_PLAIN_TITLE_RE = re.compile(r'^title: *([^\W\d_][\w ,.()/-]*?) *$', re.MULTILINE)
+# Words YAML reads as booleans or null rather than text
+_YAML_KEYWORDS = frozenset({"yes", "no", "on", "off", "true", "false", "null"})
+
+
+_FRONTMATTER_TEMPLATE = (
+    "---\n"
+    "title: {title}\n"
+    "{id_lines}"
+    "points_possible: {points_possible}\n"
+    "{date_lines}"
+    "{list_lines}"
+    "grading_type: {grading_type}\n"
+    "published: {published}\n"
+    "{override_lines}"
+    "---\n"
+)
 
-# Use canvas_common.sanitize_filename instead of local implementation
-sanitize_filename = sanitize_filename_common
+_DATE_FIELDS = ("due_at", "unlock_at", "lock_at")
+# Frontmatter fields written as YAML lists
+_LIST_FIELDS = ("submission_types", "allowed_extensions")
+# Frontmatter fields sent to Canvas unchanged when updating an assignment
+_UPDATE_FIELDS = ("points_possible", "grading_type", "published") + _LIST_FIELDS
+
+
+def _date_lines(data: Dict[str, Any], indent: str = "") -> str:
+    """Render due/unlock/lock dates, converted from ISO 8601 to the simple local format."""
+    values = ((field, convert_from_iso8601(data[field])) for field in _DATE_FIELDS if data.get(field))
+    return "".join(f"{indent}{field}: \"{value}\"\n" for field, value in values if value)
+
+
+def _override_lines(overrides: List[Dict[str, Any]]) -> str:
+    """Render assignment overrides for differentiated assignments."""
+    parts = ["assignment_overrides:\n"]
+    for override in overrides:
+        parts.append(f"  - id: {override.get('id', '')}\n")
+
+        # Student IDs or section ID
+        if override.get('student_ids'):
+            student_ids_str = ", ".join(str(sid) for sid in override['student_ids'])
+            parts.append(f"    student_ids: [{student_ids_str}]\n")
+        elif override.get('course_section_id'):
+            parts.append(f"    course_section_id: {override['course_section_id']}\n")
+
+        # Title (optional, for documentation)
+        if override.get('title'):
+            parts.append(f"    title: \"{override['title']}\"\n")
+
+        parts.append(_date_lines(override, "    "))
+    return "".join(parts)
 
 
 def create_assignment_frontmatter(
@@ -26,87 +131,35 @@ def create_assignment_frontmatter(
     course_id: str,
 ) -> str:
     """Create YAML frontmatter for an assignment file."""
-    lines = ["---"]
-    lines.append(f"title: {assignment.get('name', 'Untitled')}")
-
+    id_lines = ""
     if assignment.get('id'):
-        lines.append(f"assignment_id: {assignment['id']}")
-
+        id_lines += f"assignment_id: {assignment['id']}\n"
     if assignment.get('assignment_group_id'):
-        lines.append(f"assignment_group_id: {assignment['assignment_group_id']}")
-
-    lines.append(f"points_possible: {assignment.get('points_possible', 0)}")
-
-    # Convert datetime fields from ISO 8601 to simple format
-    if assignment.get('due_at'):
-        due_at = convert_from_iso8601(assignment['due_at'])
-        if due_at:
-            lines.append(f"due_at: \"{due_at}\"")
-    if assignment.get('unlock_at'):
-        unlock_at = convert_from_iso8601(assignment['unlock_at'])
-        if unlock_at:
-            lines.append(f"unlock_at: \"{unlock_at}\"")
-    if assignment.get('lock_at'):
-        lock_at = convert_from_iso8601(assignment['lock_at'])
-        if lock_at:
-            lines.append(f"lock_at: \"{lock_at}\"")
-
-    # Submission types as a list
-    submission_types = assignment.get('submission_types', [])
-    if submission_types:
-        lines.append("submission_types:")
-        for st in submission_types:
-            lines.append(f"  - {st}")
-
-    # Allowed extensions (for online_upload submissions)
-    allowed_extensions = assignment.get('allowed_extensions', [])
-    if allowed_extensions:
-        lines.append("allowed_extensions:")
-        for ext in allowed_extensions:
-            lines.append(f"  - {ext}")
-
-    lines.append(f"grading_type: {assignment.get('grading_type', 'points')}")
-    lines.append(f"published: {str(assignment.get('published', False)).lower()}")
-
-    # Assignment overrides for differentiated assignments
-    if assignment.get('only_visible_to_overrides'):
-        lines.append(f"only_visible_to_overrides: {str(assignment['only_visible_to_overrides']).lower()}")
+        id_lines += f"assignment_group_id: {assignment['assignment_group_id']}\n"
 
-    # Add assignment overrides if present
-    overrides = assignment.get('overrides', [])
-    if overrides:
-        lines.append("assignment_overrides:")
-        for override in overrides:
-            lines.append(f"  - id: {override.get('id', '')}")
-
-            # Student IDs or section ID
-            if override.get('student_ids'):
-                student_ids_str = ", ".join(str(sid) for sid in override['student_ids'])
-                lines.append(f"    student_ids: [{student_ids_str}]")
-            elif override.get('course_section_id'):
-                lines.append(f"    course_section_id: {override['course_section_id']}")
-
-            # Title (optional, for documentation)
-            if override.get('title'):
-                lines.append(f"    title: \"{override['title']}\"")
-
-            # Dates
-            if override.get('due_at'):
-                due_at = convert_from_iso8601(override['due_at'])
-                if due_at:
-                    lines.append(f"    due_at: \"{due_at}\"")
-            if override.get('unlock_at'):
-                unlock_at = convert_from_iso8601(override['unlock_at'])
-                if unlock_at:
-                    lines.append(f"    unlock_at: \"{unlock_at}\"")
-            if override.get('lock_at'):
-                lock_at = convert_from_iso8601(override['lock_at'])
-                if lock_at:
-                    lines.append(f"    lock_at: \"{lock_at}\"")
-
-    lines.append("---")
-    lines.append("")
-    return "\n".join(lines)
+    # Submission types and allowed extensions (for online_upload) as lists
+    list_lines = ""
+    for field in _LIST_FIELDS:
+        items = assignment.get(field, [])
+        if items:
+            list_lines += f"{field}:\n" + "".join(f"  - {item}\n" for item in items)
+
+    override_lines = ""
+    if assignment.get('only_visible_to_overrides'):
+        override_lines += "only_visible_to_overrides: true\n"
+    if assignment.get('overrides'):
+        override_lines += _override_lines(assignment['overrides'])
+
+    return _FRONTMATTER_TEMPLATE.format(
+        title=assignment.get('name', 'Untitled'),
+        id_lines=id_lines,
+        points_possible=assignment.get('points_possible', 0),
+        date_lines=_date_lines(assignment),
+        list_lines=list_lines,
+        grading_type=assignment.get('grading_type', 'points'),
+        published="true" if assignment.get('published') else "false",
+        override_lines=override_lines,
+    )
 
 
 def parse_assignment_frontmatter(content: str) -> tuple[Dict[str, Any], str]:
@@ -126,123 +179,297 @@ def parse_assignment_frontmatter(content: str) -> tuple[Dict[str, Any], str]:
     frontmatter = content[4:end_idx]  # Skip initial ---\n
     body = content[end_idx + 4:].lstrip("\n")  # Skip closing ---\n
 
+    metadata = load_frontmatter_yaml(frontmatter, _parse_scalar)
+    if metadata is None:
+        metadata = _parse_frontmatter_lines(frontmatter)
+
+    return metadata, body
+
+
+def _read_frontmatter_only(file_path: Path) -> str:
+    """Read a markdown file up to the end of its frontmatter block."""
+    with open(file_path, "r", encoding="utf-8") as f:
+        head = f.read(FRONTMATTER_READ_SIZE)
+        if not head.startswith("---"):
+            return ""
+
+        end_idx = head.find("\n---", 3)
+        if end_idx == -1:
+            head += f.read()
+            end_idx = head.find("\n---", 3)
+            if end_idx == -1:
+                return head
+
+    return head[:end_idx + 4]
+
+
+def _decode_text(data: bytes) -> str:
+    """Decode file bytes like Path.read_text, including universal newlines."""
+    return io.StringIO(data.decode("utf-8"), newline=None).read()
+
+
+@lru_cache(maxsize=1024)
+def _parse_assignment_file_cached(path: str, mtime_ns: int, size: int) -> tuple[Dict[str, Any], str, str]:
+    """Parse an assignment file; cached on (path, mtime, size) so unchanged files are parsed once."""
+    data = Path(path).read_bytes()
+    metadata, body = parse_assignment_frontmatter(_decode_text(data))
+    return metadata, body, _hash_bytes(data)
+
+
+def _parse_assignment_file(file_path: Path) -> tuple[Dict[str, Any], str, str]:
+    """
+    Read and parse an assignment file, reusing the cached result when unchanged.
+
+    Returns:
+        Tuple of (metadata dict, body content, hash of the bytes parsed)
+    """
+    stat = file_path.stat()
+    metadata, body, digest = _parse_assignment_file_cached(str(file_path), stat.st_mtime_ns, stat.st_size)
+    return dict(metadata), body, digest
+
+
+def _peek_assignment_id(frontmatter: str) -> Optional[Dict[str, Any]]:
+    """
+    Read assignment_id and title from frontmatter without parsing the rest.
+
+    Returns:
+        Dict with assignment_id and title, or None if either is missing or
+        not plain enough to be sure a full parse would read it the same way
+    """
+    ids = _PLAIN_ID_RE.findall(frontmatter)
+    titles = _PLAIN_TITLE_RE.findall(frontmatter)
+    if len(ids) != 1 or len(titles) != 1 or titles[0].lower() in _YAML_KEYWORDS:
+        return None
+    return {"assignment_id": int(ids[0]), "title": titles[0]}
+
+
+@lru_cache(maxsize=1024)
+def _read_assignment_metadata_cached(path: str, mtime_ns: int, size: int) -> Dict[str, Any]:
+    """Read an assignment file's id and title; cached like _parse_assignment_file_cached."""
+    frontmatter = _read_frontmatter_only(Path(path))
+    metadata = _peek_assignment_id(frontmatter)
+    if metadata is None:
+        metadata, _ = parse_assignment_frontmatter(frontmatter)
+    return metadata
+
+
+def _scan_local_assignments(local_path: Path) -> Dict[Any, Dict[str, Any]]:
+    """
+    Read the assignment_id and title of each assignment file in a directory.
+
+    Files unchanged since the last scan (same mtime and size) are answered
+    from STATUS_CACHE_FILE without being opened.
+
+    Args:
+        local_path: Directory containing assignment markdown files
+
+    Returns:
+        Dict mapping assignment_id to file and name, for files with an assignment_id
+    """
+    cache_path = local_path / STATUS_CACHE_FILE
+    cache = load_json_cache(cache_path)
+    new_cache = {}
+
+    local_by_id = {}
+    with os.scandir(local_path) as entries:
+        for entry in entries:
+            if not entry.name.endswith(".md") or not entry.is_file():
+                continue
+            stat = entry.stat()
+            cached = cache.get(entry.name)
+            if not (cached and cached.get("mtime_ns") == stat.st_mtime_ns and cached.get("size") == stat.st_size):
+                metadata = _read_assignment_metadata_cached(entry.path, stat.st_mtime_ns, stat.st_size)
+                cached = {
+                    "mtime_ns": stat.st_mtime_ns,
+                    "size": stat.st_size,
+                    "assignment_id": metadata.get("assignment_id"),
+                    "title": str(metadata.get("title", Path(entry.name).stem)),
+                }
+            new_cache[entry.name] = cached
+
+            if cached["assignment_id"]:
+                local_by_id[cached["assignment_id"]] = {
+                    "file": entry.path,
+                    "name": cached["title"],
+                }
+
+    if new_cache != cache:
+        try:
+            save_json_cache(cache_path, new_cache)
+        except (OSError, TypeError) as e:
+            logger.debug(f"Could not write {cache_path}: {e}")
+
+    return local_by_id
+
+
+def _hash_bytes(data: bytes) -> str:
+    """Hash file content for the push cache."""
+    return hashlib.blake2b(data, digest_size=16).hexdigest()
+
+
+def _file_hash(file_path: Path) -> str:
+    """Hash a file's bytes for the push cache."""
+    return _hash_bytes(file_path.read_bytes())
+
+
+def _find_assignments_dir(directory: str) -> Optional[Path]:
+    """
+    Find the folder holding assignment files for a course directory.
+
+    Args:
+        directory: Course directory, or the assignments folder itself
+
+    Returns:
+        The directory's assignments subfolder if it has one, else the
+        directory itself, or None if neither exists
+    """
+    path = Path(directory)
+    for candidate in (path / "assignments", path):
+        if candidate.is_dir():
+            return candidate
+    return None
+
+
+def _list_markdown_files(directory: Path) -> List[Path]:
+    """List the .md files in a directory in one scandir pass, largest first.
+
+    Pushing the largest files first keeps one slow conversion from being
+    left running on its own at the end of a concurrent push.
+    """
+    with os.scandir(directory) as entries:
+        md_entries = [entry for entry in entries if entry.name.endswith(".md") and entry.is_file()]
+    md_entries.sort(key=lambda entry: entry.stat().st_size, reverse=True)
+    return [Path(entry.path) for entry in md_entries]
+
+
+def _set_frontmatter_assignment_id(content: str, assignment_id: Any) -> Optional[str]:
+    """
+    Set assignment_id in a file's frontmatter without rewriting anything else.
+
+    Replaces an existing (empty) assignment_id line, or adds one after the
+    title line, or after the opening --- if there is no title.
+
+    Args:
+        content: Full file content
+        assignment_id: New assignment ID
+
+    Returns:
+        Updated content, or None if the file has no frontmatter block
+    """
+    if not content.startswith("---"):
+        return None
+    end_idx = content.find("\n---", 3)
+    if end_idx == -1:
+        return None
+
+    frontmatter, rest = content[:end_idx + 1], content[end_idx + 1:]
+    id_line = f"assignment_id: {assignment_id}"
+
+    frontmatter, replaced = _ASSIGNMENT_ID_LINE_RE.subn(id_line, frontmatter, count=1)
+    if not replaced:
+        title = _TITLE_LINE_RE.search(frontmatter)
+        insert_at = title.end() if title else frontmatter.find("\n") + 1
+        frontmatter = frontmatter[:insert_at] + id_line + "\n" + frontmatter[insert_at:]
+
+    return frontmatter + rest
+
+
+def _parse_scalar(value: str) -> Any:
+    """Convert a frontmatter value to a str, bool, None, int or float."""
+    if len(value) > 1 and value[0] in "\"'" and value[-1] == value[0]:
+        return value[1:-1]
+
+    if _NUMBER_RE.fullmatch(value):
+        return float(value) if "." in value else int(value)
+
+    lowered = value.lower()
+    if lowered in _SCALAR_KEYWORDS:
+        return _SCALAR_KEYWORDS[lowered]
+    return value
+
+
+def _parse_frontmatter_lines(frontmatter: str) -> Dict[str, Any]:
+    """Parse assignment frontmatter line by line, for blocks that are not valid YAML."""
     metadata = {}
     current_key = None
     current_list = None
     current_dict = None
 
     for line in frontmatter.split("\n"):
-        line_stripped = line.rstrip()
-        if not line_stripped:
+        if not line.strip():
             continue
 
-        # Check for nested list item (assignment_overrides)
-        if line.startswith("  - ") and current_key == "assignment_overrides":
-            # New override item
+        prefix, key, value = _FRONTMATTER_LINE_RE.fullmatch(line).groups()
+
+        if prefix == "  - " and current_key == "assignment_overrides":
+            # New override item, optionally with its first field
             if current_dict:
                 current_list.append(current_dict)
             current_dict = {}
-            # Parse the field after -
-            if ":" in line[4:]:
-                key, _, value = line[4:].partition(":")
-                key = key.strip()
-                value = value.strip()
-                if value.startswith('"') and value.endswith('"'):
-                    value = value[1:-1]
-                elif value.lower() == "true":
-                    value = True
-                elif value.lower() == "false":
-                    value = False
-                elif value and value.replace('.', '').replace('-', '').isdigit():
-                    value = float(value) if '.' in value else int(value)
-                current_dict[key] = value
+            if value is not None:
+                current_dict[key.strip()] = _parse_scalar(value.strip())
             continue
 
-        # Check for nested dict field (override properties)
-        if line.startswith("    ") and current_dict is not None:
-            if ":" in line:
-                key, _, value = line[4:].partition(":")
-                key = key.strip()
+        if prefix == "    " and current_dict is not None:
+            # Override field; arrays like student_ids: [1, 2, 3]
+            if value is not None:
                 value = value.strip()
-
-                # Handle arrays like student_ids: [1, 2, 3]
-                if value.startswith('[') and value.endswith(']'):
-                    # Parse array
-                    array_content = value[1:-1].strip()
-                    if array_content:
-                        items = [item.strip() for item in array_content.split(',')]
-                        # Try to convert to int
-                        try:
-                            value = [int(item) for item in items]
-                        except:
-                            value = items
-                    else:
-                        value = []
-                elif value.startswith('"') and value.endswith('"'):
-                    value = value[1:-1]
-                elif value.lower() == "true":
-                    value = True
-                elif value.lower() == "false":
-                    value = False
-                elif value.lower() == "null":
-                    value = None
-                elif value and value.replace('.', '').replace('-', '').isdigit():
-                    value = float(value) if '.' in value else int(value)
-
-                current_dict[key] = value
+                if value.startswith("[") and value.endswith("]"):
+                    items = [item.strip() for item in value[1:-1].split(",")] if value[1:-1].strip() else []
+                    value = [int(item) for item in items] if all(_INT_RE.fullmatch(item) for item in items) else items
+                else:
+                    value = _parse_scalar(value)
+                current_dict[key.strip()] = value
             continue
 
-        # Check for simple list item (submission_types, allowed_extensions)
-        if line.startswith("  - ") and current_key and current_key != "assignment_overrides":
+        if prefix == "  - " and current_key:
+            # Simple list item (submission_types, allowed_extensions)
             if current_list is None:
                 current_list = []
+                metadata[current_key] = current_list
             current_list.append(line[4:])
-            metadata[current_key] = current_list
             continue
 
-        # Check for key: value
-        if ":" in line:
-            # Finish any current dict
+        if value is not None:
+            # Finish any current override
             if current_dict and current_list is not None and current_key == "assignment_overrides":
                 current_list.append(current_dict)
                 current_dict = None
 
-            key, _, value = line.partition(":")
-            key = key.strip()
-            value = value.strip()
-
-            # Remove quotes
-            if value.startswith('"') and value.endswith('"'):
-                value = value[1:-1]
-            elif value.startswith("'") and value.endswith("'"):
-                value = value[1:-1]
-
-            # Handle boolean
-            if value.lower() == "true":
-                value = True
-            elif value.lower() == "false":
-                value = False
-            # Handle numbers
-            elif value.isdigit():
-                value = int(value)
-            elif re.match(r'^\d+\.\d+$', value):
-                value = float(value)
+            key = ((prefix or "") + key).strip()
+            value = _parse_scalar(value.strip())
 
             # Empty value means upcoming list
             if value == "":
-                current_key = key
                 current_list = []
                 metadata[key] = current_list
             else:
                 metadata[key] = value
-                current_key = key
                 current_list = None
+            current_key = key
 
     # Finish any remaining dict
     if current_dict and current_list is not None and current_key == "assignment_overrides":
         current_list.append(current_dict)
 
-    return metadata, body
+    return metadata
+
+
+def _call_with_backoff(func, *args, **kwargs):
+    """
+    Call a Canvas API method, waiting and retrying if Canvas throttles it.
+
+    Throttled requests are rejected before they take effect, so retrying
+    is safe even for calls that create objects.
+    """
+    for attempt in range(RATE_LIMIT_RETRIES):
+        try:
+            return func(*args, **kwargs)
+        except RateLimitExceeded:
+            delay = RATE_LIMIT_BACKOFF * 2 ** attempt
+            logger.warning(f"Canvas rate limit exceeded, retrying in {delay:g}s")
+            time.sleep(delay)
+    return func(*args, **kwargs)
 
 
 def _sync_assignment_overrides(
@@ -250,7 +477,7 @@ def _sync_assignment_overrides(
     assignment_id: str,
     overrides: List[Dict[str, Any]],
     client: CanvasClient
-) -> None:
+) -> bool:
     """
     Sync assignment overrides to Canvas.
 
@@ -259,6 +486,9 @@ def _sync_assignment_overrides(
         assignment_id: Assignment ID
         overrides: List of override dicts with student_ids or course_section_id and dates
         client: CanvasClient instance
+
+    Returns:
+        True if every override was synced, False if any was skipped or failed
     """
     course = client.get_course(course_id)
     assignment = course.get_assignment(assignment_id)
@@ -272,6 +502,7 @@ def _sync_assignment_overrides(
         pass
 
     # Create or update overrides
+    synced = True
     for override_data in overrides:
         override_id = override_data.get('id')
 
@@ -285,6 +516,7 @@ def _sync_assignment_overrides(
             override_params['course_section_id'] = override_data['course_section_id']
         else:
             logger.warning(f"Override missing student_ids or course_section_id, skipping")
+            synced = False
             continue
 
         # Title (optional)
@@ -292,43 +524,53 @@ def _sync_assignment_overrides(
             override_params['title'] = override_data['title']
 
         # Dates
-        if 'due_at' in override_data:
-            override_params['due_at'] = convert_to_iso8601(override_data['due_at'], use_utc=True)
-        if 'unlock_at' in override_data:
-            override_params['unlock_at'] = convert_to_iso8601(override_data['unlock_at'], use_utc=True)
-        if 'lock_at' in override_data:
-            override_params['lock_at'] = convert_to_iso8601(override_data['lock_at'], use_utc=True)
+        for field in _DATE_FIELDS:
+            if field in override_data:
+                override_params[field] = convert_to_iso8601(override_data[field], use_utc=True)
 
         if override_id and override_id in existing_overrides:
             # Update existing override
             logger.info(f"Updating override {override_id} for assignment {assignment_id}")
             try:
-                existing_overrides[override_id].edit(**override_params)
+                _call_with_backoff(existing_overrides[override_id].edit, **override_params)
             except Exception as e:
                 logger.error(f"Error updating override {override_id}: {e}")
+                synced = False
         else:
             # Create new override
             logger.info(f"Creating new override for assignment {assignment_id}: {override_params}")
             try:
-                assignment.create_override(**override_params)
+                _call_with_backoff(assignment.create_override, **override_params)
             except Exception as e:
                 logger.error(f"Error creating override: {e}")
+                synced = False
+
+    return synced
+
+
+def _body_to_html(body: str, pandoc_ok: bool) -> str:
+    """Convert an assignment body to HTML, skipping pandoc for plain paragraphs."""
+    if not body:
+        return body
+
+    description_html = trivial_markdown_to_html(body)
+    if description_html is None:
+        description_html = markdown_to_html(body) if pandoc_ok else body
+    return description_html
 
 
 def _create_assignment_from_markdown(
     course_id: str,
     metadata: Dict[str, Any],
     body: str,
+    pandoc_ok: bool,
     client: CanvasClient
 ) -> Dict[str, Any]:
     """Create a new assignment from parsed markdown data."""
     course = client.get_course(course_id)
 
     # Convert markdown body to HTML
-    if body and is_pandoc_available():
-        description_html = markdown_to_html(body)
-    else:
-        description_html = body
+    description_html = _body_to_html(body, pandoc_ok)
 
     # Build assignment parameters from metadata
     assignment_params = {
@@ -341,55 +583,86 @@ def _create_assignment_from_markdown(
 
     # NOTE: Canvas API appears to have issues accepting due_at, unlock_at, and lock_at
     # during assignment creation. We'll create the assignment first, then update dates separately.
-    has_dates = bool(metadata.get("due_at") or metadata.get("unlock_at") or metadata.get("lock_at"))
     date_params = {}
-
-    if metadata.get("due_at"):
-        logger.info(f"Will set due_at after creation: '{metadata.get('due_at')}'")
-        date_params["due_at"] = convert_to_iso8601(metadata["due_at"], use_utc=True)
-    if metadata.get("unlock_at"):
-        logger.info(f"Will set unlock_at after creation: '{metadata.get('unlock_at')}'")
-        date_params["unlock_at"] = convert_to_iso8601(metadata["unlock_at"], use_utc=True)
-    if metadata.get("lock_at"):
-        logger.info(f"Will set lock_at after creation: '{metadata.get('lock_at')}'")
-        date_params["lock_at"] = convert_to_iso8601(metadata["lock_at"], use_utc=True)
-
-    # Add submission types
-    if metadata.get("submission_types"):
-        assignment_params["submission_types"] = metadata["submission_types"]
-
-    # Add allowed extensions (for file uploads)
-    if metadata.get("allowed_extensions"):
-        assignment_params["allowed_extensions"] = metadata["allowed_extensions"]
+    for field in _DATE_FIELDS:
+        value = metadata.get(field)
+        if value:
+            logger.info(f"Will set {field} after creation: '{value}'")
+            date_params[field] = convert_to_iso8601(value, use_utc=True)
+    has_dates = bool(date_params)
+
+    # Add submission types and allowed extensions (for file uploads)
+    for field in _LIST_FIELDS:
+        items = metadata.get(field)
+        if items:
+            assignment_params[field] = items
 
     logger.info(f"Creating assignment '{metadata.get('title')}' with params: {assignment_params}")
 
     # Create the assignment via Canvas API
-    assignment = course.create_assignment(assignment=assignment_params)
+    assignment = _call_with_backoff(course.create_assignment, assignment=assignment_params)
 
     # Update with dates separately if present
     if has_dates:
         logger.info(f"Updating assignment {assignment.id} with dates: {date_params}")
-        assignment = assignment.edit(assignment=date_params)
+        assignment = _call_with_backoff(assignment.edit, assignment=date_params)
 
     # Set only_visible_to_overrides if specified
     if metadata.get('only_visible_to_overrides'):
         logger.info(f"Setting only_visible_to_overrides=true for assignment {assignment.id}")
-        assignment.edit(assignment={'only_visible_to_overrides': True})
+        _call_with_backoff(assignment.edit, assignment={'only_visible_to_overrides': True})
 
     # Sync assignment overrides if present
-    if metadata.get('assignment_overrides'):
-        logger.info(f"Syncing {len(metadata['assignment_overrides'])} overrides for assignment {assignment.id}")
-        _sync_assignment_overrides(course_id, str(assignment.id), metadata['assignment_overrides'], client)
+    overrides = metadata.get('assignment_overrides')
+    overrides_synced = True
+    if overrides:
+        logger.info(f"Syncing {len(overrides)} overrides for assignment {assignment.id}")
+        overrides_synced = _sync_assignment_overrides(course_id, str(assignment.id), overrides, client)
+    invalidate_assignment_cache(client, course_id, assignment.id)
 
     return {
         "id": str(assignment.id),
         "name": assignment.name,
         "points_possible": assignment.points_possible,
         "html_url": assignment.html_url if hasattr(assignment, 'html_url') else None,
+        "overrides_synced": overrides_synced,
     }
 
 
+def _render_assignment_content(
+    assignment: Dict[str, Any],
+    course_id: str,
+    pandoc_ok: bool,
+    file_path: Optional[Path] = None
+) -> Optional[str]:
+    """Render an assignment as a markdown file's content.
+
+    Args:
+        assignment: Assignment data, including description and overrides
+        course_id: Canvas course ID
+        pandoc_ok: Whether pandoc can be used for conversion
+        file_path: If given, write the content there instead of returning it
+
+    Returns:
+        Markdown file content, or None if it was written to file_path
+    """
+    # Convert HTML description to markdown; plain paragraphs skip pandoc,
+    # which is slow to start and can be pathologically slow on span-heavy HTML
+    description_html = assignment.get("description", "") or ""
+    description_md = trivial_html_to_markdown(description_html) if description_html else description_html
+    if description_md is None:
+        description_md = html_to_markdown(description_html) if pandoc_ok else description_html
+
+    frontmatter = create_assignment_frontmatter(assignment, course_id)
+    if file_path is None:
+        return frontmatter + description_md
+
+    # Write frontmatter and body separately; descriptions with inline
+    # images can be megabytes, and joining them would copy the body again
+    write_chunks_atomic(file_path, (frontmatter.encode("utf-8"), description_md.encode("utf-8")))
+    return None
+
+
 def pull_assignments(
     course_id: str,
     output_dir: str,
@@ -399,6 +672,11 @@ def pull_assignments(
     """
     Pull all assignments from Canvas and save as markdown files.
 
+    Assignments, with their descriptions and overrides, come from a single
+    paginated listing. Descriptions are converted and files written
+    concurrently. Names that map to the same file are written in listing
+    order, so the last one wins as it would in a serial pull.
+
     Args:
         course_id: Canvas course ID
         output_dir: Directory to save markdown files (assignments subfolder will be created)
@@ -412,9 +690,14 @@ def pull_assignments(
     output_path = Path(output_dir) / "assignments"
     output_path.mkdir(parents=True, exist_ok=True)
 
-    assignments = list_assignments(course_id, client)
+    assignments = list_assignments(course_id, include=["overrides"], client=client)
     results = {"pulled": [], "skipped": [], "errors": []}
 
+    # Decide which assignments to fetch; a file claimed earlier in this
+    # pull counts as existing, just as it would once written
+    pending = []
+    claimed = set()
+    duplicates = set()
     for assignment_meta in assignments:
         try:
             assignment_id = assignment_meta["id"]
@@ -423,32 +706,14 @@ def pull_assignments(
             file_path = output_path / filename
 
             # Skip if exists and not overwriting
-            if file_path.exists() and not overwrite:
+            if not overwrite and (file_path in claimed or file_path.exists()):
                 results["skipped"].append({"id": assignment_id, "name": name, "reason": "file exists"})
                 continue
 
-            # Get full assignment content
-            assignment = get_assignment(course_id, assignment_id, client)
-
-            # Convert HTML description to markdown
-            description_html = assignment.get("description", "") or ""
-            if description_html and is_pandoc_available():
-                description_md = html_to_markdown(description_html)
-            else:
-                description_md = description_html
-
-            # Build content with frontmatter
-            content = create_assignment_frontmatter(assignment, course_id)
-            content += description_md
-
-            # Write file
-            file_path.write_text(content, encoding="utf-8")
-            results["pulled"].append({
-                "id": assignment_id,
-                "name": name,
-                "file": str(file_path)
-            })
-            logger.info(f"Pulled assignment '{name}' to {file_path}")
+            if file_path in claimed:
+                duplicates.add(file_path)
+            claimed.add(file_path)
+            pending.append((assignment_meta, name, file_path))
 
         except Exception as e:
             results["errors"].append({
@@ -458,152 +723,268 @@ def pull_assignments(
             })
             logger.error(f"Error pulling assignment: {e}")
 
+    # Canvas can leave descriptions out of listings; fetch those one by one
+    missing = [i for i, (assignment_meta, _, _) in enumerate(pending) if "description" not in assignment_meta]
+    if missing:
+        logger.info(f"Fetching {len(missing)} assignments listed without a description")
+        with ThreadPoolExecutor(max_workers=min(CANVAS_WORKERS, len(missing))) as executor:
+            fetches = {
+                i: executor.submit(get_assignment, course_id, pending[i][0]["id"], client)
+                for i in missing
+            }
+        failed = set()
+        for i, future in fetches.items():
+            assignment_meta, name, file_path = pending[i]
+            try:
+                pending[i] = (future.result(), name, file_path)
+            except Exception as e:
+                failed.add(i)
+                results["errors"].append({
+                    "id": assignment_meta.get("id", "unknown"),
+                    "name": name,
+                    "error": str(e)
+                })
+                logger.error(f"Error pulling assignment: {e}")
+        pending = [item for i, item in enumerate(pending) if i not in failed]
+
+    if pending:
+        pandoc_ok = is_pandoc_available()
+        with ThreadPoolExecutor(max_workers=min(PANDOC_WORKERS, len(pending))) as executor:
+            # Workers write their own files so writes overlap with other
+            # conversions; shared paths are written here, in order
+            futures = [
+                executor.submit(
+                    _render_assignment_content,
+                    assignment_meta, course_id, pandoc_ok,
+                    None if file_path in duplicates else file_path
+                )
+                for assignment_meta, _, file_path in pending
+            ]
+
+            for (assignment_meta, name, file_path), future in zip(pending, futures):
+                try:
+                    content = future.result()
+                    if file_path in duplicates:
+                        write_bytes_atomic(file_path, content.encode("utf-8"))
+
+                    results["pulled"].append({
+                        "id": assignment_meta["id"],
+                        "name": name,
+                        "file": str(file_path)
+                    })
+                    logger.info(f"Pulled assignment '{name}' to {file_path}")
+
+                except Exception as e:
+                    results["errors"].append({
+                        "id": assignment_meta.get("id", "unknown"),
+                        "name": assignment_meta.get("name", "unknown"),
+                        "error": str(e)
+                    })
+                    logger.error(f"Error pulling assignment: {e}")
+
     logger.info(f"Pull complete: {len(results['pulled'])} pulled, {len(results['skipped'])} skipped, {len(results['errors'])} errors")
     return results
 
 
+def _push_assignment_file(
+    course_id: str,
+    file_path: Path,
+    course: Any,
+    create_missing: bool,
+    update_existing: bool,
+    pandoc_ok: bool,
+    canvas: CanvasClient
+) -> tuple[str, Dict[str, Any], Optional[str]]:
+    """
+    Push one assignment markdown file to Canvas.
+
+    Returns:
+        Tuple of (results bucket, entry, pushed hash) where bucket is created,
+        updated or skipped. The hash is of the file content Canvas now
+        matches, or None if the file should be pushed again next time
+        (skipped, or an override failed to sync).
+    """
+    # The hash is of the bytes parsed here, so an edit made during the
+    # push is not recorded as pushed
+    metadata, body, parsed_hash = _parse_assignment_file(file_path)
+
+    title = metadata.get("title", file_path.stem)
+    assignment_id = metadata.get("assignment_id")
+
+    if assignment_id:
+        # Assignment exists - update if allowed
+        if not update_existing:
+            return "skipped", {
+                "file": str(file_path),
+                "reason": "update_existing is false"
+            }, None
+
+        # Convert markdown body to HTML
+        description_html = _body_to_html(body, pandoc_ok)
+
+        # Build update parameters from metadata
+        update_params = {
+            "description": description_html,
+        }
+
+        # Add optional fields if present in metadata
+        for field in _UPDATE_FIELDS:
+            if field in metadata:
+                update_params[field] = metadata[field]
+
+        # Add date fields with ISO 8601 conversion (UTC format with 'Z')
+        for field in _DATE_FIELDS:
+            value = metadata.get(field)
+            if value:
+                update_params[field] = convert_to_iso8601(value, use_utc=True)
+
+        # Update the assignment
+        assignment = _call_with_backoff(course.get_assignment, assignment_id)
+        logger.debug(f"Update params for assignment {assignment_id}: {update_params}")
+        _call_with_backoff(assignment.edit, assignment=update_params)
+
+        # Update only_visible_to_overrides if specified
+        if "only_visible_to_overrides" in metadata:
+            only_visible = metadata["only_visible_to_overrides"]
+            logger.info(f"Setting only_visible_to_overrides={only_visible} for assignment {assignment_id}")
+            _call_with_backoff(assignment.edit, assignment={'only_visible_to_overrides': only_visible})
+
+        # Sync assignment overrides if present
+        overrides = metadata.get('assignment_overrides')
+        overrides_synced = True
+        if overrides:
+            logger.info(f"Syncing {len(overrides)} overrides for assignment {assignment_id}")
+            overrides_synced = _sync_assignment_overrides(course_id, assignment_id, overrides, canvas)
+        invalidate_assignment_cache(canvas, course_id, assignment_id)
+
+        logger.info(f"Updated assignment '{title}' from {file_path.name}")
+        return "updated", {
+            "id": assignment_id,
+            "name": title,
+            "file": str(file_path)
+        }, parsed_hash if overrides_synced else None
+
+    # Assignment doesn't exist - create if allowed
+    if not create_missing:
+        return "skipped", {
+            "file": str(file_path),
+            "reason": "no assignment_id and create_missing is false"
+        }, None
+
+    new_assignment = _create_assignment_from_markdown(
+        course_id, metadata, body, pandoc_ok, canvas
+    )
+
+    # Update the file with the new assignment_id, keeping the rest as written
+    metadata["assignment_id"] = new_assignment["id"]
+    data = file_path.read_bytes()
+    updated_content = _set_frontmatter_assignment_id(_decode_text(data), new_assignment["id"])
+    if updated_content is None:
+        updated_content = create_assignment_frontmatter(new_assignment, course_id) + body
+    updated_data = updated_content.encode("utf-8")
+    write_bytes_atomic(file_path, updated_data)
+
+    # Record the rewritten file only if it still held the content pushed
+    pushed = new_assignment["overrides_synced"] and _hash_bytes(data) == parsed_hash
+
+    logger.info(f"Created assignment '{title}' from {file_path.name}")
+    return "created", {
+        "id": new_assignment["id"],
+        "name": title,
+        "file": str(file_path),
+        "url": new_assignment.get("html_url")
+    }, _hash_bytes(updated_data) if pushed else None
+
+
 def push_assignments(
     course_id: str,
     input_dir: str,
     create_missing: bool = True,
     update_existing: bool = True,
+    force: bool = False,
     client: Optional[CanvasClient] = None
 ) -> Dict[str, Any]:
     """
     Push local markdown files to Canvas as assignments.
 
     Can create new assignments or update existing ones based on parameters.
+    Files are pushed concurrently; results keep file order. Canvas calls
+    rejected by the rate limit are retried with exponential back-off.
+
+    Files unchanged since they were last pushed (tracked in PUSH_CACHE_FILE)
+    are skipped unless force is set.
 
     Args:
         course_id: Canvas course ID
         input_dir: Directory containing assignment markdown files (or parent dir with assignments subfolder)
         create_missing: Create assignments that don't exist on Canvas (default: True)
         update_existing: Update assignments that already exist (default: True)
+        force: Push every file, even if unchanged since the last push
         client: Optional CanvasClient instance
 
     Returns:
         Dict with results: created, updated, skipped, errors
     """
-    # Check if input_dir has an assignments subfolder
-    input_path = Path(input_dir)
-    assignments_path = input_path / "assignments"
-    if assignments_path.exists():
-        input_path = assignments_path
-
+    input_path = _find_assignments_dir(input_dir)
     results = {"created": [], "updated": [], "skipped": [], "errors": []}
 
-    if not input_path.exists():
+    if input_path is None:
         return results
 
     canvas = client or get_canvas_client()
     course = canvas.get_course(course_id)
 
     # Find all .md files
-    md_files = list(input_path.glob("*.md"))
+    md_files = _list_markdown_files(input_path)
+    if not md_files:
+        return results
 
+    # Skip files whose content matches the last push to this course
+    cache_path = input_path / PUSH_CACHE_FILE
+    cache_target = {"course_id": str(course_id), "domain": str(canvas.domain)}
+    cache = {} if force else load_json_cache(cache_path)
+    pushed = cache.get("files", {}) if all(cache.get(k) == v for k, v in cache_target.items()) else {}
+    new_cache = {**cache_target, "files": {}}
+    to_push = []
     for file_path in md_files:
-        try:
-            content = file_path.read_text(encoding="utf-8")
-            metadata, body = parse_assignment_frontmatter(content)
-
-            title = metadata.get("title", file_path.stem)
-            assignment_id = metadata.get("assignment_id")
-
-            if assignment_id:
-                # Assignment exists - update if allowed
-                if not update_existing:
-                    results["skipped"].append({
-                        "file": str(file_path),
-                        "reason": "update_existing is false"
-                    })
-                    continue
-
-                # Convert markdown body to HTML
-                if body and is_pandoc_available():
-                    description_html = markdown_to_html(body)
-                else:
-                    description_html = body
-
-                # Build update parameters from metadata
-                update_params = {
-                    "description": description_html,
-                }
-
-                # Add optional fields if present in metadata
-                if "points_possible" in metadata:
-                    update_params["points_possible"] = metadata["points_possible"]
-                if "grading_type" in metadata:
-                    update_params["grading_type"] = metadata["grading_type"]
-                if "published" in metadata:
-                    update_params["published"] = metadata["published"]
-                if "submission_types" in metadata:
-                    update_params["submission_types"] = metadata["submission_types"]
-                if "allowed_extensions" in metadata:
-                    update_params["allowed_extensions"] = metadata["allowed_extensions"]
-
-                # Add date fields with ISO 8601 conversion (UTC format with 'Z')
-                if metadata.get("due_at"):
-                    update_params["due_at"] = convert_to_iso8601(metadata["due_at"], use_utc=True)
-                if metadata.get("unlock_at"):
-                    update_params["unlock_at"] = convert_to_iso8601(metadata["unlock_at"], use_utc=True)
-                if metadata.get("lock_at"):
-                    update_params["lock_at"] = convert_to_iso8601(metadata["lock_at"], use_utc=True)
-
-                # Update the assignment
-                assignment = course.get_assignment(assignment_id)
-                logger.debug(f"Update params for assignment {assignment_id}: {update_params}")
-                assignment.edit(assignment=update_params)
-
-                # Update only_visible_to_overrides if specified
-                if "only_visible_to_overrides" in metadata:
-                    logger.info(f"Setting only_visible_to_overrides={metadata['only_visible_to_overrides']} for assignment {assignment_id}")
-                    assignment.edit(assignment={'only_visible_to_overrides': metadata['only_visible_to_overrides']})
-
-                # Sync assignment overrides if present
-                if metadata.get('assignment_overrides'):
-                    logger.info(f"Syncing {len(metadata['assignment_overrides'])} overrides for assignment {assignment_id}")
-                    _sync_assignment_overrides(course_id, assignment_id, metadata['assignment_overrides'], canvas)
-
-                results["updated"].append({
-                    "id": assignment_id,
-                    "name": title,
-                    "file": str(file_path)
-                })
-                logger.info(f"Updated assignment '{title}' from {file_path.name}")
-
-            else:
-                # Assignment doesn't exist - create if allowed
-                if not create_missing:
-                    results["skipped"].append({
-                        "file": str(file_path),
-                        "reason": "no assignment_id and create_missing is false"
-                    })
-                    continue
-
-                new_assignment = _create_assignment_from_markdown(
-                    course_id, metadata, body, canvas
-                )
-
-                # Update the file with the new assignment_id
-                metadata["assignment_id"] = new_assignment["id"]
-                updated_content = create_assignment_frontmatter(new_assignment, course_id)
-                updated_content += body
-                file_path.write_text(updated_content, encoding="utf-8")
-
-                results["created"].append({
-                    "id": new_assignment["id"],
-                    "name": title,
+        pushed_hash = pushed.get(file_path.name)
+        if pushed_hash and pushed_hash == _file_hash(file_path):
+            new_cache["files"][file_path.name] = pushed_hash
+            results["skipped"].append({
+                "file": str(file_path),
+                "reason": "unchanged since last push"
+            })
+        else:
+            to_push.append(file_path)
+
+    pandoc_ok = is_pandoc_available()
+    with ThreadPoolExecutor(max_workers=max(1, min(CANVAS_WORKERS, len(to_push)))) as executor:
+        futures = [
+            executor.submit(
+                _push_assignment_file,
+                course_id, file_path, course, create_missing, update_existing, pandoc_ok, canvas
+            )
+            for file_path in to_push
+        ]
+
+        for file_path, future in zip(to_push, futures):
+            try:
+                bucket, entry, pushed_hash = future.result()
+                results[bucket].append(entry)
+                if pushed_hash:
+                    new_cache["files"][file_path.name] = pushed_hash
+            except Exception as e:
+                results["errors"].append({
                     "file": str(file_path),
-                    "url": new_assignment.get("html_url")
+                    "error": str(e)
                 })
-                logger.info(f"Created assignment '{title}' from {file_path.name}")
+                logger.error(f"Error pushing assignment {file_path}: {e}")
 
-        except Exception as e:
-            results["errors"].append({
-                "file": str(file_path),
-                "error": str(e)
-            })
-            logger.error(f"Error pushing assignment {file_path}: {e}")
+    if new_cache != cache:
+        try:
+            save_json_cache(cache_path, new_cache)
+        except OSError as e:
+            logger.debug(f"Could not write {cache_path}: {e}")
 
     logger.info(f"Push complete: {len(results['created'])} created, {len(results['updated'])} updated, {len(results['skipped'])} skipped, {len(results['errors'])} errors")
     return results
@@ -625,56 +1006,41 @@ def assignment_sync_status(
     Returns:
         Dict with synced, canvas_only, local_only lists and summary counts
     """
-    # Check for assignments subfolder
-    local_path = Path(local_dir)
-    assignments_path = local_path / "assignments"
-    if assignments_path.exists():
-        local_path = assignments_path
+    local_path = _find_assignments_dir(local_dir)
 
     # Get Canvas assignments
-    canvas_assignments = list_assignments(course_id, client)
+    canvas_assignments = list_assignments(course_id, client=client)
     canvas_by_id = {a["id"]: a for a in canvas_assignments}
 
-    # Get local assignments
-    local_by_id = {}
-    if local_path.exists():
-        for file_path in local_path.glob("*.md"):
-            content = file_path.read_text(encoding="utf-8")
-            metadata, _ = parse_assignment_frontmatter(content)
-            assignment_id = metadata.get("assignment_id")
-            if assignment_id:
-                local_by_id[assignment_id] = {
-                    "file": str(file_path),
-                    "name": metadata.get("title", file_path.stem)
-                }
+    # Get local assignments; only the frontmatter is compared, so bodies are not read
+    local_by_id = _scan_local_assignments(local_path) if local_path is not None else {}
 
     # Compare
     synced = []
     canvas_only = []
     local_only = []
 
-    canvas_ids = set(canvas_by_id.keys())
-    local_ids = set(local_by_id.keys())
-
-    for aid in canvas_ids & local_ids:
-        synced.append({
-            "id": aid,
-            "name": canvas_by_id[aid].get("name", ""),
-            "file": local_by_id[aid]["file"]
-        })
-
-    for aid in canvas_ids - local_ids:
-        canvas_only.append({
-            "id": aid,
-            "name": canvas_by_id[aid].get("name", "")
-        })
-
-    for aid in local_ids - canvas_ids:
-        local_only.append({
-            "id": aid,
-            "name": local_by_id[aid]["name"],
-            "file": local_by_id[aid]["file"]
-        })
+    for aid, canvas_assignment in canvas_by_id.items():
+        local = local_by_id.get(aid)
+        if local is not None:
+            synced.append({
+                "id": aid,
+                "name": canvas_assignment.get("name", ""),
+                "file": local["file"]
+            })
+        else:
+            canvas_only.append({
+                "id": aid,
+                "name": canvas_assignment.get("name", "")
+            })
+
+    for aid, local in local_by_id.items():
+        if aid not in canvas_by_id:
+            local_only.append({
+                "id": aid,
+                "name": local["name"],
+                "file": local["file"]
+            })
 
     return {
         "synced": synced,
@@ -4,14 +4,23 @@ Assignments Module
 Operations for Canvas assignments and submissions.
 """
 
+import re
+import time
 import logging
-from typing import List, Dict, Any, Optional
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Iterator, List, Dict, Any, Optional
 from datetime import datetime, timezone
 from canvasapi.exceptions import ResourceDoesNotExist, CanvasException
+from requests import HTTPError, RequestException
 
 from canvas_common import get_canvas_client, CanvasClient
 from canvas_common import ResourceNotFoundError
 
+from .cache_utils import TTLCache
+from .http_utils import canvas_error, canvas_request, iter_canvas_pages
+
 logger = logging.getLogger("canvas_author.assignments")
 
 # Fields to include in assignment responses
@@ -23,6 +32,161 @@ ASSIGNMENT_FIELDS = [
     "assignment_group_id",
 ]
 
+# Canvas's own UTC timestamp format, which orders correctly as a string
+_CANVAS_UTC_RE = re.compile(r"\d{4}-\d\d-\d\dT\d\d:\d\d:\d\dZ")
+
+# Extra data always requested with submission listings; include_user and
+# include_rubric only decide what is returned. Comments are left out since
+# listings never return them
+SUBMISSION_INCLUDES = ["user", "rubric_assessment"]
+
+# Fields copied into get_submission results only when set
+_SUBMISSION_OPTIONAL_FIELDS = (
+    "submitted_at", "grade", "score", "attempt",
+    "submission_type", "body", "url", "preview_url",
+)
+
+# Parsed course dates kept between calls, for timestamps not in Canvas's UTC form
+ISO_PARSE_CACHE_SIZE = 4096
+
+# Items per page for paginated listings; Canvas defaults to 10 and caps at 100
+PER_PAGE = 100
+
+# Seconds that course and assignment objects are reused, so repeated calls
+# on the same course skip the lookup requests that start each operation
+COURSE_CACHE_TTL = 1800
+ASSIGNMENT_CACHE_TTL = 300
+
+# Concurrent Canvas requests for get_assignments_bulk
+BULK_WORKERS = 8
+
+# Seconds to wait for a bulk grade update job, and the longest pause
+# between progress checks
+BULK_GRADE_TIMEOUT = 120
+BULK_GRADE_MAX_POLL_INTERVAL = 5.0
+
+_course_cache = TTLCache(COURSE_CACHE_TTL)
+_assignment_cache = TTLCache(ASSIGNMENT_CACHE_TTL)
+
+
+def _get_course(canvas: CanvasClient, course_id: str) -> Any:
+    """
+    Get a course through the cache; entries are per client object.
+
+    Concurrent calls for the same course share one request.
+    """
+    key = (id(canvas), str(course_id))
+    cached = _course_cache.get_or_load(key, lambda: (canvas, canvas.get_course(course_id)))
+    if cached[0] is canvas:
+        return cached[1]
+
+    course = canvas.get_course(course_id)
+    _course_cache.set(key, (canvas, course))
+    return course
+
+
+def _get_assignment(canvas: CanvasClient, course_id: str, assignment_id: str) -> Any:
+    """
+    Get an assignment through the cache, like _get_course.
+
+    Raises:
+        ResourceNotFoundError: If the assignment does not exist
+    """
+    def load():
+        try:
+            return canvas, _get_course(canvas, course_id).get_assignment(assignment_id)
+        except ResourceDoesNotExist:
+            raise ResourceNotFoundError("assignment", assignment_id)
+
+    key = (id(canvas), str(course_id), str(assignment_id))
+    cached = _assignment_cache.get_or_load(key, load)
+    if cached[0] is not canvas:
+        cached = load()
+        _assignment_cache.set(key, cached)
+    return cached[1]
+
+
+def invalidate_assignment_cache(canvas: CanvasClient, course_id: str, assignment_id: str) -> None:
+    """
+    Drop a cached assignment after it changes on Canvas.
+
+    Args:
+        canvas: CanvasClient the assignment was fetched with
+        course_id: Canvas course ID
+        assignment_id: Canvas assignment ID
+    """
+    _assignment_cache.invalidate(id(canvas), str(course_id), str(assignment_id))
+
+
+def _compare_to_now(timestamp: Any, now: datetime, now_utc: str) -> Optional[int]:
+    """
+    Compare a Canvas timestamp with now.
+
+    Canvas sends UTC timestamps as "YYYY-MM-DDTHH:MM:SSZ", which order
+    correctly as plain strings, so these skip datetime parsing.
+
+    Args:
+        timestamp: Timestamp from Canvas
+        now: Current time
+        now_utc: Current time in Canvas's UTC format
+
+    Returns:
+        -1, 0 or 1 as the timestamp is before, at or after now, or None if it cannot be read
+    """
+    if not isinstance(timestamp, str):
+        return None
+    if _CANVAS_UTC_RE.fullmatch(timestamp):
+        return (timestamp > now_utc) - (timestamp < now_utc)
+    parsed = _parse_iso(timestamp)
+    if parsed is None:
+        return None
+    try:
+        return (parsed > now) - (parsed < now)
+    except TypeError:  # No UTC offset to compare with
+        return None
+
+
+@lru_cache(maxsize=ISO_PARSE_CACHE_SIZE)
+def _parse_iso(timestamp: str) -> Optional[datetime]:
+    """Parse an ISO 8601 timestamp, or return None if it cannot be read; results are cached."""
+    try:
+        return datetime.fromisoformat(timestamp.replace('Z', '+00:00'))
+    except ValueError:
+        return None
+
+
+def _course_is_active(course: Dict[str, Any], now: datetime, now_utc: str) -> bool:
+    """Check whether a course has started and not yet ended; missing or invalid dates are ignored."""
+    start_at = course.get("start_at")
+    end_at = course.get("end_at")
+
+    course_started = True
+    course_ended = False
+
+    if start_at:
+        comparison = _compare_to_now(start_at, now, now_utc)
+        if comparison is not None:
+            course_started = comparison <= 0
+
+    if end_at:
+        comparison = _compare_to_now(end_at, now, now_utc)
+        if comparison is not None:
+            course_ended = comparison < 0
+
+    return course_started and not course_ended
+
+
+def _course_to_dict(course: Dict[str, Any]) -> Dict[str, Any]:
+    """Convert a course's raw Canvas JSON to the dict returned by list_courses."""
+    return {
+        "id": str(course["id"]),
+        "name": course.get("name", f"Course {course['id']}"),
+        "course_code": course.get("course_code", ""),
+        "workflow_state": course.get("workflow_state", ""),
+        "start_at": course.get("start_at"),
+        "end_at": course.get("end_at"),
+    }
+
 
 def list_courses(
     enrollment_type: str = "teacher",
@@ -47,68 +211,85 @@ def list_courses(
     # For enrollment: active, invited_or_pending, completed
     api_params = {
         "enrollment_type": enrollment_type,
-        "include": ["favorites"],
-        "per_page": 100,  # Fetch more per request for efficiency
+        "include[]": ["favorites"],
+        "per_page": PER_PAGE,  # Fetch more per request for efficiency
     }
     
     # If user wants all courses, include completed ones from Canvas API
     if enrollment_state == "all":
-        api_params["state"] = ["available", "unpublished", "completed"]
+        api_params["state[]"] = ["available", "unpublished", "completed"]
     
-    all_courses = list(canvas.get_courses(**api_params))
+    # Read as raw JSON, revalidating unchanged pages by ETag on repeat calls
+    try:
+        all_courses = list(iter_canvas_pages(canvas, "courses", api_params, revalidate=True))
+    except RequestException as e:
+        raise canvas_error(e) from e
     
-    logger.info(f"Canvas API returned {len(all_courses)} courses before filtering")
+    logger.info("Canvas API returned %d courses before filtering", len(all_courses))
 
     if enrollment_state == "active":
-        now = datetime.now(timezone.utc)
-        active_courses = []
-
-        for course in all_courses:
-            start_at = getattr(course, "start_at", None)
-            end_at = getattr(course, "end_at", None)
-
-            course_started = True
-            course_ended = False
-
-            if start_at:
-                try:
-                    start_date = datetime.fromisoformat(start_at.replace('Z', '+00:00'))
-                    course_started = now >= start_date
-                except (ValueError, TypeError):
-                    pass
-
-            if end_at:
-                try:
-                    end_date = datetime.fromisoformat(end_at.replace('Z', '+00:00'))
-                    course_ended = now > end_date
-                except (ValueError, TypeError):
-                    pass
-
-            if course_started and not course_ended:
-                active_courses.append(course)
-
-        courses = active_courses
+        now = datetime.now(timezone.utc).replace(microsecond=0)
+        now_utc = now.strftime("%Y-%m-%dT%H:%M:%SZ")
+        courses = [course for course in all_courses if _course_is_active(course, now, now_utc)]
     else:
         courses = all_courses
 
-    result = []
-    for course in courses:
-        result.append({
-            "id": str(course.id),
-            "name": getattr(course, "name", f"Course {course.id}"),
-            "course_code": getattr(course, "course_code", ""),
-            "workflow_state": getattr(course, "workflow_state", ""),
-            "start_at": getattr(course, "start_at", None),
-            "end_at": getattr(course, "end_at", None),
-        })
-
-    logger.info(f"Listed {len(result)} courses")
+    result = [_course_to_dict(course) for course in courses]
+
+    logger.info("Listed %d courses", len(result))
     return result
 
 
+def _assignment_to_dict(attrs: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Convert assignment data to a dict of its ASSIGNMENT_FIELDS.
+
+    Takes raw Canvas JSON, or vars() of a canvasapi assignment. Dates are
+    Canvas's ISO strings in both (canvasapi keeps parsed copies in separate
+    *_date attributes), so they are copied as they are.
+    """
+    data = {"id": str(attrs["id"])}
+    for field in ASSIGNMENT_FIELDS:
+        if field in attrs:
+            data[field] = attrs[field]
+    return data
+
+
+def _override_to_dict(override: Dict[str, Any]) -> Dict[str, Any]:
+    """Convert raw assignment override data to the dict used in frontmatter."""
+    override_data = {
+        'id': str(override['id']),
+    }
+    # Student IDs or section ID
+    if override.get('student_ids'):
+        override_data['student_ids'] = override['student_ids']
+    if override.get('course_section_id'):
+        override_data['course_section_id'] = override['course_section_id']
+    # Title (optional)
+    if override.get('title'):
+        override_data['title'] = override['title']
+    # Dates
+    if override.get('due_at'):
+        override_data['due_at'] = str(override['due_at'])
+    if override.get('unlock_at'):
+        override_data['unlock_at'] = str(override['unlock_at'])
+    if override.get('lock_at'):
+        override_data['lock_at'] = str(override['lock_at'])
+    return override_data
+
+
+def _listed_assignment_to_dict(assignment: Dict[str, Any]) -> Dict[str, Any]:
+    """Convert a listed assignment's raw JSON, with any overrides the listing included."""
+    assignment_data = _assignment_to_dict(assignment)
+    if assignment.get('overrides'):
+        assignment_data['overrides'] = [_override_to_dict(o) for o in assignment['overrides']]
+    return assignment_data
+
+
 def list_assignments(
     course_id: str,
-    client: Optional[CanvasClient] = None
+    client: Optional[CanvasClient] = None,
+    include: Optional[List[str]] = None
 ) -> List[Dict[str, Any]]:
     """
     List all assignments in a course.
@@ -116,24 +297,27 @@ def list_assignments(
     Args:
         course_id: Canvas course ID
         client: Optional CanvasClient instance
+        include: Optional extra data to include (e.g. ['overrides']); overrides
+            are returned in the same form as get_assignment
 
     Returns:
         List of assignment dicts
     """
     canvas = client or get_canvas_client()
-    course = canvas.get_course(course_id)
-    assignments = list(course.get_assignments())
-
-    result = []
-    for assignment in assignments:
-        assignment_data = {"id": str(assignment.id)}
-        for field in ASSIGNMENT_FIELDS:
-            if hasattr(assignment, field):
-                value = getattr(assignment, field)
-                assignment_data[field] = str(value) if field.endswith("_at") and value else value
-        result.append(assignment_data)
-
-    logger.info(f"Listed {len(result)} assignments for course {course_id}")
+    params = {"per_page": PER_PAGE}
+    if include:
+        params["include[]"] = include
+
+    # Read as raw JSON, revalidating unchanged pages by ETag on repeat calls
+    assignments = iter_canvas_pages(canvas, f"courses/{course_id}/assignments", params, revalidate=True)
+    try:
+        result = [_listed_assignment_to_dict(assignment) for assignment in assignments]
+    except RequestException as e:
+        if isinstance(e, HTTPError) and e.response is not None and e.response.status_code == 404:
+            raise ResourceNotFoundError("course", course_id)
+        raise canvas_error(e) from e
+
+    logger.info("Listed %d assignments for course %s", len(result), course_id)
     return result
 
 
@@ -154,18 +338,16 @@ def get_assignment(
         Assignment data dict
     """
     canvas = client or get_canvas_client()
-    course = canvas.get_course(course_id)
+    course = _get_course(canvas, course_id)
 
     try:
-        assignment = course.get_assignment(assignment_id)
+        # Overrides come back with the assignment instead of in a second request
+        assignment = course.get_assignment(assignment_id, include=["overrides"])
     except ResourceDoesNotExist:
         raise ResourceNotFoundError("assignment", assignment_id)
+    _assignment_cache.set((id(canvas), str(course_id), str(assignment_id)), (canvas, assignment))
 
-    result = {"id": str(assignment.id)}
-    for field in ASSIGNMENT_FIELDS:
-        if hasattr(assignment, field):
-            value = getattr(assignment, field)
-            result[field] = str(value) if field.endswith("_at") and value else value
+    result = _assignment_to_dict(vars(assignment))
 
     # Include rubric info if available
     if hasattr(assignment, 'rubric_settings') and assignment.rubric_settings:
@@ -182,49 +364,166 @@ def get_assignment(
         result["is_discussion"] = False
 
     # Include assignment overrides for differentiated assignments
-    try:
-        overrides_list = []
-        overrides = assignment.get_overrides()
-        for override in overrides:
-            override_data = {
-                'id': str(override.id),
-            }
-            # Student IDs or section ID
-            if hasattr(override, 'student_ids') and override.student_ids:
-                override_data['student_ids'] = override.student_ids
-            if hasattr(override, 'course_section_id') and override.course_section_id:
-                override_data['course_section_id'] = override.course_section_id
-            # Title (optional)
-            if hasattr(override, 'title') and override.title:
-                override_data['title'] = override.title
-            # Dates
-            if hasattr(override, 'due_at') and override.due_at:
-                override_data['due_at'] = str(override.due_at)
-            if hasattr(override, 'unlock_at') and override.unlock_at:
-                override_data['unlock_at'] = str(override.unlock_at)
-            if hasattr(override, 'lock_at') and override.lock_at:
-                override_data['lock_at'] = str(override.lock_at)
-
-            overrides_list.append(override_data)
-
-        if overrides_list:
-            result['overrides'] = overrides_list
-    except Exception as e:
-        logger.debug(f"Could not fetch overrides for assignment {assignment_id}: {e}")
-
-    logger.info(f"Retrieved assignment {assignment_id} from course {course_id}")
+    if getattr(assignment, 'overrides', None):
+        result['overrides'] = [_override_to_dict(o) for o in assignment.overrides]
+
+    logger.info("Retrieved assignment %s from course %s", assignment_id, course_id)
     return result
 
 
-def list_submissions(
+def get_assignments_bulk(
+    course_id: str,
+    assignment_ids: List[str],
+    client: Optional[CanvasClient] = None
+) -> Dict[str, Any]:
+    """
+    Get details for several assignments in a course at once.
+
+    The get_assignment calls run on a small thread pool and share one
+    course lookup, so N assignments take about N / BULK_WORKERS round trips
+    instead of N.
+
+    Args:
+        course_id: Canvas course ID
+        assignment_ids: Canvas assignment IDs
+        client: Optional CanvasClient instance
+
+    Returns:
+        Dict with 'assignments' (in the order requested, as returned by
+        get_assignment) and 'not_found' (IDs that do not exist)
+    """
+    canvas = client or get_canvas_client()
+
+    def fetch(assignment_id: str) -> Optional[Dict[str, Any]]:
+        try:
+            return get_assignment(course_id, assignment_id, client=canvas)
+        except ResourceNotFoundError:
+            return None
+
+    with ThreadPoolExecutor(max_workers=max(1, min(BULK_WORKERS, len(assignment_ids)))) as executor:
+        fetched = list(executor.map(fetch, assignment_ids))
+
+    result = {
+        "assignments": [data for data in fetched if data is not None],
+        "not_found": [str(aid) for aid, data in zip(assignment_ids, fetched) if data is None],
+    }
+    logger.info("Retrieved %d assignments from course %s", len(result["assignments"]), course_id)
+    return result
+
+
+@dataclass(slots=True)
+class SubmissionStatus:
+    """Grading state of one submission, without user or content data."""
+    id: str
+    user_id: str
+    submitted_at: Optional[str] = None
+    grade: Optional[str] = None
+    score: Optional[float] = None
+    workflow_state: str = ""
+    late: bool = False
+    missing: bool = False
+
+    @classmethod
+    def from_canvas(cls, submission: Dict[str, Any]) -> "SubmissionStatus":
+        """Build from a submission's raw Canvas JSON."""
+        return cls(
+            id=str(submission["id"]),
+            user_id=str(submission["user_id"]),
+            submitted_at=submission.get("submitted_at"),
+            grade=submission.get("grade"),
+            score=submission.get("score"),
+            workflow_state=submission.get("workflow_state") or "",
+            late=bool(submission.get("late")),
+            missing=bool(submission.get("missing")),
+        )
+
+    @property
+    def is_graded(self) -> bool:
+        """Whether the submission has a score or grade, or Canvas marks it graded."""
+        # Auto-graded quizzes may have a score while workflow_state is not 'graded'
+        return self.score is not None or self.grade is not None or self.workflow_state == "graded"
+
+
+def _submission_to_dict(submission: Dict[str, Any], include_user: bool, include_rubric: bool) -> Dict[str, Any]:
+    """Convert a submission's raw Canvas JSON to the dict returned by list_submissions."""
+    sub_data = {
+        "id": str(submission["id"]),
+        "user_id": str(submission["user_id"]),
+        "submitted_at": submission.get("submitted_at"),
+        "grade": submission.get("grade"),
+        "score": submission.get("score"),
+        "workflow_state": submission.get("workflow_state", ""),
+        "late": submission.get("late", False),
+        "missing": submission.get("missing", False),
+        "attempt": submission.get("attempt"),
+    }
+
+    user = submission.get("user") if include_user else None
+    if user is not None:
+        sub_data["user"] = {
+            "id": str(user.get("id", "")),
+            "name": user.get("name", "Unknown"),
+            "sortable_name": user.get("sortable_name", ""),
+        }
+
+    if include_rubric and "rubric_assessment" in submission:
+        sub_data["rubric_assessment"] = submission["rubric_assessment"]
+
+    # Include attachment info
+    attachments = submission.get("attachments")
+    if attachments:
+        sub_data["attachments"] = [
+            {
+                "id": str(att.get("id", "")),
+                "filename": att.get("filename", ""),
+                "display_name": att.get("display_name", ""),
+                "content_type": att.get("content-type", ""),
+                "url": att.get("url", ""),
+            }
+            for att in attachments
+        ]
+
+    return sub_data
+
+
+def _iter_raw_submissions(
+    canvas: CanvasClient,
+    course_id: str,
+    assignment_id: str,
+    include: List[str],
+    revalidate: bool = False
+) -> Iterator[Dict[str, Any]]:
+    """
+    Yield an assignment's submissions as raw Canvas JSON.
+
+    Raises:
+        ResourceNotFoundError: If the assignment does not exist
+        CanvasException: For other failures, as canvasapi would raise them
+    """
+    path = f"courses/{course_id}/assignments/{assignment_id}/submissions"
+    params = {"include[]": include, "per_page": PER_PAGE}
+    try:
+        yield from iter_canvas_pages(canvas, path, params, revalidate=revalidate)
+    except RequestException as e:
+        if isinstance(e, HTTPError) and e.response is not None and e.response.status_code == 404:
+            raise ResourceNotFoundError("assignment", assignment_id)
+        raise canvas_error(e) from e
+
+
+def iter_submissions(
     course_id: str,
     assignment_id: str,
     include_user: bool = True,
     include_rubric: bool = True,
     client: Optional[CanvasClient] = None
-) -> List[Dict[str, Any]]:
+) -> Iterator[Dict[str, Any]]:
     """
-    List all submissions for an assignment.
+    Yield the submissions for an assignment page by page.
+
+    Like list_submissions, but without holding every submission in memory,
+    for callers that only need one pass over a large course. Pages are read
+    as raw JSON rather than canvasapi objects, since each submission is
+    turned straight into a dict.
 
     Args:
         course_id: Canvas course ID
@@ -233,66 +532,72 @@ def list_submissions(
         include_rubric: Include rubric assessment in response
         client: Optional CanvasClient instance
 
-    Returns:
-        List of submission dicts
+    Yields:
+        Submission dicts, as returned by list_submissions
+
+    Raises:
+        ResourceNotFoundError: If the assignment does not exist
     """
     canvas = client or get_canvas_client()
-    course = canvas.get_course(course_id)
 
-    try:
-        assignment = course.get_assignment(assignment_id)
-    except ResourceDoesNotExist:
-        raise ResourceNotFoundError("assignment", assignment_id)
+    # The same request serves every include_user/include_rubric combination,
+    # so a repeated listing revalidates one set of pages by ETag
+    submissions = _iter_raw_submissions(canvas, course_id, assignment_id, SUBMISSION_INCLUDES, revalidate=True)
+    for submission in submissions:
+        yield _submission_to_dict(submission, include_user, include_rubric)
 
-    include = []
-    if include_user:
-        include.append("user")
-    if include_rubric:
-        include.extend(["submission_comments", "rubric_assessment"])
 
-    submissions = assignment.get_submissions(include=include)
+def iter_submission_statuses(
+    course_id: str,
+    assignment_id: str,
+    client: Optional[CanvasClient] = None
+) -> Iterator[SubmissionStatus]:
+    """
+    Yield the grading state of each submission for an assignment.
 
-    result = []
-    for submission in submissions:
-        sub_data = {
-            "id": str(submission.id),
-            "user_id": str(submission.user_id),
-            "submitted_at": str(getattr(submission, "submitted_at", None)),
-            "grade": getattr(submission, "grade", None),
-            "score": getattr(submission, "score", None),
-            "workflow_state": getattr(submission, "workflow_state", ""),
-            "late": getattr(submission, "late", False),
-            "missing": getattr(submission, "missing", False),
-            "attempt": getattr(submission, "attempt", None),
-        }
+    Lighter than iter_submissions for callers that only count or filter
+    submissions: no user, comment or rubric data is requested, and each
+    row is a slotted SubmissionStatus rather than a dict.
 
-        if include_user and hasattr(submission, "user"):
-            user = submission.user
-            sub_data["user"] = {
-                "id": str(user.get("id", "")),
-                "name": user.get("name", "Unknown"),
-                "sortable_name": user.get("sortable_name", ""),
-            }
+    Args:
+        course_id: Canvas course ID
+        assignment_id: Canvas assignment ID
+        client: Optional CanvasClient instance
+
+    Yields:
+        SubmissionStatus for each submission
+
+    Raises:
+        ResourceNotFoundError: If the assignment does not exist
+    """
+    canvas = client or get_canvas_client()
+    for submission in _iter_raw_submissions(canvas, course_id, assignment_id, []):
+        yield SubmissionStatus.from_canvas(submission)
+
+
+def list_submissions(
+    course_id: str,
+    assignment_id: str,
+    include_user: bool = True,
+    include_rubric: bool = True,
+    client: Optional[CanvasClient] = None
+) -> List[Dict[str, Any]]:
+    """
+    List all submissions for an assignment.
+
+    Args:
+        course_id: Canvas course ID
+        assignment_id: Canvas assignment ID
+        include_user: Include user info in response
+        include_rubric: Include rubric assessment in response
+        client: Optional CanvasClient instance
 
-        if include_rubric and hasattr(submission, "rubric_assessment"):
-            sub_data["rubric_assessment"] = submission.rubric_assessment
-
-        # Include attachment info
-        if hasattr(submission, "attachments") and submission.attachments:
-            sub_data["attachments"] = [
-                {
-                    "id": str(getattr(att, "id", "")),
-                    "filename": getattr(att, "filename", ""),
-                    "display_name": getattr(att, "display_name", ""),
-                    "content_type": getattr(att, "content_type", ""),
-                    "url": getattr(att, "url", ""),
-                }
-                for att in submission.attachments
-            ]
-
-        result.append(sub_data)
-
-    logger.info(f"Listed {len(result)} submissions for assignment {assignment_id}")
+    Returns:
+        List of submission dicts
+    """
+    result = list(iter_submissions(course_id, assignment_id, include_user, include_rubric, client=client))
+
+    logger.info("Listed %d submissions for assignment %s", len(result), assignment_id)
     return result
 
 
@@ -314,15 +619,11 @@ def get_submission(
         client: Optional CanvasClient instance
 
     Returns:
-        Submission data dict
+        Submission data dict; optional fields Canvas left empty (grade,
+        body, url, ...) are omitted rather than set to None
     """
     canvas = client or get_canvas_client()
-    course = canvas.get_course(course_id)
-
-    try:
-        assignment = course.get_assignment(assignment_id)
-    except ResourceDoesNotExist:
-        raise ResourceNotFoundError("assignment", assignment_id)
+    assignment = _get_assignment(canvas, course_id, assignment_id)
 
     include = ["user", "submission_comments"]
     if include_rubric:
@@ -336,18 +637,14 @@ def get_submission(
     result = {
         "id": str(submission.id),
         "user_id": str(submission.user_id),
-        "submitted_at": str(getattr(submission, "submitted_at", None)),
-        "grade": getattr(submission, "grade", None),
-        "score": getattr(submission, "score", None),
         "workflow_state": getattr(submission, "workflow_state", ""),
         "late": getattr(submission, "late", False),
         "missing": getattr(submission, "missing", False),
-        "attempt": getattr(submission, "attempt", None),
-        "submission_type": getattr(submission, "submission_type", None),
-        "body": getattr(submission, "body", None),
-        "url": getattr(submission, "url", None),
-        "preview_url": getattr(submission, "preview_url", None),
     }
+    for field in _SUBMISSION_OPTIONAL_FIELDS:
+        value = getattr(submission, field, None)
+        if value is not None:
+            result[field] = value
 
     # Add assignment metadata for context
     result["assignment"] = {
@@ -390,7 +687,7 @@ def get_submission(
     if hasattr(submission, "submission_comments"):
         result["submission_comments"] = submission.submission_comments
 
-    logger.info(f"Retrieved submission for user {user_id} on assignment {assignment_id}")
+    logger.info("Retrieved submission for user %s on assignment %s", user_id, assignment_id)
     return result
 
 def update_grade(
@@ -416,48 +713,103 @@ def update_grade(
         Updated submission data dict
     """
     canvas = client or get_canvas_client()
-    course = canvas.get_course(course_id)
-
-    try:
-        assignment = course.get_assignment(assignment_id)
-    except ResourceDoesNotExist:
-        raise ResourceNotFoundError("assignment", assignment_id)
 
     # Build the submission update data
-    submission_data = {
-        "submission": {
-            "posted_grade": grade
-        }
-    }
+    submission_data = {"submission[posted_grade]": grade}
 
     # Add comment if provided
     if comment:
-        submission_data["comment"] = {
-            "text_comment": comment
-        }
+        submission_data["comment[text_comment]"] = comment
 
+    # PUT the submission directly, without first fetching the course,
+    # assignment and submission objects. The shared session never retries
+    # a PUT, so a comment is not posted twice when Canvas fails after saving it
+    path = f"courses/{course_id}/assignments/{assignment_id}/submissions/{user_id}"
     try:
-        # Update the submission
-        submission = assignment.get_submission(user_id)
-        updated = submission.edit(**submission_data)
-        
-        logger.info(f"Updated grade for user {user_id} on assignment {assignment_id}: {grade}")
-        
-        # Return updated submission data
-        return {
-            "id": str(updated.id),
-            "user_id": str(updated.user_id),
-            "grade": getattr(updated, "grade", None),
-            "score": getattr(updated, "score", None),
-            "workflow_state": getattr(updated, "workflow_state", ""),
-            "success": True
-        }
-    except ResourceDoesNotExist:
-        raise ResourceNotFoundError("submission", user_id, f"Submission not found for user {user_id}")
+        updated = canvas_request(canvas, "PUT", path, data=submission_data).json()
+    except RequestException as e:
+        # Connection errors and timeouts are wrapped like HTTP errors
+        if isinstance(e, HTTPError) and e.response is not None and e.response.status_code == 404:
+            raise ResourceNotFoundError("submission", user_id, f"Submission not found for user {user_id}")
+        logger.error("Failed to update grade: %s", e)
+        raise CanvasException(f"Failed to update grade: {e}")
+    invalidate_assignment_cache(canvas, course_id, assignment_id)
+
+    logger.info("Updated grade for user %s on assignment %s: %s", user_id, assignment_id, grade)
+
+    # Return updated submission data
+    return {
+        "id": str(updated["id"]),
+        "user_id": str(updated["user_id"]),
+        "grade": updated.get("grade"),
+        "score": updated.get("score"),
+        "workflow_state": updated.get("workflow_state", ""),
+        "success": True
+    }
+
+
+def update_grades_bulk(
+    course_id: str,
+    assignment_id: str,
+    grades: Dict[str, str],
+    comments: Optional[Dict[str, str]] = None,
+    client: Optional[CanvasClient] = None
+) -> Dict[str, Any]:
+    """
+    Update many students' grades for an assignment in one request.
+
+    Uses Canvas's bulk update_grades endpoint, which runs as a background
+    job, and waits for the job to finish.
+
+    Args:
+        course_id: Canvas course ID
+        assignment_id: Canvas assignment ID
+        grades: Grade to assign (number or letter grade) per student user ID
+        comments: Optional comment per student user ID
+        client: Optional CanvasClient instance
+
+    Returns:
+        Dict with success, workflow_state, updated count and progress_id
+    """
+    canvas = client or get_canvas_client()
+    assignment = _get_assignment(canvas, course_id, assignment_id)
+
+    grade_data = {str(user_id): {"posted_grade": grade} for user_id, grade in grades.items()}
+    for user_id, comment in (comments or {}).items():
+        if comment:
+            grade_data.setdefault(str(user_id), {})["text_comment"] = comment
+
+    if not grade_data:
+        return {"success": True, "workflow_state": "completed", "updated": 0, "progress_id": None}
+
+    try:
+        progress = assignment.submissions_bulk_update(grade_data=grade_data)
     except CanvasException as e:
-        logger.error(f"Failed to update grade: {e}")
+        logger.error("Failed to update grades: %s", e)
         raise
 
+    # Poll the job with exponential back-off
+    delay = 0.5
+    deadline = time.monotonic() + BULK_GRADE_TIMEOUT
+    while progress.workflow_state in ("queued", "running") and time.monotonic() < deadline:
+        time.sleep(delay)
+        delay = min(delay * 2, BULK_GRADE_MAX_POLL_INTERVAL)
+        progress = progress.query()
+
+    invalidate_assignment_cache(canvas, course_id, assignment_id)
+    success = progress.workflow_state == "completed"
+    if success:
+        logger.info("Updated %d grades on assignment %s", len(grade_data), assignment_id)
+    else:
+        logger.error("Bulk grade update for assignment %s ended as '%s'", assignment_id, progress.workflow_state)
+
+    return {
+        "success": success,
+        "workflow_state": progress.workflow_state,
+        "updated": len(grade_data) if success else 0,
+        "progress_id": str(progress.id),
+    }
+
 
 def delete_assignment(
     course_id: str,
@@ -476,16 +828,12 @@ def delete_assignment(
         Dict with success status and deleted assignment ID
     """
     canvas = client or get_canvas_client()
-    course = canvas.get_course(course_id)
-
-    try:
-        assignment = course.get_assignment(assignment_id)
-    except ResourceDoesNotExist:
-        raise ResourceNotFoundError("assignment", assignment_id)
+    assignment = _get_assignment(canvas, course_id, assignment_id)
 
     try:
         assignment.delete()
-        logger.info(f"Deleted assignment {assignment_id} from course {course_id}")
+        invalidate_assignment_cache(canvas, course_id, assignment_id)
+        logger.info("Deleted assignment %s from course %s", assignment_id, course_id)
         
         return {
             "success": True,
@@ -493,6 +841,6 @@ def delete_assignment(
             "message": f"Assignment {assignment_id} deleted successfully"
         }
     except CanvasException as e:
-        logger.error(f"Failed to delete assignment: {e}")
+        logger.error("Failed to delete assignment: %s", e)
         raise
 
@@ -0,0 +1,122 @@
+"""
+Cache Utilities Module
+
+Small JSON sidecar caches that sync commands keep next to local files,
+using orjson when it is installed, and an in-memory cache for Canvas
+objects that are looked up repeatedly within one process.
+"""
+
+import json
+import time
+import logging
+import threading
+from pathlib import Path
+from typing import Any, Callable, Dict, Hashable, Optional, Tuple
+
+from .file_utils import write_bytes_atomic
+
+try:
+    import orjson
+except ImportError:  # Optional; falls back to the json module
+    orjson = None
+
+logger = logging.getLogger("canvas_author.cache_utils")
+
+
+def load_json_cache(cache_path: Path) -> Dict[str, Any]:
+    """
+    Load a JSON cache file.
+
+    Args:
+        cache_path: Path to the cache file
+
+    Returns:
+        Cached data, or an empty dict if the file is missing or unreadable
+    """
+    try:
+        data = cache_path.read_bytes()
+        cache = orjson.loads(data) if orjson else json.loads(data)
+    except (OSError, ValueError):
+        return {}
+    return cache if isinstance(cache, dict) else {}
+
+
+def save_json_cache(cache_path: Path, cache: Dict[str, Any]) -> None:
+    """
+    Write a JSON cache file atomically.
+
+    Args:
+        cache_path: Path to the cache file
+        cache: Data to write
+    """
+    if orjson:
+        data = orjson.dumps(cache, option=orjson.OPT_INDENT_2)
+    else:
+        data = json.dumps(cache, indent=2).encode("utf-8")
+    write_bytes_atomic(cache_path, data)
+
+
+class TTLCache:
+    """
+    Thread-safe in-memory cache whose entries expire after a fixed time.
+
+    Keys are tuples, so related entries can be dropped together by prefix,
+    e.g. every assignment of one course.
+    """
+
+    def __init__(self, ttl: float, maxsize: int = 256):
+        self.ttl = ttl
+        self.maxsize = maxsize
+        self._lock = threading.Lock()
+        self._entries: Dict[Tuple[Hashable, ...], Tuple[float, Any]] = {}
+        self._loading: Dict[Tuple[Hashable, ...], threading.Lock] = {}
+
+    def get(self, key: Tuple[Hashable, ...]) -> Optional[Any]:
+        """Return the cached value, or None if it is missing or expired."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            if entry[0] < time.monotonic():
+                del self._entries[key]
+                return None
+            return entry[1]
+
+    def set(self, key: Tuple[Hashable, ...], value: Any) -> None:
+        """Cache a value, evicting the oldest entry when full."""
+        with self._lock:
+            self._entries.pop(key, None)
+            if len(self._entries) >= self.maxsize:
+                del self._entries[next(iter(self._entries))]
+            self._entries[key] = (time.monotonic() + self.ttl, value)
+
+    def get_or_load(self, key: Tuple[Hashable, ...], loader: Callable[[], Any]) -> Any:
+        """
+        Return the cached value, calling loader to fill a miss.
+
+        Threads that miss the same key at the same time wait for one loader
+        call instead of each making the same request. If the loader raises,
+        the error goes to the thread that called it and the others retry.
+        """
+        value = self.get(key)
+        if value is not None:
+            return value
+
+        with self._lock:
+            key_lock = self._loading.setdefault(key, threading.Lock())
+        with key_lock:
+            value = self.get(key)
+            if value is None:
+                try:
+                    value = loader()
+                    self.set(key, value)
+                finally:
+                    with self._lock:
+                        self._loading.pop(key, None)
+            return value
+
+    def invalidate(self, *prefix: Hashable) -> None:
+        """Drop every entry whose key starts with prefix (all entries if empty)."""
+        with self._lock:
+            for key in [key for key in self._entries if key[:len(prefix)] == prefix]:
+                del self._entries[key]
@@ -30,11 +30,16 @@ Markdown frontmatter:
 
 import argparse
 import asyncio
+import copy
 import json
+import os
+import re
 import sys
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from pathlib import Path
 from datetime import datetime
-from typing import Dict, Any, Optional
+from typing import Dict, Any, Iterator, List, Optional, Tuple
 
 from dotenv import load_dotenv
 
@@ -71,31 +76,45 @@ _load_env()
 from canvas_common import get_canvas_client
 from .pages import list_pages, get_page, create_page, update_page
 from .pandoc import is_pandoc_available
+from .file_utils import write_bytes_atomic, write_chunks_atomic
 from .assignments import list_courses
 from canvas_common import parse_frontmatter, generate_frontmatter
 from .sync import predict_canvas_url, update_internal_links
 from canvas_common import URLMismatchError
-from . import quiz_sync, quizzes, module_sync, course_sync, rubric_sync, submission_sync, discussion_sync, announcement_sync
 
 # Config filename
 CONFIG_FILE = ".canvas.json"
 
+# Concurrent Canvas requests when pulling pages
+CANVAS_WORKERS = 8
+
+# Start of a frontmatter block; files without one skip the YAML parse
+_FRONTMATTER_START = re.compile(r"\A\ufeff?\s*---")
+
+
+@lru_cache(maxsize=32)
+def _load_course_config_cached(path: str, mtime_ns: int) -> Dict[str, Any]:
+    """Parse a .canvas.json file; cached by path and modification time."""
+    with open(path) as f:
+        return json.load(f)
+
 
 def load_course_config(directory: Path) -> Optional[Dict[str, Any]]:
-    """Load course config from .canvas.json in directory."""
+    """Load course config from .canvas.json in directory (unchanged files are not re-read)."""
     config_path = directory / CONFIG_FILE
-    if config_path.exists():
-        with open(config_path) as f:
-            return json.load(f)
-    return None
+    try:
+        mtime_ns = config_path.stat().st_mtime_ns
+    except FileNotFoundError:
+        return None
+    # Callers may modify the config before saving it, so hand out a copy
+    return copy.deepcopy(_load_course_config_cached(str(config_path), mtime_ns))
 
 
 def save_course_config(directory: Path, config: Dict[str, Any]) -> None:
-    """Save course config to .canvas.json."""
+    """Save course config to .canvas.json, atomically so a crash never corrupts it."""
     config_path = directory / CONFIG_FILE
-    with open(config_path, "w") as f:
-        json.dump(config, f, indent=2)
-        f.write("\n")
+    write_bytes_atomic(config_path, (json.dumps(config, indent=2) + "\n").encode("utf-8"), fsync=True)
+    _load_course_config_cached.cache_clear()
 
 
 def cmd_init(args: argparse.Namespace) -> int:
@@ -140,6 +159,112 @@ def cmd_init(args: argparse.Namespace) -> int:
     return 0
 
 
+def _parse_canvas_time(timestamp: Any) -> Optional[datetime]:
+    """Parse a Canvas ISO 8601 timestamp, or return None if it cannot be read."""
+    try:
+        return datetime.fromisoformat(timestamp.replace("Z", "+00:00"))
+    except (AttributeError, TypeError, ValueError):
+        return None
+
+
+def _updated_since(updated_at: Optional[str], since: str) -> bool:
+    """
+    Check whether a Canvas timestamp is not earlier than since.
+
+    Timestamps equal to since count as updated, since Canvas only keeps whole
+    seconds and a later edit in the same second would otherwise be missed.
+    Unreadable timestamps count as updated.
+    """
+    updated = _parse_canvas_time(updated_at)
+    since_time = _parse_canvas_time(since)
+    if updated is None or since_time is None:
+        return True
+    try:
+        return updated >= since_time
+    except TypeError:
+        return True
+
+
+def _pull_watermark(pages: List[Dict[str, Any]], previous: Optional[str]) -> Optional[str]:
+    """
+    Get the watermark for the next pull from Canvas's own timestamps.
+
+    Uses the latest updated_at in the page listing rather than the local
+    clock, so clock skew between this machine and Canvas cannot hide edits.
+
+    Args:
+        pages: Page listing from Canvas
+        previous: Watermark from the last pull, kept if no page has a readable timestamp
+
+    Returns:
+        Latest updated_at as written by Canvas, or previous
+    """
+    latest = None
+    latest_time = None
+    for page_meta in pages:
+        updated = _parse_canvas_time(page_meta.get("updated_at"))
+        if updated is None or updated.tzinfo is None:
+            continue
+        if latest_time is None or updated > latest_time:
+            latest, latest_time = page_meta["updated_at"], updated
+    return latest or previous
+
+
+def _pull_page(
+    page_meta: Dict[str, Any],
+    directory: Path,
+    course_id: str,
+    client: Any,
+    course: Any,
+    args: argparse.Namespace
+) -> Tuple[str, Optional[str]]:
+    """
+    Pull one wiki page to a local markdown file.
+
+    Returns:
+        Tuple of status ('pulled', 'skipped' or 'error') and the line to print, if any
+    """
+    from . import course_sync
+
+    url = page_meta["url"]
+    filename = f"{url}.md"
+    file_path = directory / filename
+
+    try:
+        # Check if local file exists and has same page_id, before fetching the page
+        if file_path.exists() and not args.force:
+            existing_content = file_path.read_text(encoding="utf-8")
+            existing_meta, _ = parse_frontmatter(existing_content)
+
+            # Skip if same page and not forcing
+            if existing_meta.get("page_id") == str(page_meta.get("page_id", url)):
+                if not args.all:
+                    return "skipped", None
+
+        # Get full page content
+        page = get_page(course_id, url, as_markdown=True, client=client, course=course)
+
+        # Build frontmatter
+        metadata = {
+            "title": page["title"],
+            "page_id": str(page_meta.get("page_id", url)),
+            "url": url,
+            "published": page.get("published", True),
+            "updated_at": page.get("updated_at", ""),
+        }
+
+        # Transform Canvas links to local markdown links
+        body = page["body"]
+        body = course_sync.transform_links_to_local(body, course_id, client.domain)
+
+        # Write frontmatter and body as separate pieces, without joining them first
+        write_chunks_atomic(file_path, (generate_frontmatter(metadata).encode("utf-8"), body.encode("utf-8")))
+        return "pulled", f"  ✓ {filename}"
+
+    except Exception as e:
+        return "error", f"  ✗ {filename}: {e}"
+
+
 def cmd_pull(args: argparse.Namespace) -> int:
     """Pull wiki pages from Canvas to local markdown files."""
     base_directory = Path(args.dir).resolve()
@@ -182,56 +307,103 @@ def cmd_pull(args: argparse.Namespace) -> int:
     skipped = 0
     errors = 0
 
-    for page_meta in pages:
-        url = page_meta["url"]
-        filename = f"{url}.md"
-        file_path = directory / filename
+    # Pages not edited on Canvas since the last complete pull, and already
+    # pulled, are skipped without being fetched or read
+    last_pull_at = config.get("last_pull_at")
+    watermark = _pull_watermark(pages, last_pull_at)
+    if last_pull_at and not (args.force or args.all):
+        changed = [
+            page_meta for page_meta in pages
+            if _updated_since(page_meta.get("updated_at"), last_pull_at)
+            or not (directory / f"{page_meta['url']}.md").exists()
+        ]
+        skipped += len(pages) - len(changed)
+        pages = changed
+
+    # Pages are fetched and converted concurrently; results print in page order
+    with ThreadPoolExecutor(max_workers=max(1, min(CANVAS_WORKERS, len(pages)))) as executor:
+        results = executor.map(
+            lambda page_meta: _pull_page(page_meta, directory, course_id, client, course, args),
+            pages,
+        )
+        for status, line in results:
+            if line:
+                print(line)
+            if status == "pulled":
+                pulled += 1
+            elif status == "skipped":
+                skipped += 1
+            else:
+                errors += 1
+
+    # Only a pull without errors moves the watermark, so failed pages are retried
+    if errors == 0 and watermark and watermark != last_pull_at:
+        config["last_pull_at"] = watermark
+        save_course_config(base_directory, config)
+
+    print(f"\nPulled: {pulled}, Skipped: {skipped}, Errors: {errors}")
+    return 0 if errors == 0 else 1
 
-        try:
-            # Get full page content
-            page = get_page(course_id, url, as_markdown=True, client=client, course=course)
-
-            # Check if local file exists and has same page_id
-            if file_path.exists() and not args.force:
-                existing_content = file_path.read_text(encoding="utf-8")
-                existing_meta, _ = parse_frontmatter(existing_content)
-
-                # Skip if same page and not forcing
-                if existing_meta.get("page_id") == str(page_meta.get("page_id", url)):
-                    if not args.all:
-                        skipped += 1
-                        continue
 
-            # Build frontmatter
-            metadata = {
-                "title": page["title"],
-                "page_id": str(page_meta.get("page_id", url)),
-                "url": url,
-                "published": page.get("published", True),
-                "updated_at": page.get("updated_at", ""),
-            }
+def _iter_markdown_files(directory: Path) -> Iterator[Path]:
+    """
+    Yield markdown files under a directory, skipping hidden files and directories.
 
-            # Transform Canvas links to local markdown links
-            body = page["body"]
-            body = course_sync.transform_links_to_local(body, course_id, client.domain)
+    Hidden directories (.git, .venv, ...) are pruned before descending into
+    them rather than walked and filtered out afterwards.
 
-            content = generate_frontmatter(metadata) + body
+    Args:
+        directory: Directory to search
 
-            # Write file
-            file_path.write_text(content, encoding="utf-8")
-            print(f"  ✓ {filename}")
-            pulled += 1
+    Yields:
+        Paths of the markdown files found
+    """
+    with os.scandir(directory) as entries:
+        for entry in entries:
+            if entry.name.startswith("."):
+                continue
+            if entry.is_dir(follow_symlinks=False):
+                yield from _iter_markdown_files(Path(entry.path))
+            elif entry.name.endswith(".md"):
+                yield Path(entry.path)
+
+
+def _read_markdown_files(files: List[Path]) -> Dict[Path, Any]:
+    """
+    Read and parse the frontmatter of many markdown files concurrently.
 
+    Args:
+        files: Markdown files to read
+
+    Returns:
+        Dict mapping each file to its (metadata, body), or to the exception
+        raised while reading or parsing it
+    """
+    def read(file_path: Path) -> Any:
+        try:
+            content = file_path.read_text(encoding="utf-8")
+            if not _FRONTMATTER_START.match(content):
+                return {}, content
+            return parse_frontmatter(content)
         except Exception as e:
-            print(f"  ✗ {filename}: {e}")
-            errors += 1
+            return e
+
+    with ThreadPoolExecutor(max_workers=max(1, min(CANVAS_WORKERS, len(files)))) as executor:
+        return dict(zip(files, executor.map(read, files)))
 
-    print(f"\nPulled: {pulled}, Skipped: {skipped}, Errors: {errors}")
-    return 0 if errors == 0 else 1
+
+def _parsed(parsed_files: Dict[Path, Any], file_path: Path) -> Tuple[Dict[str, Any], str]:
+    """Get a file's (metadata, body) from _read_markdown_files, re-raising its read error."""
+    result = parsed_files[file_path]
+    if isinstance(result, Exception):
+        raise result
+    return result
 
 
 def cmd_push(args: argparse.Namespace) -> int:
     """Push local markdown files to Canvas wiki pages."""
+    from . import course_sync
+
     base_directory = Path(args.dir).resolve()
 
     # Load config from base directory
@@ -262,21 +434,23 @@ def cmd_push(args: argparse.Namespace) -> int:
     try:
         client = get_canvas_client()
         course = client.get_course(course_id)  # Fetch once and reuse
-        canvas_pages = {p["url"]: p for p in list_pages(course_id, client, course=course)}
+        # Only each page's updated_at is needed, for change detection
+        canvas_updated_at = {p["url"]: p.get("updated_at") for p in list_pages(course_id, client, course=course)}
     except Exception as e:
         print(f"Error fetching Canvas pages: {e}")
         return 1
 
     # Find local markdown files (recursive)
-    md_files = list(directory.rglob("*.md"))
-    # Exclude modules.yaml-related files and hidden directories
-    md_files = [f for f in md_files if not any(p.startswith('.') for p in f.relative_to(directory).parts)]
+    md_files = list(_iter_markdown_files(directory))
     if not md_files:
         print("No markdown files found in directory")
         return 0
 
     print(f"Found {len(md_files)} markdown files")
 
+    # Read and parse every file up front, concurrently
+    parsed_files = _read_markdown_files(md_files)
+
     # Check for changed files using mtime vs Canvas updated_at
     use_change_detection = False
     changed_files = set()
@@ -287,10 +461,10 @@ def cmd_push(args: argparse.Namespace) -> int:
 
             # Build map of Canvas page updated times
             canvas_updated = {}
-            for url, page_info in canvas_pages.items():
-                if page_info.get('updated_at'):
+            for url, updated_at in canvas_updated_at.items():
+                if updated_at:
                     try:
-                        canvas_time = dateutil.parser.parse(page_info['updated_at'])
+                        canvas_time = dateutil.parser.parse(updated_at)
                         canvas_updated[url] = canvas_time
                     except:
                         pass
@@ -299,8 +473,7 @@ def cmd_push(args: argparse.Namespace) -> int:
             for file_path in md_files:
                 relative_path = file_path.relative_to(directory)
                 try:
-                    content = file_path.read_text(encoding="utf-8")
-                    metadata, _ = parse_frontmatter(content)
+                    metadata, _ = _parsed(parsed_files, file_path)
                     url = metadata.get("canvas_url") or metadata.get("url") or file_path.stem
 
                     # Get file modification time
@@ -328,8 +501,7 @@ def cmd_push(args: argparse.Namespace) -> int:
     for file_path in sorted(md_files):
         relative_path = file_path.relative_to(directory)
         try:
-            content = file_path.read_text(encoding="utf-8")
-            metadata, body = parse_frontmatter(content)
+            metadata, body = _parsed(parsed_files, file_path)
 
             if not body.strip():
                 print(f"  - {relative_path}: empty, skipping")
@@ -352,10 +524,10 @@ def cmd_push(args: argparse.Namespace) -> int:
             # Transform local links to Canvas links
             body_for_canvas = course_sync.transform_links_to_canvas(body, course_id, client.domain)
 
-            if url in canvas_pages:
+            if url in canvas_updated_at:
                 # Update existing page
                 if not args.create_only:
-                    update_page(
+                    result = update_page(
                         course_id=course_id,
                         page_url=url,
                         title=title,
@@ -370,14 +542,13 @@ def cmd_push(args: argparse.Namespace) -> int:
 
                     # Update local frontmatter with latest info
                     if not args.no_update_meta:
-                        page = get_page(course_id, url, as_markdown=False, client=client, course=course)
-                        metadata["updated_at"] = page.get("updated_at", "")
+                        # update_page returns the edited page, so no second request is needed
+                        metadata["updated_at"] = result.get("updated_at", "")
                         new_content = generate_frontmatter(metadata) + body
 
                         # Preserve original mtime so change detection works on next push
                         original_stat = file_path.stat()
                         file_path.write_text(new_content, encoding="utf-8")
-                        import os
                         os.utime(file_path, (original_stat.st_atime, original_stat.st_mtime))
                 else:
                     skipped += 1
@@ -539,16 +710,16 @@ def cmd_status(args: argparse.Namespace) -> int:
     # Get Canvas pages
     try:
         client = get_canvas_client()
-        canvas_pages = {p["url"]: p for p in list_pages(course_id, client)}
+        canvas_urls = {p["url"] for p in list_pages(course_id, client)}
     except Exception as e:
         print(f"Error fetching Canvas pages: {e}")
         return 1
 
     # Get local files
     local_files = {}
-    for file_path in directory.glob("*.md"):
-        content = file_path.read_text(encoding="utf-8")
-        metadata, body = parse_frontmatter(content)
+    parsed_files = _read_markdown_files(list(directory.glob("*.md")))
+    for file_path in parsed_files:
+        metadata, body = _parsed(parsed_files, file_path)
         url = metadata.get("url") or file_path.stem
         local_files[url] = {
             "file": file_path.name,
@@ -557,14 +728,14 @@ def cmd_status(args: argparse.Namespace) -> int:
         }
 
     # Compare
-    all_urls = set(canvas_pages.keys()) | set(local_files.keys())
+    all_urls = canvas_urls | local_files.keys()
 
     canvas_only = []
     local_only = []
     synced = []
 
     for url in sorted(all_urls):
-        in_canvas = url in canvas_pages
+        in_canvas = url in canvas_urls
         in_local = url in local_files
 
         if in_canvas and in_local:
@@ -615,6 +786,8 @@ def cmd_list_courses(args: argparse.Namespace) -> int:
 
 def cmd_pull_quizzes(args: argparse.Namespace) -> int:
     """Pull quizzes from Canvas to local markdown files."""
+    from . import quiz_sync
+
     directory = Path(args.dir).resolve()
 
     # Load config
@@ -656,6 +829,8 @@ def cmd_pull_quizzes(args: argparse.Namespace) -> int:
 
 def cmd_push_quizzes(args: argparse.Namespace) -> int:
     """Push local quiz markdown files to Canvas."""
+    from . import quiz_sync
+
     directory = Path(args.dir).resolve()
 
     # Load config
@@ -708,6 +883,8 @@ def cmd_push_quizzes(args: argparse.Namespace) -> int:
 
 def cmd_quiz_status(args: argparse.Namespace) -> int:
     """Show sync status for quizzes."""
+    from . import quiz_sync
+
     directory = Path(args.dir).resolve()
 
     # Load config
@@ -759,6 +936,8 @@ def cmd_quiz_status(args: argparse.Namespace) -> int:
 
 def cmd_list_quizzes(args: argparse.Namespace) -> int:
     """List quizzes in a course."""
+    from . import quizzes
+
     directory = Path(args.dir).resolve()
 
     # Load config
@@ -793,6 +972,8 @@ def cmd_list_quizzes(args: argparse.Namespace) -> int:
 
 def cmd_pull_modules(args: argparse.Namespace) -> int:
     """Pull modules from Canvas to modules.yaml."""
+    from . import module_sync
+
     directory = Path(args.dir).resolve()
 
     # Load config
@@ -819,6 +1000,8 @@ def cmd_pull_modules(args: argparse.Namespace) -> int:
 
 def cmd_push_modules(args: argparse.Namespace) -> int:
     """Push modules.yaml to Canvas."""
+    from . import module_sync
+
     directory = Path(args.dir).resolve()
 
     # Load config
@@ -867,6 +1050,8 @@ def cmd_push_modules(args: argparse.Namespace) -> int:
 
 def cmd_pull_course(args: argparse.Namespace) -> int:
     """Pull course settings from Canvas to course.yaml."""
+    from . import course_sync
+
     directory = Path(args.dir).resolve()
 
     # Load config to get course_id
@@ -900,6 +1085,8 @@ def cmd_pull_course(args: argparse.Namespace) -> int:
 
 def cmd_push_course(args: argparse.Namespace) -> int:
     """Push course.yaml settings to Canvas."""
+    from . import course_sync
+
     directory = Path(args.dir).resolve()
 
     print(f"Pushing course settings from {directory}")
@@ -952,6 +1139,8 @@ def cmd_push_course(args: argparse.Namespace) -> int:
 
 def cmd_course_status(args: argparse.Namespace) -> int:
     """Show course settings sync status."""
+    from . import course_sync
+
     directory = Path(args.dir).resolve()
 
     print(f"Course settings status for {directory}\n")
@@ -999,6 +1188,8 @@ def cmd_course_status(args: argparse.Namespace) -> int:
 
 def cmd_module_status(args: argparse.Namespace) -> int:
     """Show module sync status."""
+    from . import module_sync
+
     directory = Path(args.dir).resolve()
 
     # Load config
@@ -1045,6 +1236,8 @@ def cmd_module_status(args: argparse.Namespace) -> int:
 
 def cmd_pull_submissions(args: argparse.Namespace) -> int:
     """Pull submissions from Canvas for an assignment."""
+    from . import submission_sync
+
     directory = Path(args.dir).resolve()
 
     # Load config
@@ -1093,6 +1286,8 @@ def cmd_pull_submissions(args: argparse.Namespace) -> int:
 
 def cmd_submission_status(args: argparse.Namespace) -> int:
     """Show submission status for an assignment."""
+    from . import submission_sync
+
     directory = Path(args.dir).resolve()
 
     # Load config
@@ -1141,6 +1336,8 @@ def cmd_submission_status(args: argparse.Namespace) -> int:
 
 def cmd_pull_rubrics(args: argparse.Namespace) -> int:
     """Pull rubrics from Canvas to local YAML files."""
+    from . import rubric_sync
+
     directory = Path(args.dir).resolve()
 
     # Load config
@@ -1186,6 +1383,8 @@ def cmd_pull_rubrics(args: argparse.Namespace) -> int:
 
 def cmd_push_rubrics(args: argparse.Namespace) -> int:
     """Push local YAML rubric files to Canvas."""
+    from . import rubric_sync
+
     directory = Path(args.dir).resolve()
 
     # Load config
@@ -1237,6 +1436,8 @@ def cmd_push_rubrics(args: argparse.Namespace) -> int:
 
 def cmd_rubric_status(args: argparse.Namespace) -> int:
     """Show sync status for rubrics."""
+    from . import rubric_sync
+
     directory = Path(args.dir).resolve()
 
     # Load config
@@ -1289,6 +1490,8 @@ def cmd_rubric_status(args: argparse.Namespace) -> int:
 
 def cmd_pull_discussions(args: argparse.Namespace) -> int:
     """Pull discussions from Canvas."""
+    from . import discussion_sync
+
     directory = Path(args.dir).resolve()
     config = load_course_config(directory)
     if not config:
@@ -1324,6 +1527,8 @@ def cmd_pull_discussions(args: argparse.Namespace) -> int:
 
 def cmd_push_discussions(args: argparse.Namespace) -> int:
     """Push discussions to Canvas."""
+    from . import discussion_sync
+
     directory = Path(args.dir).resolve()
     config = load_course_config(directory)
     if not config:
@@ -1364,6 +1569,8 @@ def cmd_push_discussions(args: argparse.Namespace) -> int:
 
 def cmd_pull_announcements(args: argparse.Namespace) -> int:
     """Pull announcements from Canvas."""
+    from . import announcement_sync
+
     directory = Path(args.dir).resolve()
     config = load_course_config(directory)
     if not config:
@@ -1399,6 +1606,8 @@ def cmd_pull_announcements(args: argparse.Namespace) -> int:
 
 def cmd_push_announcements(args: argparse.Namespace) -> int:
     """Push announcements to Canvas."""
+    from . import announcement_sync
+
     directory = Path(args.dir).resolve()
     config = load_course_config(directory)
     if not config:
@@ -1607,7 +1816,8 @@ def cmd_push_assignments(args: argparse.Namespace) -> int:
         course_id=course_id,
         input_dir=str(assignments_directory),
         create_missing=create_missing,
-        update_existing=update_existing
+        update_existing=update_existing,
+        force=args.force
     )
 
     print(f"\nCreated: {result['created']}, Updated: {result['updated']}, Skipped: {result['skipped']}, Errors: {result['errors']}")
@@ -1721,6 +1931,7 @@ def main() -> int:
     push_assignments_parser.add_argument("--dir", "-d", default=".", help="Course directory (default: current)")
     push_assignments_parser.add_argument("--create-only", action="store_true", help="Only create new assignments")
     push_assignments_parser.add_argument("--update-only", action="store_true", help="Only update existing assignments")
+    push_assignments_parser.add_argument("--force", "-f", action="store_true", help="Push all files, even unchanged")
 
     # assignment-status command
     assignment_status_parser = subparsers.add_parser("assignment-status", help="Show assignment sync status")
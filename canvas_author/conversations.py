@@ -11,6 +11,8 @@ from canvasapi.exceptions import CanvasException
 from canvas_common import get_canvas_client, CanvasClient
 from canvas_common import ResourceNotFoundError
 
+from .http_utils import get_http_session
+
 logger = logging.getLogger("canvas_author.conversations")
 
 
@@ -116,8 +118,7 @@ def send_conversation(
             "group_conversation": False,  # Individual messages to each recipient
         }
 
-        import requests
-        response = requests.post(api_url, headers=headers, data=data)
+        response = get_http_session().post(api_url, headers=headers, data=data)
         response.raise_for_status()
 
         result = response.json()
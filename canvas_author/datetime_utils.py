@@ -7,6 +7,7 @@ format expected by Canvas API.
 
 import logging
 from datetime import datetime
+from functools import lru_cache
 from typing import Optional, Union
 try:
     from zoneinfo import ZoneInfo
@@ -19,7 +20,11 @@ logger = logging.getLogger("canvas_author.datetime_utils")
 # Default timezone for course (Eastern Time)
 DEFAULT_TIMEZONE = "America/New_York"
 
+# Converted strings are cached; a sync converts the same few dates many times
+CONVERSION_CACHE_SIZE = 4096
 
+
+@lru_cache(maxsize=CONVERSION_CACHE_SIZE)
 def convert_to_iso8601(
     dt_string: Optional[str],
     timezone: str = DEFAULT_TIMEZONE,
@@ -149,6 +154,7 @@ def convert_to_datetime(
         return None
 
 
+@lru_cache(maxsize=CONVERSION_CACHE_SIZE)
 def convert_from_iso8601(
     iso_string: Optional[str],
     timezone: str = DEFAULT_TIMEZONE
@@ -44,23 +44,23 @@ def create_discussion_frontmatter(
         lines.append(f"assignment_id: {discussion['assignment_id']}")
 
     lines.append(f"discussion_type: {discussion.get('discussion_type', 'threaded')}")
-    lines.append(f"published: {str(discussion.get('published', False)).lower()}")
+    lines.append(f"published: {'true' if discussion.get('published') else 'false'}")
 
     # Discussion-specific fields
     if discussion.get('require_initial_post'):
-        lines.append(f"require_initial_post: {str(discussion['require_initial_post']).lower()}")
+        lines.append("require_initial_post: true")
 
     if discussion.get('reply_to_entry_required_count'):
         lines.append(f"reply_to_entry_required_count: {discussion['reply_to_entry_required_count']}")
 
     if discussion.get('pinned'):
-        lines.append(f"pinned: {str(discussion['pinned']).lower()}")
+        lines.append("pinned: true")
 
     if discussion.get('locked'):
-        lines.append(f"locked: {str(discussion['locked']).lower()}")
+        lines.append("locked: true")
 
     if discussion.get('is_checkpointed'):
-        lines.append(f"is_checkpointed: {str(discussion['is_checkpointed']).lower()}")
+        lines.append("is_checkpointed: true")
 
     # Assignment fields (for graded discussions)
     if assignment:
@@ -79,7 +79,7 @@ def create_discussion_frontmatter(
                 lines.append(f"  - tag: {checkpoint['tag']}")
                 lines.append(f"    points_possible: {checkpoint['points_possible']}")
                 if checkpoint.get('only_visible_to_overrides'):
-                    lines.append(f"    only_visible_to_overrides: {str(checkpoint['only_visible_to_overrides']).lower()}")
+                    lines.append("    only_visible_to_overrides: true")
                 if checkpoint.get('due_at'):
                     due_at = convert_from_iso8601(checkpoint['due_at'])
                     if due_at:
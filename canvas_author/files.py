@@ -12,13 +12,14 @@ import logging
 import hashlib
 import json
 import mimetypes
-import requests
 from pathlib import Path
 from typing import Dict, Any, Optional, Tuple, List
 from urllib.parse import urlparse, unquote
 
 from canvas_common import get_canvas_client, CanvasClient
 
+from .http_utils import get_http_session
+
 logger = logging.getLogger("canvas_author.files")
 
 # Default size threshold for automatic download (2MB)
@@ -183,7 +184,7 @@ def download_file(
 
         # Download the file
         download_url = file_obj.url
-        response = requests.get(download_url, stream=True, timeout=60)
+        response = get_http_session().get(download_url, stream=True, timeout=60)
         response.raise_for_status()
 
         with open(output_path, 'wb') as f:
@@ -0,0 +1,221 @@
+"""
+HTTP Utilities Module
+
+One shared requests session for the Canvas calls this package makes
+outside canvasapi (file downloads, rubric and conversation posts, and
+raw JSON listings).
+"""
+
+import logging
+import threading
+from typing import Any, Dict, Hashable, Iterator, List, Optional, Tuple
+
+import requests
+from canvasapi.exceptions import (
+    BadRequest,
+    CanvasException,
+    Conflict,
+    Forbidden,
+    InvalidAccessToken,
+    RateLimitExceeded,
+    ResourceDoesNotExist,
+    Unauthorized,
+    UnprocessableEntity,
+)
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+from .cache_utils import TTLCache
+
+logger = logging.getLogger("canvas_author.http_utils")
+
+# Connections kept open per host; enough for the sync worker pools
+POOL_SIZE = 32
+
+# Retries for throttled or failed requests. Only GET and HEAD are retried:
+# a PUT or POST that failed after Canvas applied it (a grade comment, a
+# conversation) would otherwise be sent twice
+RETRY = Retry(
+    total=5,
+    backoff_factor=0.3,
+    status_forcelist=[429, 500, 502, 503, 504],
+    allowed_methods=frozenset({"GET", "HEAD"}),
+    respect_retry_after_header=True,
+)
+
+# Listing pages kept for revalidation with If-None-Match; entries hold
+# the ETag, the parsed page and the next page's URL. The MCP server runs
+# for a long time, so few pages are kept, briefly, and large ones not at all
+ETAG_CACHE_TTL = 600
+ETAG_CACHE_SIZE = 64
+MAX_CACHED_PAGE_BYTES = 256_000
+
+_session: Optional[requests.Session] = None
+_session_lock = threading.Lock()
+_etag_cache = TTLCache(ETAG_CACHE_TTL, maxsize=ETAG_CACHE_SIZE)
+
+
+def get_http_session() -> requests.Session:
+    """
+    Get the process-wide requests session, creating it on first use.
+
+    Reusing one session keeps HTTPS connections to Canvas alive between
+    requests, so each download or post after the first skips the TCP and
+    TLS handshakes.
+
+    Returns:
+        Shared requests.Session
+    """
+    global _session
+    if _session is None:
+        with _session_lock:
+            if _session is None:
+                session = requests.Session()
+                adapter = HTTPAdapter(pool_connections=POOL_SIZE, pool_maxsize=POOL_SIZE, max_retries=RETRY)
+                session.mount("https://", adapter)
+                session.mount("http://", adapter)
+                _session = session
+                logger.debug("Created shared HTTP session")
+    return _session
+
+
+def canvas_request(canvas: Any, method: str, path: str, **kwargs: Any) -> requests.Response:
+    """
+    Send one Canvas API request over the shared session.
+
+    Args:
+        canvas: Canvas client, for its domain and token
+        method: HTTP method
+        path: API path after /api/v1/, or a full URL (e.g. a Link header's next page)
+        **kwargs: Passed on to requests (params, data, timeout)
+
+    Returns:
+        The response, after checking its status
+
+    Raises:
+        requests.HTTPError: If Canvas returns an error status
+    """
+    url = path if path.startswith("https://") else f"https://{canvas.domain}/api/v1/{path}"
+    headers = {"Authorization": f"Bearer {canvas.token}", **kwargs.pop("headers", {})}
+    kwargs.setdefault("timeout", 60)
+    response = get_http_session().request(method, url, headers=headers, **kwargs)
+    response.raise_for_status()
+    return response
+
+
+def canvas_error(error: requests.RequestException) -> CanvasException:
+    """
+    Convert a failed raw request to the exception canvasapi raises for it.
+
+    Status codes map as in canvasapi's Requester, so callers that catch
+    CanvasException (or Unauthorized, Forbidden, ...) handle requests sent
+    through this module like canvasapi calls.
+
+    Args:
+        error: Exception from canvas_request or iter_canvas_pages
+
+    Returns:
+        The matching CanvasException subclass instance
+    """
+    response = error.response
+    if response is None:
+        return CanvasException(f"Request to Canvas failed: {error}")
+
+    status = response.status_code
+    if status == 401:
+        if "WWW-Authenticate" in response.headers:
+            return InvalidAccessToken(response.text)
+        return Unauthorized(response.text)
+    if status == 403 and "Rate Limit Exceeded" in response.text:
+        return RateLimitExceeded(response.text)
+    if status == 404:
+        return ResourceDoesNotExist("Not Found")
+    if status == 429:
+        return RateLimitExceeded(
+            f"Rate Limit Exceeded. X-Rate-Limit-Remaining: {response.headers.get('X-Rate-Limit-Remaining', 'Unknown')}"
+        )
+    exception_type = {400: BadRequest, 403: Forbidden, 409: Conflict, 422: UnprocessableEntity}.get(status)
+    if exception_type:
+        return exception_type(response.text)
+    return CanvasException(f"Encountered an error: status code {status}")
+
+
+def _params_key(params: Optional[Dict[str, Any]]) -> Tuple[Hashable, ...]:
+    """Turn query parameters into a hashable cache key part."""
+    if not params:
+        return ()
+    return tuple(sorted(
+        (name, tuple(value) if isinstance(value, list) else value)
+        for name, value in params.items()
+    ))
+
+
+def _get_page(
+    canvas: Any,
+    url: str,
+    params: Optional[Dict[str, Any]],
+    timeout: float
+) -> Tuple[List[Dict[str, Any]], Optional[str]]:
+    """
+    Get one listing page, revalidating a previously seen page by its ETag.
+
+    Returns:
+        The page's JSON objects and the next page's URL, if any
+    """
+    key = (canvas.domain, canvas.token, url, _params_key(params))
+    cached = _etag_cache.get(key)
+    headers = {"If-None-Match": cached[0]} if cached else {}
+
+    response = canvas_request(canvas, "GET", url, params=params, headers=headers, timeout=timeout)
+    if cached and response.status_code == 304:
+        return cached[1], cached[2]
+
+    page = response.json()
+    next_url = response.links.get("next", {}).get("url")
+    etag = response.headers.get("ETag")
+    if etag and len(response.content) <= MAX_CACHED_PAGE_BYTES:
+        _etag_cache.set(key, (etag, page, next_url))
+    return page, next_url
+
+
+def iter_canvas_pages(
+    canvas: Any,
+    path: str,
+    params: Optional[Dict[str, Any]] = None,
+    timeout: float = 60,
+    revalidate: bool = False
+) -> Iterator[Dict[str, Any]]:
+    """
+    Yield the JSON objects of a paginated Canvas listing, page by page.
+
+    For read-only listings whose results are turned straight into dicts,
+    this skips canvasapi's per-object wrapping and attribute setting.
+
+    Args:
+        canvas: Canvas client, for its domain and token
+        path: API path after /api/v1/, e.g. "courses/1/assignments/2/submissions"
+        params: Query parameters for the first page; later pages come from the Link header
+        timeout: Seconds to wait for each page
+        revalidate: Keep each page with its ETag and send If-None-Match when
+            it is requested again, so an unchanged page comes back as an
+            empty 304 instead of the full body. Meant for listings that
+            callers poll repeatedly.
+
+    Yields:
+        Raw JSON objects from each page
+
+    Raises:
+        requests.HTTPError: If Canvas returns an error status
+    """
+    url: Optional[str] = path
+
+    while url:
+        if revalidate:
+            page, next_url = _get_page(canvas, url, params, timeout)
+        else:
+            response = canvas_request(canvas, "GET", url, params=params, timeout=timeout)
+            page = response.json()
+            next_url = response.links.get("next", {}).get("url")
+        yield from page
+        url = next_url
+        params = None
@@ -14,6 +14,9 @@ from canvas_common import ResourceNotFoundError, APIError
 
 logger = logging.getLogger("canvas_author.pages")
 
+# Items per page for listings; Canvas defaults to 10 and caps at 100
+PER_PAGE = 100
+
 
 def list_pages(course_id: str, client: Optional[CanvasClient] = None, course=None) -> List[Dict[str, Any]]:
     """
@@ -30,7 +33,7 @@ def list_pages(course_id: str, client: Optional[CanvasClient] = None, course=Non
     if course is None:
         canvas = client or get_canvas_client()
         course = canvas.get_course(course_id)
-    pages = course.get_pages()
+    pages = course.get_pages(per_page=PER_PAGE)
 
     result = []
     for page in pages:
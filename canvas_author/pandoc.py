@@ -5,13 +5,37 @@ Provides markdown <-> HTML conversion using pandoc with optional inline CSS styl
 Canvas LMS strips <style> tags, so styles are inlined directly on elements.
 """
 
+import re
 import subprocess
 import logging
 import shutil
-from typing import Optional, Dict
+from functools import lru_cache
+from typing import Optional, Dict, Tuple
 
 logger = logging.getLogger("canvas_author.pandoc")
 
+# HTML made only of <p> paragraphs whose text has no markdown-significant
+# characters or entities, so it converts to markdown without pandoc
+_PLAIN_PARAGRAPHS_RE = re.compile(r"\s*(?:<p>[^<>&*_`\\\[\]#|~^$]*</p>\s*)+")
+_PARAGRAPH_TEXT_RE = re.compile(r"<p>([^<]*)</p>")
+# Paragraph openings pandoc would escape (list items, quotes, headings)
+_BLOCK_START_RE = re.compile(r"[-+>=]|\d+[.)]")
+
+# Markdown made only of word characters, single spaces and punctuation with
+# no markdown meaning
+_PLAIN_MARKDOWN_RE = re.compile(r"(?:[^\W_]|[,.;:!?()/%-]| (?! )|\n)+")
+# Text pandoc's smart typography changes: dashes, ellipses, and short or
+# dotted words like "Dr." or "e.g." that get a non-breaking space after them
+_SMART_PUNCTUATION_RE = re.compile(r"--|\.\.\.|(?<![^\s(])(?:\w{1,4}|\w+(?:\.\w+)+)\.\s")
+# Line openings pandoc would read as a list, definition, title block or code
+_MARKDOWN_BLOCK_START_RE = re.compile(r"[-+*:~%|>(\s]|\S*[.)](?:\s|$)")
+
+# Recent conversions are cached by input, for bodies converted more than
+# once in a run; larger inputs are converted every time. Kept small so the
+# cache stays at a few MB in the long-running MCP server.
+CONVERSION_CACHE_SIZE = 128
+MAX_CACHED_INPUT = 16_000
+
 
 def _check_pandoc() -> bool:
     """Check if pandoc is available."""
@@ -60,25 +84,14 @@ def markdown_to_html(
     if standalone:
         cmd.append("-s")
 
-    try:
-        result = subprocess.run(
-            cmd,
-            input=markdown,
-            capture_output=True,
-            text=True,
-            check=True,
-        )
-        html = result.stdout
+    html = _convert(markdown, tuple(cmd))
 
-        # Apply inline styles if requested
-        if apply_styles:
-            from .styling import inline_styles
-            html = inline_styles(html, css=custom_css, preset=style_preset)
+    # Apply inline styles if requested
+    if apply_styles:
+        from .styling import inline_styles
+        html = inline_styles(html, css=custom_css, preset=style_preset)
 
-        return html
-    except subprocess.CalledProcessError as e:
-        logger.error(f"Pandoc conversion failed: {e.stderr}")
-        raise RuntimeError(f"Pandoc conversion failed: {e.stderr}")
+    return html
 
 
 def html_to_markdown(html: str, wrap: Optional[int] = None) -> str:
@@ -104,10 +117,27 @@ def html_to_markdown(html: str, wrap: Optional[int] = None) -> str:
     else:
         cmd.append("--wrap=none")
 
+    return _convert(html, tuple(cmd))
+
+
+def _run_pandoc(text: str, cmd: Tuple[str, ...]) -> str:
+    """
+    Run one conversion through the pandoc command line.
+
+    Args:
+        text: Content to convert
+        cmd: pandoc command line
+
+    Returns:
+        Converted content
+
+    Raises:
+        RuntimeError: If conversion fails
+    """
     try:
         result = subprocess.run(
-            cmd,
-            input=html,
+            list(cmd),
+            input=text,
             capture_output=True,
             text=True,
             check=True,
@@ -118,6 +148,68 @@ def html_to_markdown(html: str, wrap: Optional[int] = None) -> str:
         raise RuntimeError(f"Pandoc conversion failed: {e.stderr}")
 
 
+_run_pandoc_cached = lru_cache(maxsize=CONVERSION_CACHE_SIZE)(_run_pandoc)
+
+
+def _convert(text: str, cmd: Tuple[str, ...]) -> str:
+    """Run a conversion, reusing the cached result for inputs seen recently."""
+    if len(text) > MAX_CACHED_INPUT:
+        return _run_pandoc(text, cmd)
+    return _run_pandoc_cached(text, cmd)
+
+
+def trivial_html_to_markdown(html: str) -> Optional[str]:
+    """
+    Convert HTML made only of plain-text paragraphs to markdown without pandoc.
+
+    Short Canvas messages like "<p>Quiz moved to Friday.</p>" are common, and
+    spawning pandoc for them costs far more than the conversion itself.
+
+    Args:
+        html: HTML content to convert
+
+    Returns:
+        Markdown content, or None if the HTML needs a full pandoc conversion
+    """
+    if not _PLAIN_PARAGRAPHS_RE.fullmatch(html):
+        return None
+
+    paragraphs = [" ".join(text.split()) for text in _PARAGRAPH_TEXT_RE.findall(html)]
+    if any(not text or _BLOCK_START_RE.match(text) for text in paragraphs):
+        return None
+
+    return "\n\n".join(paragraphs) + "\n"
+
+
+def trivial_markdown_to_html(markdown: str) -> Optional[str]:
+    """
+    Convert markdown made only of plain-text paragraphs to HTML without pandoc.
+
+    Gives the same HTML as pandoc for bodies like "Submit a one-page
+    reflection." Pandoc may rewrap long lines differently, which does not
+    change how the HTML renders.
+
+    Args:
+        markdown: Markdown content to convert
+
+    Returns:
+        HTML content, or None if the markdown needs a full pandoc conversion
+    """
+    text = markdown.strip("\n")
+    if not _PLAIN_MARKDOWN_RE.fullmatch(text) or _SMART_PUNCTUATION_RE.search(text):
+        return None
+
+    paragraphs = []
+    for paragraph in re.split(r"\n\n+", text):
+        lines = paragraph.split("\n")
+        if any(not line or line.endswith(" ") or _MARKDOWN_BLOCK_START_RE.match(line) for line in lines):
+            return None
+        paragraphs.append("<p>" + "\n".join(lines) + "</p>")
+
+    return "\n".join(paragraphs) + "\n"
+
+
+@lru_cache(maxsize=1)
 def is_pandoc_available() -> bool:
-    """Check if pandoc is available on the system."""
+    """Check if pandoc is available on the system (checked once per process)."""
     return _check_pandoc()
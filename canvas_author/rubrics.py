@@ -5,13 +5,14 @@ Operations for Canvas rubrics including get, update, and publish.
 """
 
 import logging
-import requests
 from typing import Dict, Any, Optional, Tuple, List
 from canvasapi.exceptions import ResourceDoesNotExist, CanvasException
 
 from canvas_common import get_canvas_client, CanvasClient
 from canvas_common import ResourceNotFoundError, APIError
 
+from .http_utils import get_http_session
+
 logger = logging.getLogger("canvas_author.rubrics")
 
 
@@ -162,7 +163,7 @@ async def update_rubric(
         url = f'https://{canvas.domain}/api/v1/courses/{course_id}/rubrics'
 
         logger.debug(f"Sending rubric update to Canvas")
-        response = requests.post(url, headers=headers, data=api_data)
+        response = get_http_session().post(url, headers=headers, data=api_data)
 
         if 200 <= response.status_code < 300:
             logger.info(f"Successfully updated rubric for assignment {assignment_id}")
@@ -12,6 +12,11 @@ from datetime import datetime, timedelta
 
 from mcp.server import FastMCP
 
+try:
+    import orjson
+except ImportError:  # Optional; falls back to the json module
+    orjson = None
+
 from . import pages, assignments, assignment_groups, discussions, rubrics, sync, quizzes, quiz_sync, course_sync, rubric_sync, submission_sync, module_sync, assignment_sync, files as files_module, discussion_sync, announcement_sync, draft_storage, conversations
 from .pandoc import is_pandoc_available
 from .workflow import (
@@ -38,6 +43,13 @@ _submissions_cache: Dict[str, Tuple[Any, datetime]] = {}
 _CACHE_TTL_SECONDS = 30  # Cache for 30 seconds to avoid redundant API calls
 
 
+def _to_json(result: Any) -> str:
+    """Serialize a tool result as indented JSON, with orjson when it is installed."""
+    if orjson:
+        return orjson.dumps(result, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS).decode("utf-8")
+    return json.dumps(result, indent=2)
+
+
 # =============================================================================
 # Wiki Pages Tools
 # =============================================================================
@@ -55,7 +67,7 @@ def list_pages(course_id: str) -> str:
     """
     try:
         result = pages.list_pages(course_id)
-        return json.dumps(result, indent=2)
+        return _to_json(result)
     except Exception as e:
         return json.dumps({"error": str(e)})
 
@@ -75,7 +87,7 @@ def get_page(course_id: str, page_url: str, as_markdown: bool = True) -> str:
     """
     try:
         result = pages.get_page(course_id, page_url, as_markdown=as_markdown)
-        return json.dumps(result, indent=2)
+        return _to_json(result)
     except Exception as e:
         return json.dumps({"error": str(e)})
 
@@ -105,7 +117,7 @@ def create_page(
             from_markdown=True,
             published=published
         )
-        return json.dumps(result, indent=2)
+        return _to_json(result)
     except Exception as e:
         return json.dumps({"error": str(e)})
 
@@ -139,7 +151,7 @@ def update_page(
             from_markdown=True,
             published=published
         )
-        return json.dumps(result, indent=2)
+        return _to_json(result)
     except Exception as e:
         return json.dumps({"error": str(e)})
 
@@ -178,7 +190,7 @@ def bulk_delete_pages(course_id: str, page_urls: str) -> str:
     try:
         urls_list = [url.strip() for url in page_urls.split(",")]
         result = pages.bulk_delete_pages(course_id, urls_list)
-        return json.dumps(result, indent=2)
+        return _to_json(result)
     except Exception as e:
         return json.dumps({"error": str(e)})
 
@@ -209,7 +221,7 @@ def pull_pages(
     """
     try:
         result = sync.pull_pages(course_id, output_dir, overwrite=overwrite, download_images=download_images)
-        return json.dumps(result, indent=2)
+        return _to_json(result)
     except Exception as e:
         return json.dumps({"error": str(e)})
 
@@ -252,7 +264,7 @@ def push_pages(
             upload_images=upload_images,
             validate_links=validate_links
         )
-        return json.dumps(result, indent=2)
+        return _to_json(result)
     except Exception as e:
         return json.dumps({"error": str(e)})
 
@@ -271,7 +283,7 @@ def sync_status(course_id: str, local_dir: str) -> str:
     """
     try:
         result = sync.sync_status(course_id, local_dir)
-        return json.dumps(result, indent=2)
+        return _to_json(result)
     except Exception as e:
         return json.dumps({"error": str(e)})
 
@@ -292,7 +304,7 @@ def init_course(course_id: str, directory: str) -> str:
     """
     try:
         result = course_sync.init_course(course_id, directory)
-        return json.dumps(result, indent=2)
+        return _to_json(result)
     except Exception as e:
         return json.dumps({"error": str(e)})
 
@@ -314,7 +326,7 @@ def pull_course(course_id: str, directory: str) -> str:
     """
     try:
         result = course_sync.pull_course(course_id, directory, interactive=False)
-        return json.dumps(result, indent=2)
+        return _to_json(result)
     except Exception as e:
         return json.dumps({"error": str(e)})
 
@@ -335,7 +347,7 @@ def push_course(directory: str) -> str:
     """
     try:
         result = course_sync.push_course(directory, interactive=False)
-        return json.dumps(result, indent=2)
+        return _to_json(result)
     except Exception as e:
         return json.dumps({"error": str(e)})
 
@@ -356,7 +368,7 @@ def course_status(course_id: str, directory: str) -> str:
     """
     try:
         result = course_sync.course_status(course_id, directory)
-        return json.dumps(result, indent=2)
+        return _to_json(result)
     except Exception as e:
         return json.dumps({"error": str(e)})
 
@@ -378,7 +390,7 @@ def list_assignment_groups(course_id: str) -> str:
     """
     try:
         result = assignment_groups.list_assignment_groups(course_id)
-        return json.dumps(result, indent=2)
+        return _to_json(result)
     except Exception as e:
         return json.dumps({"error": str(e)})
 
@@ -400,7 +412,7 @@ def list_courses(enrollment_state: str = "active") -> str:
     """
     try:
         result = assignments.list_courses(enrollment_state=enrollment_state)
-        return json.dumps(result, indent=2)
+        return _to_json(result)
     except Exception as e:
         error_str = str(e)
         # Check for expired or invalid token errors
@@ -426,7 +438,7 @@ def list_assignments(course_id: str) -> str:
     """
     try:
         result = assignments.list_assignments(course_id)
-        return json.dumps(result, indent=2)
+        return _to_json(result)
     except Exception as e:
         return json.dumps({"error": str(e)})
 
@@ -445,7 +457,26 @@ def get_assignment(course_id: str, assignment_id: str) -> str:
     """
     try:
         result = assignments.get_assignment(course_id, assignment_id)
-        return json.dumps(result, indent=2)
+        return _to_json(result)
+    except Exception as e:
+        return json.dumps({"error": str(e)})
+
+
+@mcp.tool()
+def get_assignments_bulk(course_id: str, assignment_ids: List[str]) -> str:
+    """
+    Get details for several assignments at once.
+
+    Args:
+        course_id: Canvas course ID
+        assignment_ids: Canvas assignment IDs
+
+    Returns:
+        JSON with the assignments found and any IDs that do not exist
+    """
+    try:
+        result = assignments.get_assignments_bulk(course_id, assignment_ids)
+        return _to_json(result)
     except Exception as e:
         return json.dumps({"error": str(e)})
 
@@ -487,7 +518,7 @@ def list_submissions(course_id: str, assignment_id: str, anonymize: bool = True)
                 anonymized.append(anon_sub)
             result = anonymized
         
-        return json.dumps(result, indent=2)
+        return _to_json(result)
     except Exception as e:
         return json.dumps({"error": str(e)})
 
@@ -522,7 +553,7 @@ def get_submission(course_id: str, assignment_id: str, user_id: str, anonymize:
                 }
             result['user_id'] = 'anon_user'
         
-        return json.dumps(result, indent=2)
+        return _to_json(result)
     except Exception as e:
         return json.dumps({"error": str(e)})
 
@@ -550,7 +581,33 @@ def update_grade(
     """
     try:
         result = assignments.update_grade(course_id, assignment_id, user_id, grade, comment)
-        return json.dumps(result, indent=2)
+        return _to_json(result)
+    except Exception as e:
+        return json.dumps({"error": str(e)})
+
+
+@mcp.tool()
+def update_grades_bulk(
+    course_id: str,
+    assignment_id: str,
+    grades: Dict[str, str],
+    comments: Optional[Dict[str, str]] = None
+) -> str:
+    """
+    Update many students' grades for an assignment in one request.
+
+    Args:
+        course_id: Canvas course ID
+        assignment_id: Canvas assignment ID
+        grades: Grade per student user ID, e.g. {"123": "95", "456": "B+"}
+        comments: Optional comment per student user ID
+
+    Returns:
+        JSON with success, workflow_state and number of grades updated
+    """
+    try:
+        result = assignments.update_grades_bulk(course_id, assignment_id, grades, comments)
+        return _to_json(result)
     except Exception as e:
         return json.dumps({"error": str(e)})
 
@@ -569,7 +626,7 @@ def delete_assignment(course_id: str, assignment_id: str) -> str:
     """
     try:
         result = assignments.delete_assignment(course_id, assignment_id)
-        return json.dumps(result, indent=2)
+        return _to_json(result)
     except Exception as e:
         return json.dumps({"error": str(e)})
 
@@ -588,7 +645,7 @@ def delete_page(course_id: str, page_id: str) -> str:
     """
     try:
         result = pages.delete_page(course_id, page_id)
-        return json.dumps(result, indent=2)
+        return _to_json(result)
     except Exception as e:
         return json.dumps({"error": str(e)})
 
@@ -612,7 +669,7 @@ def pull_assignments(
     """
     try:
         result = assignment_sync.pull_assignments(course_id, output_dir, overwrite=overwrite)
-        return json.dumps(result, indent=2)
+        return _to_json(result)
     except Exception as e:
         return json.dumps({"error": str(e)})
 
@@ -622,20 +679,23 @@ def push_assignments(
     course_id: str,
     input_dir: str,
     create_missing: bool = True,
-    update_existing: bool = True
+    update_existing: bool = True,
+    force: bool = False
 ) -> str:
     """
     Push local markdown files to Canvas as assignments.
 
     Can create new assignments or update existing ones. If a markdown file has no
     assignment_id in frontmatter and create_missing is true, a new assignment will
-    be created in Canvas and the file will be updated with the new ID.
+    be created in Canvas and the file will be updated with the new ID. Files
+    unchanged since the last push are skipped unless force is true.
 
     Args:
         course_id: Canvas course ID
         input_dir: Directory containing assignment markdown files
         create_missing: Create assignments that don't exist on Canvas (default: true)
         update_existing: Update assignments that already exist (default: true)
+        force: Push all files, even unchanged ones (default: false)
 
     Returns:
         JSON with results: created, updated, skipped, errors
@@ -644,9 +704,10 @@ def push_assignments(
         result = assignment_sync.push_assignments(
             course_id, input_dir,
             create_missing=create_missing,
-            update_existing=update_existing
+            update_existing=update_existing,
+            force=force
         )
-        return json.dumps(result, indent=2)
+        return _to_json(result)
     except Exception as e:
         return json.dumps({"error": str(e)})
 
@@ -665,7 +726,7 @@ def assignment_sync_status(course_id: str, local_dir: str) -> str:
     """
     try:
         result = assignment_sync.assignment_sync_status(course_id, local_dir)
-        return json.dumps(result, indent=2)
+        return _to_json(result)
     except Exception as e:
         return json.dumps({"error": str(e)})
 
@@ -712,7 +773,7 @@ def message_non_submitters(
             message=message,
             anonymize=anonymize
         )
-        return json.dumps(result, indent=2)
+        return _to_json(result)
     except Exception as e:
         return json.dumps({"error": str(e)})
 
@@ -734,7 +795,7 @@ def list_discussions(course_id: str) -> str:
     """
     try:
         result = discussions.list_discussions(course_id)
-        return json.dumps(result, indent=2)
+        return _to_json(result)
     except Exception as e:
         return json.dumps({"error": str(e)})
 
@@ -752,7 +813,7 @@ def list_discussion_assignments(course_id: str) -> str:
     """
     try:
         result = discussions.list_discussion_assignments(course_id)
-        return json.dumps(result, indent=2)
+        return _to_json(result)
     except Exception as e:
         return json.dumps({"error": str(e)})
 
@@ -771,7 +832,7 @@ def get_discussion_posts(course_id: str, discussion_id: str) -> str:
     """
     try:
         result = discussions.get_discussion_posts(course_id, discussion_id, as_markdown=True)
-        return json.dumps(result, indent=2)
+        return _to_json(result)
     except Exception as e:
         return json.dumps({"error": str(e)})
 
@@ -790,7 +851,7 @@ def get_posts_by_user(course_id: str, discussion_id: str) -> str:
     """
     try:
         result = discussions.get_posts_by_user(course_id, discussion_id, as_markdown=True)
-        return json.dumps(result, indent=2)
+        return _to_json(result)
     except Exception as e:
         return json.dumps({"error": str(e)})
 
@@ -827,7 +888,7 @@ def create_discussion(
             require_initial_post=require_initial_post,
             is_announcement=is_announcement
         )
-        return json.dumps(result, indent=2)
+        return _to_json(result)
     except Exception as e:
         return json.dumps({"error": str(e)})
 
@@ -861,7 +922,7 @@ def update_discussion(
             message=message,
             published=published
         )
-        return json.dumps(result, indent=2)
+        return _to_json(result)
     except Exception as e:
         return json.dumps({"error": str(e)})
 
@@ -905,7 +966,7 @@ def pull_discussions(course_id: str, output_dir: str, overwrite: bool = False) -
             overwrite=overwrite,
             only_announcements=False
         )
-        return json.dumps(result, indent=2)
+        return _to_json(result)
     except Exception as e:
         return json.dumps({"error": str(e)})
 
@@ -937,7 +998,7 @@ def push_discussions(
             update_existing=update_existing,
             is_announcements=False
         )
-        return json.dumps(result, indent=2)
+        return _to_json(result)
     except Exception as e:
         return json.dumps({"error": str(e)})
 
@@ -963,7 +1024,7 @@ def pull_announcements(course_id: str, output_dir: str, overwrite: bool = False,
             overwrite=overwrite,
             limit=limit
         )
-        return json.dumps(result, indent=2)
+        return _to_json(result)
     except Exception as e:
         return json.dumps({"error": str(e)})
 
@@ -994,7 +1055,7 @@ def push_announcements(
             create_missing=create_missing,
             update_existing=update_existing
         )
-        return json.dumps(result, indent=2)
+        return _to_json(result)
     except Exception as e:
         return json.dumps({"error": str(e)})
 
@@ -1019,7 +1080,7 @@ def get_rubric(course_id: str, assignment_id: str) -> str:
         result = rubrics.get_rubric(course_id, assignment_id)
         if result is None:
             return json.dumps({"error": "No rubric found for this assignment"})
-        return json.dumps(result, indent=2)
+        return _to_json(result)
     except Exception as e:
         return json.dumps({"error": str(e)})
 
@@ -1081,7 +1142,7 @@ def pull_rubrics(
     """
     try:
         result = rubric_sync.pull_rubrics(course_id, output_dir, overwrite=overwrite)
-        return json.dumps(result, indent=2)
+        return _to_json(result)
     except Exception as e:
         return json.dumps({"error": str(e)})
 
@@ -1108,7 +1169,7 @@ async def push_rubrics(
             course_id, input_dir,
             create_only=create_only
         )
-        return json.dumps(result, indent=2)
+        return _to_json(result)
     except Exception as e:
         return json.dumps({"error": str(e)})
 
@@ -1127,7 +1188,7 @@ def rubric_sync_status(course_id: str, local_dir: str) -> str:
     """
     try:
         result = rubric_sync.rubric_sync_status(course_id, local_dir)
-        return json.dumps(result, indent=2)
+        return _to_json(result)
     except Exception as e:
         return json.dumps({"error": str(e)})
 
@@ -1165,7 +1226,7 @@ def pull_submissions(
             include_attachments=include_attachments,
             anonymize=anonymize
         )
-        return json.dumps(result, indent=2)
+        return _to_json(result)
     except Exception as e:
         return json.dumps({"error": str(e)})
 
@@ -1194,7 +1255,7 @@ def submission_status(
             course_id, assignment_id,
             local_dir=local_dir
         )
-        return json.dumps(result, indent=2)
+        return _to_json(result)
     except Exception as e:
         return json.dumps({"error": str(e)})
 
@@ -1244,7 +1305,7 @@ def get_all_submissions_hierarchical(
 
         if age_seconds < _CACHE_TTL_SECONDS:
             logger.info(f"Returning cached submissions (age: {age_seconds:.1f}s)")
-            return json.dumps(cached_data, indent=2)
+            return _to_json(cached_data)
         else:
             logger.info(f"Cache expired (age: {age_seconds:.1f}s), fetching fresh data")
 
@@ -1259,7 +1320,7 @@ def get_all_submissions_hierarchical(
         _submissions_cache[cache_key] = (result, datetime.now())
         logger.info(f"Cached fresh submissions data for course {course_id}")
 
-        return json.dumps(result, indent=2)
+        return _to_json(result)
     except Exception as e:
         return json.dumps({"error": str(e)})
 
@@ -1281,7 +1342,7 @@ def list_quizzes(course_id: str) -> str:
     """
     try:
         result = quizzes.list_quizzes(course_id)
-        return json.dumps(result, indent=2)
+        return _to_json(result)
     except Exception as e:
         return json.dumps({"error": str(e)})
 
@@ -1300,7 +1361,7 @@ def get_quiz(course_id: str, quiz_id: str) -> str:
     """
     try:
         result = quizzes.get_quiz(course_id, quiz_id)
-        return json.dumps(result, indent=2)
+        return _to_json(result)
     except Exception as e:
         return json.dumps({"error": str(e)})
 
@@ -1319,7 +1380,7 @@ def get_quiz_questions(course_id: str, quiz_id: str) -> str:
     """
     try:
         result = quizzes.get_quiz_questions(course_id, quiz_id)
-        return json.dumps(result, indent=2)
+        return _to_json(result)
     except Exception as e:
         return json.dumps({"error": str(e)})
 
@@ -1346,7 +1407,7 @@ def pull_quizzes(
     """
     try:
         result = quiz_sync.pull_quizzes(course_id, output_dir, overwrite=overwrite, download_images=download_images)
-        return json.dumps(result, indent=2)
+        return _to_json(result)
     except Exception as e:
         return json.dumps({"error": str(e)})
 
@@ -1380,7 +1441,7 @@ def push_quizzes(
             update_existing=update_existing,
             upload_images=upload_images
         )
-        return json.dumps(result, indent=2)
+        return _to_json(result)
     except Exception as e:
         return json.dumps({"error": str(e)})
 
@@ -1399,7 +1460,7 @@ def quiz_sync_status(course_id: str, local_dir: str) -> str:
     """
     try:
         result = quiz_sync.quiz_sync_status(course_id, local_dir)
-        return json.dumps(result, indent=2)
+        return _to_json(result)
     except Exception as e:
         return json.dumps({"error": str(e)})
 
@@ -1425,7 +1486,7 @@ def pull_modules(
     """
     try:
         result = module_sync.pull_modules(course_id, output_dir)
-        return json.dumps(result, indent=2)
+        return _to_json(result)
     except Exception as e:
         return json.dumps({"error": str(e)})
 
@@ -1455,7 +1516,7 @@ def push_modules(
             create_missing=create_missing,
             update_existing=update_existing
         )
-        return json.dumps(result, indent=2)
+        return _to_json(result)
     except Exception as e:
         return json.dumps({"error": str(e)})
 
@@ -1474,7 +1535,7 @@ def module_sync_status(course_id: str, local_dir: str) -> str:
     """
     try:
         result = module_sync.module_sync_status(course_id, local_dir)
-        return json.dumps(result, indent=2)
+        return _to_json(result)
     except Exception as e:
         return json.dumps({"error": str(e)})
 
@@ -1511,7 +1572,7 @@ def list_course_files(course_id: str) -> str:
     """
     try:
         result = files_module.list_course_files(course_id)
-        return json.dumps(result, indent=2)
+        return _to_json(result)
     except Exception as e:
         return json.dumps({"error": str(e)})
 
@@ -1545,7 +1606,7 @@ def pull_course_files(
             size_threshold=threshold_bytes,
             overwrite=overwrite
         )
-        return json.dumps(result, indent=2)
+        return _to_json(result)
     except Exception as e:
         return json.dumps({"error": str(e)})
 
@@ -1570,7 +1631,7 @@ def download_pending_files(
     try:
         ids_list = file_ids.split(",") if file_ids else None
         result = files_module.download_pending_files(course_id, files_dir, file_ids=ids_list)
-        return json.dumps(result, indent=2)
+        return _to_json(result)
     except Exception as e:
         return json.dumps({"error": str(e)})
 
@@ -1588,7 +1649,7 @@ def list_pending_files(files_dir: str) -> str:
     """
     try:
         result = files_module.list_pending_files(files_dir)
-        return json.dumps(result, indent=2)
+        return _to_json(result)
     except Exception as e:
         return json.dumps({"error": str(e)})
 
@@ -1621,7 +1682,7 @@ def create_agent_worktree_tool(
     try:
         scope_list = [s.strip() for s in scope.split(",")]
         result = create_agent_worktree(course_id, course_path, agent_name, agent_role, scope_list)
-        return json.dumps(result, indent=2)
+        return _to_json(result)
     except Exception as e:
         return json.dumps({"error": str(e)})
 
@@ -1890,7 +1951,7 @@ def get_item_review_history(
     try:
         wm = WorkflowManager(course_path)
         history = wm.get_item_review_history(item_id, include_archived)
-        return json.dumps(history, indent=2)
+        return _to_json(history)
     except Exception as e:
         return json.dumps({"error": str(e)})
 
@@ -2350,7 +2411,7 @@ def load_draft_grade(assignment_id: str, user_id: str) -> str:
         result = draft_storage.load_draft_grade(assignment_id, user_id)
         if result is None:
             return json.dumps(None)
-        return json.dumps(result, indent=2)
+        return _to_json(result)
     except Exception as e:
         return json.dumps({"error": str(e)})
 
@@ -2421,7 +2482,7 @@ def get_current_draft_run(assignment_id: str, user_id: str) -> str:
         result = draft_storage.get_current_run(assignment_id, user_id)
         if result is None:
             return json.dumps(None)
-        return json.dumps(result, indent=2)
+        return _to_json(result)
     except Exception as e:
         return json.dumps({"error": str(e)})
 
@@ -2459,7 +2520,7 @@ def list_draft_grades(assignment_id: str) -> str:
     """
     try:
         result = draft_storage.list_draft_grades(assignment_id)
-        return json.dumps(result, indent=2)
+        return _to_json(result)
     except Exception as e:
         return json.dumps({"error": str(e)})
 
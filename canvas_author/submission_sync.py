@@ -7,7 +7,6 @@ Supports anonymization for blind grading.
 
 import logging
 import re
-import requests
 from pathlib import Path
 from typing import Dict, Any, List, Optional
 from datetime import datetime
@@ -15,7 +14,8 @@ from datetime import datetime
 import yaml
 
 from canvas_common import get_canvas_client, CanvasClient, slugify
-from .assignments import list_assignments, get_assignment, list_submissions
+from .http_utils import get_http_session
+from .assignments import list_assignments, get_assignment, list_submissions, iter_submission_statuses
 
 logger = logging.getLogger("canvas_author.submission_sync")
 
@@ -24,7 +24,7 @@ def _download_attachment(url: str, output_path: Path, client: CanvasClient) -> b
     """Download an attachment file from Canvas."""
     try:
         headers = {'Authorization': f'Bearer {client.token}'}
-        response = requests.get(url, headers=headers, stream=True)
+        response = get_http_session().get(url, headers=headers, stream=True)
         response.raise_for_status()
 
         with open(output_path, 'wb') as f:
@@ -273,23 +273,20 @@ def submission_status(
     # Get assignment info
     assignment = get_assignment(course_id, assignment_id, client=canvas)
 
-    # Get submissions
-    submissions = list_submissions(
-        course_id, assignment_id,
-        include_user=True,
-        include_rubric=False,
-        client=canvas
-    )
-
-    # Count by status
-    total = len(submissions)
-    submitted = sum(1 for s in submissions if s.get('submitted_at'))
-    # A submission is graded if it has a score or grade, OR if workflow_state is 'graded'
-    # This handles auto-graded quizzes where workflow_state may not be 'graded'
-    graded = sum(1 for s in submissions if (s.get('score') is not None or s.get('grade') is not None or s.get('workflow_state') == 'graded'))
-    pending = sum(1 for s in submissions if s.get('workflow_state') == 'pending_review')
-    late = sum(1 for s in submissions if s.get('late'))
-    missing = sum(1 for s in submissions if s.get('missing'))
+    # Count by status in one pass, without keeping the submissions
+    total = submitted = graded = pending = late = missing = 0
+    for s in iter_submission_statuses(course_id, assignment_id, client=canvas):
+        total += 1
+        if s.submitted_at:
+            submitted += 1
+        if s.is_graded:
+            graded += 1
+        if s.workflow_state == 'pending_review':
+            pending += 1
+        if s.late:
+            late += 1
+        if s.missing:
+            missing += 1
 
     result = {
         'assignment_id': assignment_id,
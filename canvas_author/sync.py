@@ -18,6 +18,19 @@ from canvas_common import URLMismatchError
 
 logger = logging.getLogger("canvas_author.sync")
 
+# Slug patterns used by predict_canvas_url
+_SLUG_STRIP_RE = re.compile(r'[^\w\s-]')
+_SLUG_DASH_RE = re.compile(r'[-\s]+')
+_SLUG_DASHES_RE = re.compile(r'-{2,}')
+
+# The same transformation for ASCII titles as one str.translate: whitespace
+# becomes a hyphen and anything _SLUG_STRIP_RE would remove is deleted
+_ASCII_SLUG_TABLE = {
+    code: "-" if chr(code).isspace() else None
+    for code in range(128)
+    if _SLUG_STRIP_RE.fullmatch(chr(code)) or chr(code).isspace()
+}
+
 
 def predict_canvas_url(title: str) -> str:
     """
@@ -42,9 +55,12 @@ def predict_canvas_url(title: str) -> str:
         'hello-world'
     """
     # Canvas URL generation: lowercase, replace non-alphanumeric with hyphens
-    url = re.sub(r'[^\w\s-]', '', title.lower())
-    url = re.sub(r'[-\s]+', '-', url).strip('-')
-    return url
+    if title.isascii():
+        url = title.lower().translate(_ASCII_SLUG_TABLE)
+        return _SLUG_DASHES_RE.sub('-', url).strip('-')
+
+    url = _SLUG_STRIP_RE.sub('', title.lower())
+    return _SLUG_DASH_RE.sub('-', url).strip('-')
 
 
 def update_internal_links(
@@ -51,7 +51,7 @@ def get_allowed_tools(agent_role: str) -> List[str]:
     role_permissions = {
         "content_agent": [
             # Read-only tools
-            "list_pages", "get_page", "list_assignments", "get_assignment",
+            "list_pages", "get_page", "list_assignments", "get_assignment", "get_assignments_bulk",
             "list_quizzes", "get_quiz", "list_discussions", "get_discussion_posts",
             "get_rubric", "list_modules", "list_courses", "list_submissions",
             "get_submission", "sync_status", "quiz_sync_status", "module_sync_status",
@@ -68,7 +68,7 @@ def get_allowed_tools(agent_role: str) -> List[str]:
         ],
         "style_agent": [
             # Read-only tools
-            "list_pages", "get_page", "list_assignments", "get_assignment",
+            "list_pages", "get_page", "list_assignments", "get_assignment", "get_assignments_bulk",
             "list_quizzes", "get_quiz", "list_discussions", "get_discussion_posts",
             "get_rubric", "list_modules", "list_courses", "list_submissions",
             "get_submission", "sync_status", "quiz_sync_status", "module_sync_status",
@@ -78,7 +78,7 @@ def get_allowed_tools(agent_role: str) -> List[str]:
         ],
         "fact_check_agent": [
             # Read-only tools
-            "list_pages", "get_page", "list_assignments", "get_assignment",
+            "list_pages", "get_page", "list_assignments", "get_assignment", "get_assignments_bulk",
             "list_quizzes", "get_quiz", "list_discussions", "get_discussion_posts",
             "get_rubric", "list_modules", "list_courses", "list_submissions",
             "get_submission", "sync_status", "quiz_sync_status", "module_sync_status",
@@ -88,7 +88,7 @@ def get_allowed_tools(agent_role: str) -> List[str]:
         ],
         "consistency_agent": [
             # Read-only tools
-            "list_pages", "get_page", "list_assignments", "get_assignment",
+            "list_pages", "get_page", "list_assignments", "get_assignment", "get_assignments_bulk",
             "list_quizzes", "get_quiz", "list_discussions", "get_discussion_posts",
             "get_rubric", "list_modules", "list_courses", "list_submissions",
             "get_submission", "sync_status", "quiz_sync_status", "module_sync_status",
@@ -98,7 +98,7 @@ def get_allowed_tools(agent_role: str) -> List[str]:
         ],
         "approval_agent": [
             # Read-only tools
-            "list_pages", "get_page", "list_assignments", "get_assignment",
+            "list_pages", "get_page", "list_assignments", "get_assignment", "get_assignments_bulk",
             "list_quizzes", "get_quiz", "list_discussions", "get_discussion_posts",
             "get_rubric", "list_modules", "list_courses", "list_submissions",
             "get_submission", "sync_status", "quiz_sync_status", "module_sync_status",
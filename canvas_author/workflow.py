@@ -442,7 +442,7 @@ def _get_tool_restrictions_for_role(role: str) -> Dict[str, List[str]]:
     
     # Read-only tools available to all roles
     read_only_tools = [
-        "list_pages", "get_page", "list_assignments", "get_assignment",
+        "list_pages", "get_page", "list_assignments", "get_assignment", "get_assignments_bulk",
         "list_quizzes", "get_quiz", "list_discussions", "get_discussion_posts",
         "get_rubric", "list_modules", "list_courses", "list_submissions",
         "get_submission", "sync_status", "quiz_sync_status", "module_sync_status"
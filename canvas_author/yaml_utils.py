@@ -0,0 +1,85 @@
+"""
+YAML Utilities Module
+
+Fast loading of YAML frontmatter blocks, using the libyaml C bindings
+when PyYAML was built with them.
+"""
+
+import logging
+import re
+from typing import Any, Callable, Dict, Optional
+
+import yaml
+
+try:
+    from yaml import CSafeLoader as YamlLoader
+except ImportError:  # PyYAML built without libyaml
+    from yaml import SafeLoader as YamlLoader
+
+logger = logging.getLogger("canvas_author.yaml_utils")
+
+# Tag given to every unquoted scalar, in place of YAML 1.1's implicit types
+_PLAIN_TAG = "tag:canvas-author:plain"
+
+
+class _FrontmatterLoader(YamlLoader):
+    """
+    Safe loader without YAML 1.1's implicit typing.
+
+    Unquoted scalars are passed to the caller's parse_scalar instead of
+    being read as booleans (yes/no/on/off), nulls (~), hex or underscored
+    integers, or timestamps. Quoted scalars stay strings.
+    """
+
+    yaml_implicit_resolvers = {}
+
+    def __init__(self, stream: str, parse_scalar: Callable[[str], Any]):
+        super().__init__(stream)
+        self.parse_scalar = parse_scalar
+
+
+def _construct_plain(loader: _FrontmatterLoader, node: yaml.ScalarNode) -> Any:
+    return loader.parse_scalar(loader.construct_scalar(node))
+
+
+_FrontmatterLoader.add_implicit_resolver(_PLAIN_TAG, re.compile(r".*", re.DOTALL), None)
+_FrontmatterLoader.add_constructor(_PLAIN_TAG, _construct_plain)
+
+
+def load_frontmatter_yaml(
+    frontmatter: str,
+    parse_scalar: Callable[[str], Any] = str
+) -> Optional[Dict[str, Any]]:
+    """
+    Parse a frontmatter block (without the --- delimiters) as YAML.
+
+    Frontmatter written by hand is not always valid YAML, so this returns
+    None when the caller should fall back to its line parser instead:
+    the block fails to parse, does not produce a mapping, or contains '#'
+    (an unquoted "Homework #3" title would otherwise be cut at the comment).
+
+    Args:
+        frontmatter: Frontmatter text between the delimiters
+        parse_scalar: Converts the text of each unquoted value, so values
+            come out the same as from the caller's line parser (default:
+            keep the text as written)
+
+    Returns:
+        Metadata dict, or None
+    """
+    if "#" in frontmatter:
+        return None
+
+    loader = _FrontmatterLoader(frontmatter, parse_scalar)
+    try:
+        metadata = loader.get_single_data()
+    except yaml.YAMLError as e:
+        logger.debug(f"Frontmatter is not valid YAML, using line parser: {e}")
+        return None
+    finally:
+        loader.dispose()
+
+    if not isinstance(metadata, dict):
+        return None
+
+    return metadata
@@ -40,7 +40,7 @@ class MockCourse:
         self.course_code = f"TC{course_id}"
         self._pages = {}
 
-    def get_pages(self):
+    def get_pages(self, **kwargs):
         """Return list of mock pages."""
         return list(self._pages.values())
 
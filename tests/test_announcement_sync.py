@@ -0,0 +1,142 @@
+"""
+Tests for the announcement_sync module.
+"""
+
+from types import SimpleNamespace
+from unittest.mock import MagicMock
+from canvas_author.announcement_sync import (
+    create_announcement_frontmatter,
+    parse_announcement_frontmatter,
+    pull_announcements,
+    _date_prefix,
+    _parse_announcement_file,
+)
+
+
+class TestParseAnnouncementFrontmatter:
+    """Tests for parse_announcement_frontmatter function."""
+
+    def test_parse_generated_frontmatter(self):
+        """Test that generated frontmatter parses back to the same values."""
+        content = create_announcement_frontmatter({
+            "id": "123",
+            "title": "Week 1 Overview",
+            "published": False,
+        }) + "Welcome!\n"
+
+        metadata, body = parse_announcement_frontmatter(content)
+
+        assert metadata["announcement_id"] == 123
+        assert metadata["title"] == "Week 1 Overview"
+        assert metadata["delayed_post_at"] is None
+        assert metadata["published"] is False
+        assert body == "Welcome!\n"
+
+    def test_parse_no_frontmatter(self):
+        """Test parsing content without frontmatter."""
+        content = "Just a message."
+
+        metadata, body = parse_announcement_frontmatter(content)
+
+        assert metadata == {}
+        assert body == content
+
+    def test_datetimes_stay_strings(self):
+        """Test that unquoted datetimes are returned as strings."""
+        content = "---\ntitle: Test\ndelayed_post_at: 2026-01-19 09:00:00\n---\nBody"
+
+        metadata, _ = parse_announcement_frontmatter(content)
+
+        assert metadata["delayed_post_at"] == "2026-01-19 09:00:00"
+
+    def test_values_kept_as_written(self):
+        """Test that YAML 1.1 booleans and timestamps are not applied."""
+        content = "---\ntitle: Yes\ndelayed_post_at: 2026-01-19T09:00:00Z\npublished: true\n---\nBody"
+
+        metadata, _ = parse_announcement_frontmatter(content)
+
+        assert metadata["title"] == "Yes"
+        assert metadata["delayed_post_at"] == "2026-01-19T09:00:00Z"
+        assert metadata["published"] is True
+
+    def test_invalid_yaml_falls_back(self):
+        """Test that hand-written frontmatter that is not valid YAML still parses."""
+        content = "---\ntitle: Week 2: The Landscape\npublished: true\n---\nBody"
+
+        metadata, body = parse_announcement_frontmatter(content)
+
+        assert metadata["title"] == "Week 2: The Landscape"
+        assert metadata["published"] is True
+        assert body == "Body"
+
+
+class TestParseAnnouncementFile:
+    """Tests for the cached file parser."""
+
+    def test_reparses_after_change(self, tmp_path):
+        """Test that edits to a file are picked up."""
+        file_path = tmp_path / "test.announcement.md"
+        file_path.write_text("---\ntitle: First\n---\nBody", encoding="utf-8")
+        assert _parse_announcement_file(file_path)[0]["title"] == "First"
+
+        file_path.write_text("---\ntitle: Second title\n---\nBody", encoding="utf-8")
+        assert _parse_announcement_file(file_path)[0]["title"] == "Second title"
+
+    def test_returns_independent_metadata(self, tmp_path):
+        """Test that callers cannot mutate the cached metadata."""
+        file_path = tmp_path / "test.announcement.md"
+        file_path.write_text("---\ntitle: Test\n---\nBody", encoding="utf-8")
+
+        metadata, _ = _parse_announcement_file(file_path)
+        metadata["title"] = "Changed"
+
+        assert _parse_announcement_file(file_path)[0]["title"] == "Test"
+
+
+class TestDatePrefix:
+    """Tests for the filename date prefix."""
+
+    def test_iso_timestamp(self):
+        """Test that the date part of an ISO timestamp is used."""
+        assert _date_prefix("2026-01-19T14:00:00Z") == "2026-01-19"
+
+    def test_missing_or_invalid(self):
+        """Test that missing or unparseable timestamps are undated."""
+        assert _date_prefix(None) == "undated"
+        assert _date_prefix("not a date") == "undated"
+
+
+def _announcement(announcement_id, message):
+    """Build a listed announcement; every one shares a date and title."""
+    return SimpleNamespace(
+        id=announcement_id, title="Reminder", posted_at="2026-01-19T14:00:00Z",
+        message=f"<p>{message}</p>", published=True, updated_at="2026-01-19T14:00:00Z",
+    )
+
+
+class TestPullAnnouncements:
+    """Tests for pull_announcements function."""
+
+    def _pull(self, tmp_path, overwrite):
+        """Pull two announcements that map to the same file."""
+        client = MagicMock()
+        client.get_course.return_value.get_discussion_topics.return_value = [
+            _announcement(1, "First"), _announcement(2, "Second"),
+        ]
+        return pull_announcements("100", str(tmp_path), overwrite=overwrite, client=client)
+
+    def test_same_file_is_written_once(self, tmp_path):
+        """Test that a second announcement mapping to a claimed file is skipped."""
+        results = self._pull(tmp_path, overwrite=False)
+
+        file_path = tmp_path / "announcements" / "2026-01-19-reminder.announcement.md"
+        assert [p["id"] for p in results["pulled"]] == ["1"]
+        assert results["skipped"] == [{"id": "2", "title": "Reminder", "reason": "file exists"}]
+        assert file_path.read_text(encoding="utf-8").endswith("First\n")
+
+    def test_overwrite_keeps_last(self, tmp_path):
+        """Test that with overwrite the later announcement wins, as if written one by one."""
+        self._pull(tmp_path, overwrite=True)
+
+        file_path = tmp_path / "announcements" / "2026-01-19-reminder.announcement.md"
+        assert file_path.read_text(encoding="utf-8").endswith("Second\n")
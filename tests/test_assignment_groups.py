@@ -0,0 +1,52 @@
+"""
+Tests for the assignment_groups module.
+"""
+
+from types import SimpleNamespace
+from unittest.mock import MagicMock
+from canvas_author.assignment_groups import get_assignment_group, list_assignment_groups
+
+
+def _group(**attrs):
+    """Build a stand-in for a canvasapi AssignmentGroup."""
+    return SimpleNamespace(id=3, name="Essays", position=1, group_weight=40, **attrs)
+
+
+class TestListAssignmentGroups:
+    """Tests for list_assignment_groups function."""
+
+    def test_client_is_second_positional_argument(self):
+        """Test that a positional client is used as the client, not as include."""
+        client = MagicMock()
+        client.get_course.return_value.get_assignment_groups.return_value = [_group()]
+
+        result = list_assignment_groups("100", client)
+
+        client.get_course.return_value.get_assignment_groups.assert_called_once_with()
+        assert result == [{"id": 3, "name": "Essays", "position": 1, "group_weight": 40}]
+
+    def test_include_is_passed_through(self):
+        """Test that included data is requested and copied into the result."""
+        client = MagicMock()
+        assignments = [{"id": 7, "name": "Essay 1"}]
+        client.get_course.return_value.get_assignment_groups.return_value = [_group(assignments=assignments)]
+
+        result = list_assignment_groups("100", client, include=["assignments"])
+
+        client.get_course.return_value.get_assignment_groups.assert_called_once_with(include=["assignments"])
+        assert result[0]["assignments"] == assignments
+
+
+class TestGetAssignmentGroup:
+    """Tests for get_assignment_group function."""
+
+    def test_include_is_passed_through(self):
+        """Test that included data is requested and copied into the result."""
+        client = MagicMock()
+        course = client.get_course.return_value
+        course.get_assignment_group.return_value = _group(assignments=[])
+
+        result = get_assignment_group("100", "3", client, include=["assignments"])
+
+        course.get_assignment_group.assert_called_once_with("3", include=["assignments"])
+        assert result["assignments"] == []
@@ -0,0 +1,289 @@
+"""
+Tests for the assignment_sync module.
+"""
+
+import pytest
+from unittest.mock import patch, MagicMock
+from canvasapi.exceptions import RateLimitExceeded
+from canvas_author.assignment_sync import (
+    create_assignment_frontmatter,
+    parse_assignment_frontmatter,
+    pull_assignments,
+    push_assignments,
+    _call_with_backoff,
+    _file_hash,
+    _find_assignments_dir,
+    _parse_assignment_file,
+    _peek_assignment_id,
+    _scan_local_assignments,
+    _set_frontmatter_assignment_id,
+)
+
+
+class TestParseAssignmentFrontmatter:
+    """Tests for parse_assignment_frontmatter function."""
+
+    def test_parse_generated_frontmatter(self):
+        """Test that generated frontmatter parses back to the same values."""
+        content = create_assignment_frontmatter({
+            "id": 12,
+            "name": "Essay 1",
+            "points_possible": 10.5,
+            "submission_types": ["online_upload"],
+            "published": True,
+            "overrides": [{"id": 5, "student_ids": [1, 2], "title": "Extension"}],
+        }, "1") + "Write an essay.\n"
+
+        metadata, body = parse_assignment_frontmatter(content)
+
+        assert metadata["assignment_id"] == 12
+        assert metadata["title"] == "Essay 1"
+        assert metadata["points_possible"] == 10.5
+        assert metadata["submission_types"] == ["online_upload"]
+        assert metadata["published"] is True
+        assert metadata["assignment_overrides"] == [
+            {"id": 5, "student_ids": [1, 2], "title": "Extension"}
+        ]
+        assert body == "Write an essay.\n"
+
+    def test_hash_in_title_falls_back(self):
+        """Test that '#' in a value is not read as a YAML comment."""
+        content = "---\ntitle: Homework #3\npoints_possible: 5\n---\nBody"
+
+        metadata, _ = parse_assignment_frontmatter(content)
+
+        assert metadata["title"] == "Homework #3"
+        assert metadata["points_possible"] == 5
+
+    @pytest.mark.parametrize("value", ["Yes", "No", "~", "0x10", "1_000"])
+    def test_title_kept_as_written(self, value):
+        """Test that YAML 1.1 booleans, nulls and integer forms stay text."""
+        metadata, _ = parse_assignment_frontmatter(f"---\ntitle: {value}\npoints_possible: 5\n---\nBody")
+
+        assert metadata["title"] == value
+        assert metadata["points_possible"] == 5
+
+    def test_iso_datetime_kept_as_written(self):
+        """Test that an ISO 8601 due date is not rewritten by the YAML parser."""
+        content = "---\ntitle: Essay\ndue_at: 2026-01-16T10:00:00Z\npublished: false\n---\nBody"
+
+        metadata, _ = parse_assignment_frontmatter(content)
+
+        assert metadata["due_at"] == "2026-01-16T10:00:00Z"
+        assert metadata["published"] is False
+
+
+class TestLocalAssignmentFiles:
+    """Tests for reading local assignment files."""
+
+    def test_reparses_after_change(self, tmp_path):
+        """Test that edits to a file are picked up."""
+        file_path = tmp_path / "essay.md"
+        file_path.write_text("---\ntitle: First\n---\nBody", encoding="utf-8")
+        assert _parse_assignment_file(file_path)[0]["title"] == "First"
+
+        file_path.write_text("---\ntitle: Second title\n---\nBody", encoding="utf-8")
+        assert _parse_assignment_file(file_path)[0]["title"] == "Second title"
+
+    def test_scan_reads_ids(self, tmp_path):
+        """Test that only files with an assignment_id are returned."""
+        (tmp_path / "essay.md").write_text("---\ntitle: Essay\nassignment_id: 7\n---\nBody", encoding="utf-8")
+        (tmp_path / "draft.md").write_text("---\ntitle: Draft\n---\nBody", encoding="utf-8")
+
+        local_by_id = _scan_local_assignments(tmp_path)
+
+        assert list(local_by_id) == [7]
+        assert local_by_id[7]["name"] == "Essay"
+        assert local_by_id[7]["file"] == str(tmp_path / "essay.md")
+
+    def test_scan_uses_status_cache(self, tmp_path):
+        """Test that unchanged files are answered from the sidecar cache on later scans."""
+        (tmp_path / "essay.md").write_text("---\ntitle: Essay\nassignment_id: 7\n---\nBody", encoding="utf-8")
+        first = _scan_local_assignments(tmp_path)
+
+        with patch("canvas_author.assignment_sync._read_assignment_metadata_cached") as mock_read:
+            second = _scan_local_assignments(tmp_path)
+
+        mock_read.assert_not_called()
+        assert second == first
+
+
+class TestPeekAssignmentId:
+    """Tests for reading assignment_id and title without a full parse."""
+
+    def test_plain_values(self):
+        """Test that plain id and title lines are read directly."""
+        frontmatter = "title: Lab 1.5, part A\nassignment_id: 12\npoints_possible: 10"
+
+        assert _peek_assignment_id(frontmatter) == {"assignment_id": 12, "title": "Lab 1.5, part A"}
+
+    def test_ambiguous_values_need_full_parse(self):
+        """Test that values YAML could read differently are left to the parser."""
+        assert _peek_assignment_id("title: Yes\nassignment_id: 12") is None
+        assert _peek_assignment_id("title: \"Quoted\"\nassignment_id: 12") is None
+        assert _peek_assignment_id("title: Essay\nassignment_id: 012") is None
+        assert _peek_assignment_id("title: Essay") is None
+
+
+class TestFindAssignmentsDir:
+    """Tests for locating the assignments folder."""
+
+    def test_prefers_subfolder(self, tmp_path):
+        """Test that an assignments subfolder is used when present."""
+        (tmp_path / "assignments").mkdir()
+
+        assert _find_assignments_dir(str(tmp_path)) == tmp_path / "assignments"
+
+    def test_falls_back_to_directory(self, tmp_path):
+        """Test that the directory itself is used without a subfolder, and None if it is missing."""
+        assert _find_assignments_dir(str(tmp_path)) == tmp_path
+        assert _find_assignments_dir(str(tmp_path / "missing")) is None
+
+
+class TestSetFrontmatterAssignmentId:
+    """Tests for writing a new assignment_id into existing frontmatter."""
+
+    def test_keeps_other_fields(self):
+        """Test that fields Canvas did not echo back are kept."""
+        content = "---\ntitle: Essay\ndue_at: \"2026-01-16 23:59:00\"\nsubmission_types:\n  - online_upload\n---\nBody\n"
+
+        updated = _set_frontmatter_assignment_id(content, "77")
+
+        assert updated == (
+            "---\ntitle: Essay\nassignment_id: 77\ndue_at: \"2026-01-16 23:59:00\"\n"
+            "submission_types:\n  - online_upload\n---\nBody\n"
+        )
+
+    def test_replaces_empty_id(self):
+        """Test that an empty assignment_id line is filled in, not duplicated."""
+        content = "---\ntitle: Essay\nassignment_id:\n---\nBody"
+
+        metadata, _ = parse_assignment_frontmatter(_set_frontmatter_assignment_id(content, 77))
+
+        assert metadata == {"title": "Essay", "assignment_id": 77}
+
+    def test_no_frontmatter(self):
+        """Test that files without frontmatter are left to the caller."""
+        assert _set_frontmatter_assignment_id("Just a body", 77) is None
+
+
+class TestPullAssignments:
+    """Tests for pull_assignments function."""
+
+    def test_fetches_missing_descriptions(self, tmp_path):
+        """Test that only assignments listed without a description are fetched again."""
+        listed = [
+            {"id": "1", "name": "Essay", "description": "<p>Write an essay.</p>"},
+            {"id": "2", "name": "Quiz"},
+        ]
+        fetched = {"id": "2", "name": "Quiz", "description": "<p>Take the quiz.</p>"}
+
+        with patch("canvas_author.assignment_sync.list_assignments", return_value=listed), \
+                patch("canvas_author.assignment_sync.get_assignment", return_value=fetched) as mock_get:
+            results = pull_assignments("100", str(tmp_path), client=object())
+
+        mock_get.assert_called_once()
+        assert mock_get.call_args[0][:2] == ("100", "2")
+        assert len(results["pulled"]) == 2
+        quiz_file = results["pulled"][1]["file"]
+        assert open(quiz_file, encoding="utf-8").read().endswith("Take the quiz.\n")
+
+
+class TestCallWithBackoff:
+    """Tests for retrying Canvas calls that hit the rate limit."""
+
+    def test_retries_after_rate_limit(self):
+        """Test that a throttled call is retried after waiting."""
+        func = MagicMock(side_effect=[RateLimitExceeded("Rate Limit Exceeded"), "ok"])
+
+        with patch("canvas_author.assignment_sync.time.sleep") as mock_sleep:
+            assert _call_with_backoff(func, 1, name="x") == "ok"
+
+        assert func.call_count == 2
+        func.assert_called_with(1, name="x")
+        mock_sleep.assert_called_once_with(1.0)
+
+    def test_gives_up_after_retries(self):
+        """Test that the rate limit error is raised once retries run out."""
+        func = MagicMock(side_effect=RateLimitExceeded("Rate Limit Exceeded"))
+
+        with patch("canvas_author.assignment_sync.time.sleep") as mock_sleep:
+            with pytest.raises(RateLimitExceeded):
+                _call_with_backoff(func)
+
+        assert [c.args[0] for c in mock_sleep.call_args_list] == [1.0, 2.0, 4.0]
+
+
+def _pushed_file(course_id, file_path, *args):
+    """Stand-in for _push_assignment_file that reports the file as updated."""
+    return "updated", {"id": 7}, _file_hash(file_path)
+
+
+class TestPushAssignments:
+    """Tests for push_assignments function."""
+
+    def test_skips_files_unchanged_since_last_push(self, tmp_path):
+        """Test that a second push skips unchanged files unless forced."""
+        essay = tmp_path / "essay.md"
+        essay.write_text("---\ntitle: Essay\nassignment_id: 7\n---\nBody", encoding="utf-8")
+        client = MagicMock(domain="canvas.example.edu")
+
+        with patch("canvas_author.assignment_sync._push_assignment_file",
+                   side_effect=_pushed_file) as mock_push:
+            push_assignments("100", str(tmp_path), client=client)
+            second = push_assignments("100", str(tmp_path), client=client)
+            assert mock_push.call_count == 1
+
+            essay.write_text("---\ntitle: Essay\nassignment_id: 7\n---\nNew body", encoding="utf-8")
+            push_assignments("100", str(tmp_path), client=client)
+            push_assignments("100", str(tmp_path), force=True, client=client)
+
+        assert second["skipped"][0]["reason"] == "unchanged since last push"
+        assert mock_push.call_count == 3
+
+    def test_other_course_is_pushed(self, tmp_path):
+        """Test that files pushed to one course are not skipped for another."""
+        (tmp_path / "essay.md").write_text("---\ntitle: Essay\nassignment_id: 7\n---\nBody", encoding="utf-8")
+        client = MagicMock(domain="canvas.example.edu")
+
+        with patch("canvas_author.assignment_sync._push_assignment_file",
+                   side_effect=_pushed_file) as mock_push:
+            push_assignments("100", str(tmp_path), client=client)
+            result = push_assignments("200", str(tmp_path), client=client)
+
+        assert mock_push.call_count == 2
+        assert result["skipped"] == []
+
+    def test_failed_overrides_are_retried(self, tmp_path):
+        """Test that a file whose overrides failed to sync is pushed again."""
+        (tmp_path / "essay.md").write_text(
+            "---\ntitle: Essay\nassignment_id: 7\nassignment_overrides:\n"
+            "  - id: 5\n    student_ids: [1, 2]\n---\nBody",
+            encoding="utf-8",
+        )
+        client = MagicMock(domain="canvas.example.edu")
+
+        with patch("canvas_author.assignment_sync._sync_assignment_overrides", return_value=False) as mock_sync:
+            push_assignments("100", str(tmp_path), client=client)
+            second = push_assignments("100", str(tmp_path), client=client)
+
+        assert mock_sync.call_count == 2
+        assert second["updated"][0]["id"] == 7
+
+    def test_edit_during_push_is_not_recorded(self, tmp_path):
+        """Test that the hash recorded is of the content pushed, not the file after the push."""
+        essay = tmp_path / "essay.md"
+        essay.write_text("---\ntitle: Essay\nassignment_id: 7\n---\nBody", encoding="utf-8")
+        client = MagicMock(domain="canvas.example.edu")
+        assignment = client.get_course.return_value.get_assignment.return_value
+
+        def edit_file(**kwargs):
+            essay.write_text("---\ntitle: Essay\nassignment_id: 7\n---\nEdited while pushing", encoding="utf-8")
+
+        assignment.edit.side_effect = edit_file
+        push_assignments("100", str(tmp_path), client=client)
+        assignment.edit.side_effect = None
+        second = push_assignments("100", str(tmp_path), client=client)
+
+        assert second["skipped"] == []
+        assert second["updated"][0]["id"] == 7
@@ -0,0 +1,292 @@
+"""
+Tests for the assignments module.
+"""
+
+import io
+import pytest
+from types import SimpleNamespace
+from unittest.mock import patch, MagicMock
+from requests import HTTPError, RequestException
+from canvasapi.exceptions import CanvasException, Unauthorized
+from urllib3.response import HTTPResponse
+from canvas_common import ResourceNotFoundError
+from canvas_author import http_utils
+from canvas_author.assignments import (
+    get_assignments_bulk,
+    get_submission,
+    iter_submission_statuses,
+    iter_submissions,
+    list_assignments,
+    list_courses,
+    update_grade,
+    update_grades_bulk,
+    _get_assignment,
+)
+
+
+class TestUpdateGradesBulk:
+    """Tests for update_grades_bulk function."""
+
+    def test_sends_one_request_and_waits(self):
+        """Test that all grades go in one request and the job is polled until done."""
+        client = MagicMock()
+        assignment = client.get_course.return_value.get_assignment.return_value
+        progress = assignment.submissions_bulk_update.return_value
+        progress.workflow_state = "queued"
+        progress.query.return_value = MagicMock(workflow_state="completed", id=55)
+
+        with patch("canvas_author.assignments.time.sleep") as mock_sleep:
+            result = update_grades_bulk(
+                "bulk-course", "1", {"10": "95", 11: "B+"}, comments={"10": "Nice work"}, client=client
+            )
+
+        assignment.submissions_bulk_update.assert_called_once_with(grade_data={
+            "10": {"posted_grade": "95", "text_comment": "Nice work"},
+            "11": {"posted_grade": "B+"},
+        })
+        mock_sleep.assert_called_once_with(0.5)
+        assert result == {"success": True, "workflow_state": "completed", "updated": 2, "progress_id": "55"}
+
+    def test_failed_job(self):
+        """Test that a failed job is reported without raising."""
+        client = MagicMock()
+        assignment = client.get_course.return_value.get_assignment.return_value
+        assignment.submissions_bulk_update.return_value = MagicMock(workflow_state="failed", id=56)
+
+        result = update_grades_bulk("bulk-course-2", "1", {"10": "95"}, client=client)
+
+        assert result["success"] is False
+        assert result["updated"] == 0
+
+
+class TestListAssignments:
+    """Tests for list_assignments function."""
+
+    def test_projects_assignment_fields(self):
+        """Test that set fields are copied, datetimes as strings, and unset fields left out."""
+        listed = {
+            "id": 7, "name": "Essay", "due_at": "2026-01-17T04:59:00Z", "lock_at": None,
+            "points_possible": 10, "secret": "not copied",
+        }
+
+        with patch("canvas_author.assignments.iter_canvas_pages", return_value=iter([listed])) as mock_pages:
+            result = list_assignments("project-course", include=["overrides"], client=MagicMock())
+
+        assert mock_pages.call_args[0][1:] == (
+            "courses/project-course/assignments", {"per_page": 100, "include[]": ["overrides"]}
+        )
+        assert mock_pages.call_args.kwargs == {"revalidate": True}
+
+        assert result == [{
+            "id": 7, "name": "Essay", "due_at": "2026-01-17T04:59:00Z",
+            "lock_at": None, "points_possible": 10,
+        }]
+
+    def test_positional_client(self):
+        """Test that a client passed positionally is used, not taken as include."""
+        client = MagicMock()
+
+        with patch("canvas_author.assignments.iter_canvas_pages", return_value=iter([])) as mock_pages, \
+                patch("canvas_author.assignments.get_canvas_client") as mock_get_client:
+            list_assignments("project-course", client)
+
+        mock_get_client.assert_not_called()
+        assert mock_pages.call_args[0][0] is client
+        assert mock_pages.call_args[0][2] == {"per_page": 100}
+
+
+class TestListCourses:
+    """Tests for list_courses function."""
+
+    def test_filters_to_active_courses(self):
+        """Test that only courses between their start and end dates are kept."""
+        courses = [
+            {"id": 1, "name": "Current", "start_at": "2020-01-01T00:00:00Z", "end_at": None},
+            {"id": 2, "name": "Ended", "start_at": None, "end_at": "2020-06-01T00:00:00Z"},
+            {"id": 3, "name": "Future", "start_at": "2999-01-01T00:00:00Z", "end_at": None},
+            {"id": 4, "name": "Undated"},
+        ]
+
+        with patch("canvas_author.assignments.iter_canvas_pages", return_value=iter(courses)):
+            result = list_courses(client=MagicMock())
+
+        assert [course["name"] for course in result] == ["Current", "Undated"]
+
+    def test_mixed_timestamp_formats(self):
+        """Test that offset timestamps are compared like Canvas's UTC form."""
+        courses = [
+            {"id": 1, "name": "Offset", "start_at": "2020-01-01T00:00:00-05:00", "end_at": "2999-01-01T00:00:00+02:00"},
+            {"id": 2, "name": "Ended offset", "end_at": "2020-01-01T00:00:00+00:00"},
+            {"id": 3, "name": "Unreadable", "start_at": "soon"},
+        ]
+
+        with patch("canvas_author.assignments.iter_canvas_pages", return_value=iter(courses)):
+            result = list_courses(client=MagicMock())
+
+        assert [course["name"] for course in result] == ["Offset", "Unreadable"]
+
+
+class TestIterSubmissions:
+    """Tests for iter_submissions function."""
+
+    def test_converts_raw_submissions_lazily(self):
+        """Test that raw submission JSON is converted as the pages are consumed."""
+        pages = iter([
+            {"id": 1, "user_id": 10, "workflow_state": "submitted", "user": {"id": 10, "name": "Ada"},
+             "attachments": [{"id": 5, "filename": "essay.pdf", "content-type": "application/pdf"}]},
+            {"id": 2, "user_id": 11, "workflow_state": "unsubmitted", "submitted_at": None},
+        ])
+
+        with patch("canvas_author.assignments.iter_canvas_pages", return_value=pages) as mock_pages:
+            submissions = iter_submissions("100", "200", include_user=False, include_rubric=False, client=MagicMock())
+            first = next(submissions)
+            rest = list(submissions)
+
+        assert first["user_id"] == "10"
+        assert "user" not in first
+        assert first["attachments"][0]["content_type"] == "application/pdf"
+        assert [(s["workflow_state"], s["submitted_at"]) for s in rest] == [("unsubmitted", None)]
+        assert mock_pages.call_args[0][1:] == (
+            "courses/100/assignments/200/submissions",
+            {"include[]": ["user", "rubric_assessment"], "per_page": 100},
+        )
+        assert mock_pages.call_args.kwargs == {"revalidate": True}
+
+    def test_missing_assignment(self):
+        """Test that a 404 from Canvas is reported as a missing assignment."""
+        error = HTTPError("404", response=SimpleNamespace(status_code=404))
+
+        with patch("canvas_author.assignments.iter_canvas_pages", side_effect=error):
+            with pytest.raises(ResourceNotFoundError):
+                list(iter_submissions("100", "200", client=MagicMock()))
+
+    def test_other_errors_raise_canvas_exceptions(self):
+        """Test that other failures raise the canvasapi exceptions canvasapi calls did."""
+        error = HTTPError("401", response=SimpleNamespace(status_code=401, headers={}, text="unauthorized"))
+
+        with patch("canvas_author.assignments.iter_canvas_pages", side_effect=error):
+            with pytest.raises(Unauthorized):
+                list(iter_submissions("100", "200", client=MagicMock()))
+
+        with patch("canvas_author.assignments.iter_canvas_pages", side_effect=RequestException("refused")):
+            with pytest.raises(CanvasException, match="refused"):
+                list_courses(client=MagicMock())
+
+
+class TestUpdateGrade:
+    """Tests for update_grade function."""
+
+    def test_puts_submission_directly(self):
+        """Test that the grade is sent in one PUT without looking up the assignment first."""
+        client = MagicMock()
+        response = MagicMock()
+        response.json.return_value = {"id": 9, "user_id": 42, "grade": "A", "score": 95, "workflow_state": "graded"}
+
+        with patch("canvas_author.assignments.canvas_request", return_value=response) as mock_request:
+            result = update_grade("100", "200", "42", "A", comment="Nice work", client=client)
+
+        mock_request.assert_called_once_with(
+            client, "PUT", "courses/100/assignments/200/submissions/42",
+            data={"submission[posted_grade]": "A", "comment[text_comment]": "Nice work"},
+        )
+        client.get_course.assert_not_called()
+        assert result == {"id": "9", "user_id": "42", "grade": "A", "score": 95,
+                          "workflow_state": "graded", "success": True}
+
+    def test_missing_submission(self):
+        """Test that a 404 is reported as a missing submission."""
+        error = HTTPError("404", response=SimpleNamespace(status_code=404))
+
+        with patch("canvas_author.assignments.canvas_request", side_effect=error):
+            with pytest.raises(ResourceNotFoundError):
+                update_grade("100", "200", "42", "A", client=MagicMock())
+
+    def test_connection_error(self):
+        """Test that a failed connection is reported as a CanvasException."""
+        with patch("canvas_author.assignments.canvas_request", side_effect=RequestException("refused")):
+            with pytest.raises(CanvasException, match="refused"):
+                update_grade("100", "200", "42", "A", client=MagicMock())
+
+    def test_server_error_is_not_resent(self):
+        """Test that a grade and comment PUT that fails with a 5xx is sent once."""
+        canvas = SimpleNamespace(domain="canvas.test", token="secret")
+
+        def server_error(*args, **kwargs):
+            return HTTPResponse(body=io.BytesIO(b"{}"), status=503, headers={}, preload_content=False)
+
+        with patch.object(http_utils, "_session", None), \
+                patch("urllib3.connectionpool.HTTPConnectionPool._make_request", side_effect=server_error) as mock_send:
+            with pytest.raises(CanvasException):
+                update_grade("100", "200", "42", "A", comment="Nice work", client=canvas)
+
+        assert mock_send.call_count == 1
+
+    def test_drops_cached_assignment(self):
+        """Test that the assignment is fetched again after a grade changes."""
+        client = MagicMock()
+        response = MagicMock()
+        response.json.return_value = {"id": 9, "user_id": 42}
+        _get_assignment(client, "grade-course", "200")
+
+        with patch("canvas_author.assignments.canvas_request", return_value=response):
+            update_grade("grade-course", "200", "42", "A", client=client)
+        _get_assignment(client, "grade-course", "200")
+
+        assert client.get_course.return_value.get_assignment.call_count == 2
+
+
+class TestGetSubmission:
+    """Tests for get_submission function."""
+
+    def test_leaves_out_unset_fields(self):
+        """Test that optional fields Canvas left empty are not returned as None."""
+        client = MagicMock()
+        assignment = SimpleNamespace(id=200, name="Essay", points_possible=10)
+        assignment.get_submission = MagicMock(return_value=SimpleNamespace(
+            id=9, user_id=42, workflow_state="submitted", submitted_at="2026-01-10T12:00:00Z",
+            grade=None, body="My essay", url=None,
+        ))
+
+        with patch("canvas_author.assignments._get_assignment", return_value=assignment):
+            result = get_submission("100", "200", "42", include_rubric=False, client=client)
+
+        assert result["submitted_at"] == "2026-01-10T12:00:00Z"
+        assert result["body"] == "My essay"
+        assert "grade" not in result and "url" not in result and "preview_url" not in result
+        assert result["late"] is False
+
+
+class TestIterSubmissionStatuses:
+    """Tests for iter_submission_statuses function."""
+
+    def test_builds_status_rows(self):
+        """Test that raw submissions become SubmissionStatus rows with nothing extra requested."""
+        pages = iter([
+            {"id": 1, "user_id": 10, "workflow_state": "submitted", "score": 8, "submitted_at": "2026-01-10T12:00:00Z"},
+            {"id": 2, "user_id": 11, "workflow_state": "unsubmitted", "submitted_at": None, "missing": True},
+        ])
+
+        with patch("canvas_author.assignments.iter_canvas_pages", return_value=pages) as mock_pages:
+            statuses = list(iter_submission_statuses("100", "200", client=MagicMock()))
+
+        assert mock_pages.call_args[0][2] == {"include[]": [], "per_page": 100}
+        assert [(s.user_id, s.is_graded, s.missing) for s in statuses] == [("10", True, False), ("11", False, True)]
+        assert statuses[1].submitted_at is None
+        assert not hasattr(statuses[0], "__dict__")
+
+
+class TestGetAssignmentsBulk:
+    """Tests for get_assignments_bulk function."""
+
+    def test_keeps_order_and_reports_missing(self):
+        """Test that assignments come back in request order with missing IDs listed."""
+        def fake_get(course_id, assignment_id, client=None):
+            if assignment_id == "2":
+                raise ResourceNotFoundError("assignment", assignment_id)
+            return {"id": assignment_id}
+
+        with patch("canvas_author.assignments.get_assignment", side_effect=fake_get) as mock_get:
+            result = get_assignments_bulk("100", ["3", "2", "1"], client=MagicMock())
+
+        assert result == {"assignments": [{"id": "3"}, {"id": "1"}], "not_found": ["2"]}
+        assert mock_get.call_count == 3
@@ -0,0 +1,80 @@
+"""
+Tests for the cache_utils module.
+"""
+
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+from unittest.mock import MagicMock, patch
+from canvas_author.cache_utils import TTLCache
+
+
+class TestTTLCache:
+    """Tests for TTLCache class."""
+
+    def test_entries_expire(self):
+        """Test that entries are returned until their time is up."""
+        cache = TTLCache(ttl=10)
+        with patch("canvas_author.cache_utils.time.monotonic", return_value=100.0):
+            cache.set(("course", "1"), "course-1")
+        with patch("canvas_author.cache_utils.time.monotonic", return_value=105.0):
+            assert cache.get(("course", "1")) == "course-1"
+        with patch("canvas_author.cache_utils.time.monotonic", return_value=111.0):
+            assert cache.get(("course", "1")) is None
+
+    def test_evicts_oldest_when_full(self):
+        """Test that the oldest entry makes room for a new one."""
+        cache = TTLCache(ttl=60, maxsize=2)
+        cache.set(("a",), 1)
+        cache.set(("b",), 2)
+        cache.set(("c",), 3)
+
+        assert cache.get(("a",)) is None
+        assert cache.get(("b",)) == 2
+        assert cache.get(("c",)) == 3
+
+    def test_invalidate_by_prefix(self):
+        """Test that invalidation drops only keys starting with the prefix."""
+        cache = TTLCache(ttl=60)
+        cache.set(("1", "10"), "a")
+        cache.set(("1", "11"), "b")
+        cache.set(("2", "10"), "c")
+
+        cache.invalidate("1")
+
+        assert cache.get(("1", "10")) is None
+        assert cache.get(("1", "11")) is None
+        assert cache.get(("2", "10")) == "c"
+
+    def test_get_or_load_shares_concurrent_misses(self):
+        """Test that threads missing the same key wait for a single load."""
+        cache = TTLCache(ttl=60)
+        started = threading.Event()
+        release = threading.Event()
+        calls = []
+
+        def loader():
+            calls.append(1)
+            started.set()
+            release.wait(5)
+            return "course-1"
+
+        with ThreadPoolExecutor(max_workers=4) as pool:
+            futures = [pool.submit(cache.get_or_load, ("course", "1"), loader) for _ in range(4)]
+            started.wait(5)
+            release.set()
+            results = [f.result() for f in futures]
+
+        assert results == ["course-1"] * 4
+        assert len(calls) == 1
+
+    def test_get_or_load_retries_after_error(self):
+        """Test that a failed load is not cached."""
+        cache = TTLCache(ttl=60)
+        loader = MagicMock(side_effect=[RuntimeError("boom"), "course-1"])
+
+        with pytest.raises(RuntimeError):
+            cache.get_or_load(("course", "1"), loader)
+
+        assert cache.get_or_load(("course", "1"), loader) == "course-1"
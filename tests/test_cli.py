@@ -0,0 +1,113 @@
+"""
+Tests for the cli module.
+"""
+
+import argparse
+import json
+from unittest.mock import patch, MagicMock
+from canvas_author.cli import cmd_pull, _pull_watermark, _updated_since
+
+
+def _init_course(tmp_path, **extra):
+    """Write a .canvas.json for course 100 with any extra settings."""
+    config = {"course_id": "100", "course_name": "Test Course", **extra}
+    (tmp_path / ".canvas.json").write_text(json.dumps(config), encoding="utf-8")
+
+
+def _run_pull(tmp_path, pages, pull_result=("pulled", None), **options):
+    """Run cmd_pull against a mocked page listing and return the pages pulled and exit code."""
+    args = argparse.Namespace(**{"dir": str(tmp_path), "force": False, "all": False, **options})
+    with patch("canvas_author.cli.get_canvas_client", return_value=MagicMock()), \
+            patch("canvas_author.cli.is_pandoc_available", return_value=True), \
+            patch("canvas_author.cli.list_pages", return_value=pages), \
+            patch("canvas_author.cli._pull_page", return_value=pull_result) as mock_pull:
+        code = cmd_pull(args)
+    return [call.args[0]["url"] for call in mock_pull.call_args_list], code
+
+
+class TestUpdatedSince:
+    """Tests for _updated_since function."""
+
+    def test_compares_timestamps(self):
+        """Test that only pages edited at or after the watermark count as updated."""
+        assert _updated_since("2026-01-10T12:00:01Z", "2026-01-10T12:00:00Z") is True
+        assert _updated_since("2026-01-10T12:00:00Z", "2026-01-10T12:00:00Z") is True
+        assert _updated_since("2026-01-10T11:59:59Z", "2026-01-10T12:00:00Z") is False
+        assert _updated_since("2026-01-10T07:00:00-05:00", "2026-01-10T12:00:01Z") is False
+
+    def test_unreadable_timestamps_count_as_updated(self):
+        """Test that missing or malformed timestamps never cause a skip."""
+        assert _updated_since(None, "2026-01-10T12:00:00Z") is True
+        assert _updated_since("yesterday", "2026-01-10T12:00:00Z") is True
+        assert _updated_since("2026-01-10T12:00:00", "2026-01-10T12:00:00Z") is True
+
+
+class TestPullWatermark:
+    """Tests for _pull_watermark function."""
+
+    def test_uses_latest_canvas_timestamp(self):
+        """Test that the watermark is the newest updated_at in the listing."""
+        pages = [
+            {"url": "a", "updated_at": "2026-01-10T12:00:00Z"},
+            {"url": "b", "updated_at": "2026-01-10T08:30:00-05:00"},
+            {"url": "c"},
+        ]
+
+        assert _pull_watermark(pages, "2026-01-01T00:00:00Z") == "2026-01-10T08:30:00-05:00"
+
+    def test_keeps_previous_without_timestamps(self):
+        """Test that the last watermark is kept when no page has a readable timestamp."""
+        assert _pull_watermark([{"url": "a", "updated_at": None}], "2026-01-01T00:00:00Z") == "2026-01-01T00:00:00Z"
+        assert _pull_watermark([], None) is None
+
+
+class TestCmdPull:
+    """Tests for cmd_pull function."""
+
+    def test_skips_pages_unchanged_since_last_pull(self, tmp_path):
+        """Test that pulled pages not edited since the watermark are not fetched."""
+        _init_course(tmp_path, last_pull_at="2026-01-10T12:00:00Z")
+        (tmp_path / "old.md").write_text("---\ntitle: Old\n---\n", encoding="utf-8")
+        pages = [
+            {"url": "old", "updated_at": "2026-01-09T12:00:00Z"},
+            {"url": "edited", "updated_at": "2026-01-11T12:00:00Z"},
+            {"url": "missing", "updated_at": "2026-01-09T12:00:00Z"},
+        ]
+
+        pulled, code = _run_pull(tmp_path, pages)
+
+        assert code == 0
+        assert pulled == ["edited", "missing"]
+
+    def test_force_pulls_every_page(self, tmp_path):
+        """Test that --force ignores the watermark."""
+        _init_course(tmp_path, last_pull_at="2026-01-10T12:00:00Z")
+        (tmp_path / "old.md").write_text("---\ntitle: Old\n---\n", encoding="utf-8")
+
+        pulled, _ = _run_pull(tmp_path, [{"url": "old", "updated_at": "2026-01-09T12:00:00Z"}], force=True)
+
+        assert pulled == ["old"]
+
+    def test_saves_canvas_watermark(self, tmp_path):
+        """Test that a clean pull stores the newest Canvas timestamp, not the local time."""
+        _init_course(tmp_path)
+        pages = [
+            {"url": "a", "updated_at": "2026-01-10T12:00:00Z"},
+            {"url": "b", "updated_at": "2026-01-11T09:15:00Z"},
+        ]
+
+        _run_pull(tmp_path, pages)
+
+        config = json.loads((tmp_path / ".canvas.json").read_text(encoding="utf-8"))
+        assert config["last_pull_at"] == "2026-01-11T09:15:00Z"
+
+    def test_errors_keep_watermark(self, tmp_path):
+        """Test that a pull with errors leaves the watermark alone so failed pages are retried."""
+        _init_course(tmp_path, last_pull_at="2026-01-10T12:00:00Z")
+
+        _, code = _run_pull(tmp_path, [{"url": "a", "updated_at": "2026-01-11T12:00:00Z"}],
+                            pull_result=("error", "  ✗ a.md: boom"))
+
+        config = json.loads((tmp_path / ".canvas.json").read_text(encoding="utf-8"))
+        assert code == 1
+        assert config["last_pull_at"] == "2026-01-10T12:00:00Z"
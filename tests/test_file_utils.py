@@ -0,0 +1,73 @@
+"""
+Tests for the file_utils module.
+"""
+
+import pytest
+from unittest.mock import patch
+
+from canvas_author.file_utils import write_bytes_atomic, write_chunks_atomic
+
+
+class TestWriteBytesAtomic:
+    """Tests for write_bytes_atomic function."""
+
+    def test_writes_new_file(self, tmp_path):
+        """Test that a new file gets the exact bytes and no temp file is left."""
+        path = tmp_path / "essay.md"
+
+        write_bytes_atomic(path, "Café\n".encode("utf-8"))
+
+        assert path.read_bytes() == "Café\n".encode("utf-8")
+        assert [p.name for p in tmp_path.iterdir()] == ["essay.md"]
+
+    def test_replaces_existing_file(self, tmp_path):
+        """Test that longer existing content is fully replaced."""
+        path = tmp_path / "essay.md"
+        path.write_text("old content that is longer", encoding="utf-8")
+
+        write_bytes_atomic(str(path), b"new")
+
+        assert path.read_bytes() == b"new"
+
+    def test_fsync(self, tmp_path):
+        """Test that fsync=True flushes the temp file before the rename."""
+        path = tmp_path / ".canvas.json"
+
+        with patch("canvas_author.file_utils.os.fsync") as mock_fsync:
+            write_bytes_atomic(path, b"{}\n", fsync=True)
+
+        mock_fsync.assert_called_once()
+        assert path.read_bytes() == b"{}\n"
+
+    def test_failed_write_leaves_no_temp_file(self, tmp_path):
+        """Test that the temp file is removed when writing fails, and the target is untouched."""
+        path = tmp_path / "essay.md"
+        path.write_bytes(b"old")
+
+        with patch("canvas_author.file_utils.os.write", side_effect=OSError(28, "No space left on device")):
+            with pytest.raises(OSError):
+                write_bytes_atomic(path, b"new")
+
+        assert path.read_bytes() == b"old"
+        assert [p.name for p in tmp_path.iterdir()] == ["essay.md"]
+
+    def test_new_file_permissions(self, tmp_path):
+        """Test that the file gets the usual umask-based permissions, not the temp file's 0600."""
+        path = tmp_path / "essay.md"
+        (tmp_path / "reference.md").write_bytes(b"")
+
+        write_bytes_atomic(path, b"new")
+
+        assert path.stat().st_mode == (tmp_path / "reference.md").stat().st_mode
+
+
+class TestWriteChunksAtomic:
+    """Tests for write_chunks_atomic function."""
+
+    def test_joins_chunks_in_order(self, tmp_path):
+        """Test that chunks are written one after another."""
+        path = tmp_path / "essay.md"
+
+        write_chunks_atomic(path, (b"---\ntitle: Essay\n---\n", b"", b"Body\n"))
+
+        assert path.read_bytes() == b"---\ntitle: Essay\n---\nBody\n"
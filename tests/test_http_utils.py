@@ -0,0 +1,117 @@
+"""
+Tests for the http_utils module.
+"""
+
+import pytest
+from types import SimpleNamespace
+from unittest.mock import patch, MagicMock
+from canvasapi.exceptions import (
+    BadRequest,
+    CanvasException,
+    Forbidden,
+    InvalidAccessToken,
+    RateLimitExceeded,
+    ResourceDoesNotExist,
+    Unauthorized,
+)
+from requests import ConnectTimeout, HTTPError
+from canvas_author.cache_utils import TTLCache
+from canvas_author.http_utils import MAX_CACHED_PAGE_BYTES, RETRY, canvas_error, iter_canvas_pages
+
+
+class TestIterCanvasPages:
+    """Tests for iter_canvas_pages function."""
+
+    def test_follows_next_links(self):
+        """Test that later pages are read from the Link header without repeating params."""
+        first = MagicMock(links={"next": {"url": "https://canvas.test/api/v1/items?page=2"}})
+        first.json.return_value = [{"id": 1}, {"id": 2}]
+        second = MagicMock(links={})
+        second.json.return_value = [{"id": 3}]
+        session = MagicMock()
+        session.request.side_effect = [first, second]
+        canvas = SimpleNamespace(domain="canvas.test", token="secret")
+
+        with patch("canvas_author.http_utils.get_http_session", return_value=session):
+            items = list(iter_canvas_pages(canvas, "items", {"per_page": 100}))
+
+        assert items == [{"id": 1}, {"id": 2}, {"id": 3}]
+        urls_and_params = [(c.args[:2], c.kwargs["params"]) for c in session.request.call_args_list]
+        assert urls_and_params == [
+            (("GET", "https://canvas.test/api/v1/items"), {"per_page": 100}),
+            (("GET", "https://canvas.test/api/v1/items?page=2"), None),
+        ]
+        assert session.request.call_args.kwargs["headers"] == {"Authorization": "Bearer secret"}
+
+    def test_revalidates_with_etag(self):
+        """Test that a repeated listing sends If-None-Match and reuses the page on 304."""
+        fresh = MagicMock(status_code=200, links={}, headers={"ETag": '"v1"'}, content=b'[{"id": 1}]')
+        fresh.json.return_value = [{"id": 1}]
+        not_modified = MagicMock(status_code=304, links={}, headers={})
+        session = MagicMock()
+        session.request.side_effect = [fresh, not_modified]
+        canvas = SimpleNamespace(domain="canvas.test", token="secret")
+
+        with patch("canvas_author.http_utils.get_http_session", return_value=session), \
+                patch("canvas_author.http_utils._etag_cache", TTLCache(60)):
+            first = list(iter_canvas_pages(canvas, "courses", {"include[]": ["favorites"]}, revalidate=True))
+            second = list(iter_canvas_pages(canvas, "courses", {"include[]": ["favorites"]}, revalidate=True))
+
+        assert first == second == [{"id": 1}]
+        assert "If-None-Match" not in session.request.call_args_list[0].kwargs["headers"]
+        assert session.request.call_args_list[1].kwargs["headers"]["If-None-Match"] == '"v1"'
+
+    def test_large_pages_are_not_kept(self):
+        """Test that pages over the size limit are fetched in full every time."""
+        body = b"x" * (MAX_CACHED_PAGE_BYTES + 1)
+        response = MagicMock(status_code=200, links={}, headers={"ETag": '"v1"'}, content=body)
+        response.json.return_value = [{"id": 1}]
+        session = MagicMock()
+        session.request.return_value = response
+        canvas = SimpleNamespace(domain="canvas.test", token="secret")
+
+        with patch("canvas_author.http_utils.get_http_session", return_value=session), \
+                patch("canvas_author.http_utils._etag_cache", TTLCache(60)):
+            list(iter_canvas_pages(canvas, "courses", revalidate=True))
+            list(iter_canvas_pages(canvas, "courses", revalidate=True))
+
+        assert "If-None-Match" not in session.request.call_args_list[1].kwargs["headers"]
+
+
+class TestRetry:
+    """Tests for the shared session's retry policy."""
+
+    def test_retries_only_reads(self):
+        """Test that failed reads are retried but writes are never resent."""
+        assert RETRY.is_retry("GET", 503) is True
+        assert RETRY.is_retry("HEAD", 429) is True
+        for method in ("PUT", "POST", "DELETE"):
+            assert RETRY.is_retry(method, 503) is False
+            assert method not in RETRY.allowed_methods
+
+
+class TestCanvasError:
+    """Tests for canvas_error function."""
+
+    @pytest.mark.parametrize("status, headers, text, expected", [
+        (400, {}, "bad", BadRequest),
+        (401, {"WWW-Authenticate": "Bearer"}, "expired", InvalidAccessToken),
+        (401, {}, "unauthorized", Unauthorized),
+        (403, {}, "forbidden", Forbidden),
+        (403, {}, "403 Forbidden (Rate Limit Exceeded)", RateLimitExceeded),
+        (404, {}, "", ResourceDoesNotExist),
+        (429, {}, "", RateLimitExceeded),
+        (500, {}, "", CanvasException),
+    ])
+    def test_maps_status_codes(self, status, headers, text, expected):
+        """Test that HTTP errors map to the exception canvasapi raises for the status."""
+        response = SimpleNamespace(status_code=status, headers=headers, text=text)
+
+        assert type(canvas_error(HTTPError(str(status), response=response))) is expected
+
+    def test_connection_failure(self):
+        """Test that failures without a response become a plain CanvasException."""
+        error = canvas_error(ConnectTimeout("timed out"))
+
+        assert type(error) is CanvasException
+        assert "timed out" in str(error)
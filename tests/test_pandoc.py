@@ -6,12 +6,26 @@ import pytest
 import subprocess
 from unittest.mock import patch, MagicMock
 from canvas_author.pandoc import (
+    MAX_CACHED_INPUT,
     is_pandoc_available,
     markdown_to_html,
     html_to_markdown,
+    trivial_html_to_markdown,
+    trivial_markdown_to_html,
+    _run_pandoc_cached,
 )
 
 
+@pytest.fixture(autouse=True)
+def clear_conversion_cache():
+    """Keep conversions and pandoc lookups cached by one test out of the next."""
+    _run_pandoc_cached.cache_clear()
+    is_pandoc_available.cache_clear()
+    yield
+    _run_pandoc_cached.cache_clear()
+    is_pandoc_available.cache_clear()
+
+
 class TestIsPandocAvailable:
     """Tests for is_pandoc_available function."""
 
@@ -25,6 +39,14 @@ class TestIsPandocAvailable:
         with patch("shutil.which", return_value=None):
             assert is_pandoc_available() is False
 
+    def test_result_is_cached(self):
+        """Test that the PATH lookup runs once per process."""
+        with patch("shutil.which", return_value="/usr/bin/pandoc") as mock_which:
+            assert is_pandoc_available() is True
+            assert is_pandoc_available() is True
+
+        mock_which.assert_called_once_with("pandoc")
+
 
 class TestMarkdownToHtml:
     """Tests for markdown_to_html function."""
@@ -99,6 +121,80 @@ class TestHtmlToMarkdown:
                 with pytest.raises(RuntimeError):
                     html_to_markdown("<p>Content</p>")
 
+    def test_caches_repeated_conversions(self):
+        """Test that converting the same HTML again does not rerun pandoc."""
+        with patch("shutil.which", return_value="/usr/bin/pandoc"):
+            with patch("subprocess.run") as mock_run:
+                mock_run.return_value = MagicMock(returncode=0, stdout="Hello\n")
+
+                assert html_to_markdown("<p>Hello</p>") == "Hello\n"
+                assert html_to_markdown("<p>Hello</p>") == "Hello\n"
+                html_to_markdown("<p>Hello</p>", wrap=40)
+
+                assert mock_run.call_count == 2
+
+    def test_large_inputs_are_not_cached(self):
+        """Test that inputs over the size limit are converted every time."""
+        html = "<p>" + "x" * MAX_CACHED_INPUT + "</p>"
+        with patch("shutil.which", return_value="/usr/bin/pandoc"):
+            with patch("subprocess.run") as mock_run:
+                mock_run.return_value = MagicMock(returncode=0, stdout="x\n")
+
+                html_to_markdown(html)
+                html_to_markdown(html)
+
+                assert mock_run.call_count == 2
+                assert _run_pandoc_cached.cache_info().currsize == 0
+
+
+class TestTrivialHtmlToMarkdown:
+    """Tests for trivial_html_to_markdown function."""
+
+    def test_plain_paragraphs(self):
+        """Test that plain paragraphs convert without pandoc."""
+        with patch("subprocess.run") as mock_run:
+            result = trivial_html_to_markdown("<p>Quiz moved to Friday.</p>\n<p>See you   then!</p>")
+
+            assert result == "Quiz moved to Friday.\n\nSee you then!\n"
+            mock_run.assert_not_called()
+
+    def test_formatted_html_needs_pandoc(self):
+        """Test that formatted HTML is left for pandoc."""
+        assert trivial_html_to_markdown("<p>Hello <strong>world</strong></p>") is None
+        assert trivial_html_to_markdown("<h1>Title</h1>") is None
+        assert trivial_html_to_markdown("<p>Fish &amp; chips</p>") is None
+
+    def test_markdown_significant_text_needs_pandoc(self):
+        """Test that text pandoc would escape is left for pandoc."""
+        assert trivial_html_to_markdown("<p>Use *stars*</p>") is None
+        assert trivial_html_to_markdown("<p>1. Not a list</p>") is None
+        assert trivial_html_to_markdown("<p>- Not a list</p>") is None
+
+
+class TestTrivialMarkdownToHtml:
+    """Tests for trivial_markdown_to_html function."""
+
+    def test_plain_paragraphs(self):
+        """Test that plain paragraphs convert without pandoc."""
+        with patch("subprocess.run") as mock_run:
+            result = trivial_markdown_to_html("Submit a one-page reflection.\n\nDue Friday!\n")
+
+            assert result == "<p>Submit a one-page reflection.</p>\n<p>Due Friday!</p>\n"
+            mock_run.assert_not_called()
+
+    def test_markdown_needs_pandoc(self):
+        """Test that markdown syntax is left for pandoc."""
+        assert trivial_markdown_to_html("Hello **world**") is None
+        assert trivial_markdown_to_html("1. First step") is None
+        assert trivial_markdown_to_html("Title\n=====") is None
+        assert trivial_markdown_to_html("    indented code") is None
+
+    def test_smart_typography_needs_pandoc(self):
+        """Test that text pandoc's smart extension rewrites is left for pandoc."""
+        assert trivial_markdown_to_html("Don't forget") is None
+        assert trivial_markdown_to_html("Wait -- really") is None
+        assert trivial_markdown_to_html("Ask Dr. Smith") is None
+
 
 class TestPandocIntegration:
     """Integration tests that require actual pandoc installation."""
@@ -138,3 +234,15 @@ class TestPandocIntegration:
         assert "Title" in back
         assert "bold" in back
         assert "italic" in back
+
+    def test_trivial_conversion_matches_pandoc(self):
+        """Test that the plain-paragraph fast path matches pandoc's output."""
+        html = "<p>Quiz moved to Friday.</p>\n<p>See you then, everyone!</p>"
+
+        assert trivial_html_to_markdown(html) == html_to_markdown(html)
+
+    def test_trivial_markdown_matches_pandoc(self):
+        """Test that the plain-paragraph markdown fast path matches pandoc's output."""
+        markdown = "Submit a one-page reflection.\n\nDue Friday, in class!"
+
+        assert trivial_markdown_to_html(markdown) == markdown_to_html(markdown)
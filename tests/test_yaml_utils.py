@@ -0,0 +1,68 @@
+"""
+Tests for the yaml_utils module.
+"""
+
+import pytest
+from canvas_author.yaml_utils import load_frontmatter_yaml
+
+
+def _parse(value):
+    """Coerce values like the assignment line parser does."""
+    if value in ("true", "false"):
+        return value == "true"
+    try:
+        return float(value) if "." in value else int(value)
+    except ValueError:
+        return value
+
+
+class TestLoadFrontmatterYaml:
+    """Tests for load_frontmatter_yaml function."""
+
+    def test_loads_mapping(self):
+        """Test loading scalars, lists and nested overrides."""
+        frontmatter = (
+            "title: Essay 1\npoints_possible: 10.5\npublished: false\n"
+            "submission_types:\n  - online_upload\n"
+            "assignment_overrides:\n  - id: 5\n    student_ids: [1, 2]\n"
+        )
+
+        metadata = load_frontmatter_yaml(frontmatter, _parse)
+
+        assert metadata["title"] == "Essay 1"
+        assert metadata["points_possible"] == 10.5
+        assert metadata["published"] is False
+        assert metadata["submission_types"] == ["online_upload"]
+        assert metadata["assignment_overrides"] == [{"id": 5, "student_ids": [1, 2]}]
+
+    def test_values_kept_as_written(self):
+        """Test that YAML 1.1 implicit types are not applied to unquoted values."""
+        frontmatter = "a: Yes\nb: ~\nc: 0x10\nd: 1_000\ne: 2026-01-16T10:00:00Z\nf: true\ng: 12"
+
+        metadata = load_frontmatter_yaml(frontmatter)
+
+        assert metadata == {
+            "a": "Yes", "b": "~", "c": "0x10", "d": "1_000",
+            "e": "2026-01-16T10:00:00Z", "f": "true", "g": "12",
+        }
+
+    def test_quoted_values_skip_parse_scalar(self):
+        """Test that only unquoted values go through parse_scalar."""
+        metadata = load_frontmatter_yaml("a: 5\nb: \"5\"", _parse)
+
+        assert metadata == {"a": 5, "b": "5"}
+
+    def test_datetimes_stay_strings(self):
+        """Test that unquoted datetimes are returned as strings."""
+        metadata = load_frontmatter_yaml("due_at: 2026-01-16 23:59:00")
+
+        assert metadata["due_at"] == "2026-01-16 23:59:00"
+
+    @pytest.mark.parametrize("frontmatter", [
+        "title: Week 2: The Landscape",
+        "title: Homework #3",
+        "just a line",
+    ])
+    def test_returns_none_for_line_parser(self, frontmatter):
+        """Test that blocks YAML would reject or misread are left to the line parser."""
+        assert load_frontmatter_yaml(frontmatter) is None